@@ -0,0 +1,36 @@
+"""
+Compare parsing of a synthetic page at once and lazily.
+
+Run from the root of the repo: python -m benchmarks.lazy_parsing
+"""
+
+import time
+
+from tests.test_lazy_parsing import corpus, normal_page
+
+
+def best_time(func, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    page = normal_page(docs=200, per_doc=10)
+    eager, lazy = corpus(False), corpus(True)
+
+    eager_time = best_time(lambda: eager._parse_page_normal(page))
+    lazy_time = best_time(lambda: lazy._parse_page_normal(page))
+    examples = lazy._parse_page_normal(page)
+    access_time = best_time(lambda: [ex.txt for ex in examples], repeat=1)
+
+    print(f"{len(examples)} examples")
+    print(f"eager: {eager_time:.3f}s")
+    print(f"lazy: {lazy_time:.3f}s, access to all texts: {access_time:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
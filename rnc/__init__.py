@@ -20,7 +20,9 @@ from .corpora import (
 
     SORT_KEYS,
     OUTPUT_FORMATS,
-    SEARCH_FORMATS
+    SEARCH_FORMATS,
+    EXAMPLE_FIELDS,
+    TRANSPORTS
 )
 from .corpora_params import Mycorp
 from .examples import (
@@ -129,5 +131,7 @@ __all__ = (
 
     'SORT_KEYS',
     'SEARCH_FORMATS',
-    'OUTPUT_FORMATS'
+    'OUTPUT_FORMATS',
+    'EXAMPLE_FIELDS',
+    'TRANSPORTS'
 )
@@ -12,10 +12,16 @@ __all__ = (
 
     'SORT_KEYS',
     'SEARCH_FORMATS',
-    'OUTPUT_FORMATS'
+    'OUTPUT_FORMATS',
+    'EXAMPLE_FIELDS',
+    'TRANSPORTS'
 )
 
 import csv
+import functools
+import math
+import hashlib
+import itertools
 import logging
 import os
 import random
@@ -24,14 +30,20 @@ import string
 import time
 import urllib.parse
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Callable, List, Any, Tuple, Pattern
+from typing import (
+    Dict, Callable, List, Any, Tuple, Pattern, Iterable, Iterator
+)
 
 import bs4
+import lxml.etree
+import lxml.html
 import ujson
 
+import rnc.corpora_index as cindex
 import rnc.corpora_requests as creq
+import rnc.corpora_storage as cstore
 import rnc.examples as expl
 
 logger = logging.getLogger("rnc")
@@ -39,6 +51,7 @@ logger = logging.getLogger("rnc")
 
 # Russian National Corpus URL
 RNC_URL = "https://processing.ruscorpora.ru/search.xml"
+RNC_JSON_URL = "https://processing.ruscorpora.ru/search.json"
 BASE_RNC_URL = "https://processing.ruscorpora.ru"
 
 ALPHABET = f"{string.ascii_letters}{string.digits}"
@@ -54,6 +67,71 @@ SEARCH_FORMATS = (
 OUTPUT_FORMATS = (
     'normal', 'kwic'
 )
+# ways to get examples from RNC
+TRANSPORTS = (
+    'html', 'json'
+)
+# formats of local databases by the file suffix,
+# csv is used if the suffix is unknown
+FILE_FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.db': 'sqlite',
+    '.sqlite': 'sqlite',
+    '.sqlite3': 'sqlite',
+}
+# formats of the files which might be compressed
+COMPRESSIBLE_FORMATS = (
+    'csv', 'jsonl'
+)
+# fields of examples, which might be requested
+EXAMPLE_FIELDS = (
+    'txt', 'src', 'ambiguation', 'found_wordforms', 'doc_url'
+)
+# should be increased when parsing is changed,
+# to make parsed pages from the cache outdated
+PARSER_VERSION = 1
+
+
+def example_from_row(ex_type: Any,
+                     lang_tags: Tuple[str, ...] or None,
+                     row: List[str]) -> Any:
+    """ Create Example obj from the csv row.
+
+    :param ex_type: type of the example.
+    :param lang_tags: tuple of str, language tags of parallel example,
+     its texts are the first columns. None for other examples.
+    :param row: list of str, values of the columns.
+    :return: Example obj.
+    """
+    if lang_tags is None:
+        return ex_type(*row)
+
+    end_lang_tags = len(lang_tags)
+    return ex_type.from_columns(
+        lang_tags, row[:end_lang_tags], *row[end_lang_tags:])
+
+
+def example_from_sparse_row(ex_type: Any,
+                            lang_tags: Tuple[str, ...],
+                            row: List[str]) -> Any:
+    """ Create parallel Example obj from the csv row, the example
+    has texts only in some of the languages, other cells are empty.
+
+    :param ex_type: type of the example.
+    :param lang_tags: tuple of str, language tags of all examples,
+     the texts are the first columns.
+    :param row: list of str, values of the columns.
+    :return: Example obj.
+    """
+    end_lang_tags = len(lang_tags)
+    langs, texts = [], []
+    for lang, txt in zip(lang_tags, row[:end_lang_tags]):
+        if txt:
+            langs.append(lang)
+            texts.append(txt)
+
+    return ex_type.from_columns(langs, texts, *row[end_lang_tags:])
 
 
 def create_filename(length: int = 8) -> str:
@@ -103,6 +181,40 @@ def str_to_int(value: str) -> int:
     return int(value.replace(' ', ''))
 
 
+def search_text(txt: Any) -> Any:
+    """ Get the text to search in: texts of ParallelExample
+    are joined with new lines, the others are not changed.
+    """
+    if isinstance(txt, dict):
+        return '\n'.join(map(str, txt.values()))
+    return txt
+
+
+# the pattern compiled in the process of the pool
+_worker_pattern = None
+
+
+def _compile_worker_pattern(pattern: Pattern or str,
+                            args: Tuple) -> None:
+    """ Compile the pattern once in the process of the pool. """
+    global _worker_pattern
+    _worker_pattern = re.compile(pattern, *args)
+
+
+def _findall_in_worker(texts: List[Any]) -> List[Tuple[int, List]]:
+    """ Apply the compiled pattern to the texts with findall.
+
+    :return: list of tuples, offsets of the texts
+     where the pattern was found and matches.
+    """
+    found = []
+    for offset, txt in enumerate(texts):
+        match = _worker_pattern.findall(txt)
+        if match:
+            found.append((offset, match))
+    return found
+
+
 class Corpus(ABC):
     """ Base class for Corpora """
     # default params
@@ -129,6 +241,15 @@ class Corpus(ABC):
     _DATA_W_QUOTCHAR = '"'
 
     DATA_FOLDER = Path('data')
+    # here parsed pages are cached
+    CACHE_FOLDER = DATA_FOLDER / 'cache'
+    # here examples are spilled if there are more than memory limit
+    SPILL_FOLDER = DATA_FOLDER / 'spill'
+    # URL of the structured search, used with 'json' transport
+    JSON_URL = RNC_JSON_URL
+
+    # whether the examples might be parsed lazily
+    _LAZY_SUPPORTED = False
 
     def __init__(self,
                  query: dict or str = None,
@@ -142,8 +263,13 @@ class Corpus(ABC):
          {word1: {properties}, word2: {properties}...}.
          If you chose 'lexform' as a 'text' param, you must give here a string.
         :param p_count: int, count of pages to request.
-        :param file: str or Path, filename of a local database.
-         Optional, random filename by default.
+        :param file: str or Path, filename of a local database, its
+         format is chosen by the suffix: '.csv' – csv file with json
+         config, '.jsonl' – JSON Lines file with records of the examples
+         and json config, '.db', '.sqlite' or '.sqlite3' – SQLite database.
+         Csv and JSON Lines files might be compressed: '.csv.gz',
+         '.jsonl.xz', '.csv.zst' etc.
+         Optional, random csv filename by default.
         :keyword dpp: str or int, documents per page.
          Optional, 5 by default.
         :keyword spd: str or int, sentences per document.
@@ -164,20 +290,67 @@ class Corpus(ABC):
          1 – with, 0 – without. Optional, 0 by default.
         :keyword marker: function, with which found words will be marked.
          Optional.
+        :keyword transport: str, way to get examples: 'html' – parse
+         HTML pages, 'json' – convert structured JSON search results.
+         Optional, 'html' by default.
+        :keyword columnar: bool, whether the examples are stored in
+         columns (see ExampleTable) instead of the list of Example objects.
+         Optional, False by default.
+        :keyword memory_limit: int, count of examples kept in memory,
+         the older ones are spilled to SPILL_FOLDER (see SpilledList).
+         Optional, all examples are in memory by default.
+        :keyword where: dict of str, load only the examples from SQLite
+         database matching the filters: {'src': source, 'doc_url': URL,
+         'wordform': found wordform}. The other examples are kept in the
+         database, so the filtered examples might be only appended to it
+         by dump. Optional.
+        :keyword lazy: bool, whether the examples of uncompressed csv file
+         are read on access from the memory-mapped file by the offsets
+         index written with dump, the examples of SQLite database are
+         read on access by their ids. The examples are loaded when
+         the data are changed. Optional, False by default.
+        :keyword shared: str, name of the shared memory block published
+         with share() in another process, the params and examples are
+         read from there, the file is not used. The examples are
+         loaded when the data are changed. Optional.
 
         :exception FileExistsError: if csv file is given but json file
          with config doesn't exist.
         :exception ValueError: if the query is empty; page count is a negative 
-         number; text, out or sort key is wrong.
+         number; text, out, sort key or transport is wrong; the filters
+         are given not with SQLite database or they are wrong.
         :exception NotImplementedError: if the corpus type in file isn't equal 
          to corpus class type.
         """
-        # list of examples
+        # whether the examples are stored in columns
+        self._columnar = kwargs.pop('columnar', False)
+        # None or count of examples kept in memory
+        self._memory_limit = kwargs.pop('memory_limit', None)
+        if self._memory_limit is not None and self._columnar:
+            logger.warning("Examples are spilled to disk with memory "
+                           "limit, they will not be stored in columns")
+            self._columnar = False
+        # examples, their storage is created by _new_data
+        # when the type of examples is known
         self._data = []
+        # None or count of the first examples which are in the
+        # file in the same order, only the others are appended
+        self._dumped = None
+        # whether the data are shared with copies or slices,
+        # they are copied before changing then
+        self._data_shared = False
+        # None or index of examples' fingerprints,
+        # it is built on the first membership test
+        self._fingerprints = None
         # http tags to request
         self._params = {}
-        # found wordforms with their frequency
-        self._found_wordforms = defaultdict(int)
+        # None or index of found wordforms with their frequency,
+        # it is built on the first access to them
+        self._wordforms = None
+        # None or index of tokens of the texts to narrow the search,
+        # it is built again if the data were replaced or reordered
+        self._search_index = None
+        self._searchable = False
         # query, wordforms to find
         self._query = {}
         # count of PAGES
@@ -185,6 +358,22 @@ class Corpus(ABC):
         # type of example should be defined before params init
         self._ex_type = kwargs.pop('ex_type', None)
         self._marker = kwargs.pop('marker', None)
+        # parsing depends on the transport too
+        self._transport = kwargs.pop('transport', None) or 'html'
+        if self._transport not in TRANSPORTS:
+            msg = f"'{self._transport}' is wrong transport, " \
+                  f"expected: {TRANSPORTS}"
+            logger.error(msg)
+            raise ValueError(msg)
+        # fields of examples to extract while parsing
+        self._fields = EXAMPLE_FIELDS
+        # whether the examples are parsed only when accessed
+        self._lazy = False
+        # whether parsed pages are cached
+        self._cache = False
+        # strings repeated in examples (sources, URLs etc.),
+        # they are stored once: {string: the same string}
+        self._interned = {}
         # additional info from the first page:
         # amount of docs, contexts, where the query was found,
         # link to the graphic with distribution by years
@@ -195,15 +384,45 @@ class Corpus(ABC):
         path = file or create_unique_filename(
             self.DATA_FOLDER, class_name, p_count)
         path = Path(path)
+        # None or compression of the data file, 'name.csv.gz'
+        self._compression = None
+        for compression, suffix in cstore.COMPRESSIONS.items():
+            if path.suffix == suffix:
+                self._compression = compression
+                path = path.with_suffix('')
         # change or add right extension
-        path = path.with_suffix('.csv')
+        if path.suffix not in FILE_FORMATS:
+            path = path.with_suffix('.csv')
+        self._file_format = FILE_FORMATS[path.suffix]
+        if (self._compression and
+                self._file_format not in COMPRESSIBLE_FORMATS):
+            msg = f"{self._file_format} file might not be compressed"
+            logger.error(msg)
+            raise ValueError(msg)
 
-        # to these files the data and req params will be dumped
-        self._csv_path = path
+        # to these files the data and req params will be dumped,
+        # SQLite database contains the params itself
+        self._data_path = self._compressed_path(path, self._compression)
         self._config_path = path.with_suffix('.json')
 
+        # filters of the examples loaded from SQLite database
+        self._where = kwargs.pop('where', None) or {}
+        # whether the examples are read from the file on access
+        self._lazy_file = kwargs.pop('lazy', False)
+        # None or SharedMemory obj the data are published to
+        self._shared_memory = None
+        shared = kwargs.pop('shared', None)
+        if self._where and self._file_format != 'sqlite':
+            msg = "Examples might be filtered while loading " \
+                  f"only from SQLite database, not {self._file_format}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        # attach to the data published by another process
+        if shared is not None:
+            self._from_shared(shared)
         # init from file if it exists
-        if self._csv_path.exists():
+        elif self._data_path.exists():
             try:
                 self._from_file()
             except FileExistsError as e:
@@ -281,6 +500,7 @@ class Corpus(ABC):
         # parsing depends on 'out' value
         self._page_parser = None
         self._page_parser_and_ex_type()
+        self._data = self._new_data([])
 
     def _from_file(self) -> None:
         """ Load data and params from the local databases.
@@ -289,10 +509,48 @@ class Corpus(ABC):
         :exception FileExistsError: if csv file with data or
          json file with config do not exist.
         """
-        if not (self._csv_path.exists() and self._config_path.exists()):
+        if (self._file_format != 'sqlite' and
+                not (self._data_path.exists() and
+                     self._config_path.exists())):
             raise FileExistsError("Data and config file must exist together")
 
-        params = self._load_params()
+        self._set_config(self._load_params())
+
+        data = self._map_data() if self._lazy_file else None
+        if data is not None:
+            self._set_data(data)
+            # the file is read only, the data are loaded before changing
+            self._data_shared = True
+        else:
+            data = self._intern_examples(self._load_data())
+            self._set_data(self._new_data(data))
+        # filtered examples are not the whole database,
+        # the new ones are appended to it
+        self._dumped = len(self._data)
+
+    def _from_shared(self,
+                     name: str) -> None:
+        """ Attach to the params and examples published
+        to shared memory by another process, see share().
+
+        :exception FileNotFoundError: if there is no block with the name.
+        """
+        data = cstore.SharedExamples(name)
+        self._set_config(data.config)
+        data.ex_type = self.ex_type
+
+        self._set_data(data)
+        # the block is read only, the data are loaded before changing
+        self._data_shared = True
+
+    def _set_config(self,
+                    params: Dict[str, Any]) -> None:
+        """ Set the dumped or published request params
+        and additional info.
+
+        :exception NotImplementedError: if the corpus type in
+         the params isn't equal to corpus class type.
+        """
         self._query = params.get('query', None)
         self._p_count = params.get('p_count', None)
         self._params = params.get('params', None)
@@ -307,32 +565,176 @@ class Corpus(ABC):
         # these params must be defined here too
         self._page_parser_and_ex_type()
 
-        self._data = self._load_data()
-        # add info about
-        try:
-            self._get_additional_info()
-        except Exception as e:
-            logger.warning("It is impossible to get "
-                           f"additional info from RNC:\n{e}")
+        # additional info is not requested, see refresh_info()
+        if 'add_info' in params:
+            self._add_info = params['add_info']
+        else:
+            logger.info("There is no additional info in the config, "
+                        "call refresh_info() to request it")
+
+    def _sqlite_store(self) -> cstore.SqliteStore:
+        """ Get SQLite database of the file. """
+        return cstore.SqliteStore(self.file)
 
-    def _load_data(self) -> List:
-        """ Load data from csv file. """
-        with self.file.open('r', encoding='utf-8') as f:
-            dm = self._DATA_W_DELIMITER
-            qch = self._DATA_W_QUOTCHAR
-            reader = csv.reader(f, delimiter=dm, quotechar=qch)
-            # first row contains headers, skip it
-            next(reader)
+    @staticmethod
+    def _sqlite_filters(where: Dict[str, str]) -> Dict[str, str]:
+        """ Normalize the wordform the examples are filtered by,
+        found wordforms are normalized in the database.
+        """
+        where = where.copy()
+        if 'wordform' in where:
+            where['wordform'] = Corpus._normalize_wordform(where['wordform'])
+        return where
+
+    def _load_sqlite_data(self) -> Iterator[Any]:
+        """ Load the examples matching the filters from SQLite database,
+        they are created while reading.
+        """
+        where = Corpus._sqlite_filters(self._where)
+        return (
+            self.ex_type(*record)
+            for record in self._sqlite_store().records(**where)
+        )
+
+    def count_in_file(self,
+                      **where) -> int:
+        """ Count the examples in SQLite database of the Corpus
+        matching the filters without loading them.
+
+        :keyword src: str, source of the examples.
+        :keyword doc_url: str, URL of the examples.
+        :keyword wordform: str, found wordform.
+        :return: int, count of the examples, the filters the
+         Corpus was loaded with are used if no filters given.
+        :exception RuntimeError: if the file is not SQLite database
+         or it does not exist.
+        :exception ValueError: if the filter is wrong.
+        """
+        if self._file_format != 'sqlite' or not self.file.exists():
+            msg = f"There is no SQLite database to count the " \
+                  f"examples in: '{self.file}'"
+            logger.error(msg)
+            raise RuntimeError(msg)
 
-            data = [self.ex_type(*row) for row in reader]
-            wordforms = list(map(lambda example: example.found_wordforms, data))
-            wordforms = sum(wordforms, [])
-            self._add_wordforms(wordforms)
+        where = Corpus._sqlite_filters(where or self._where)
+        return self._sqlite_store().count(**where)
+
+    def _row_parser(self,
+                    columns: List[str]) -> Callable:
+        """ Get function to create Example obj from the csv row.
+
+        :param columns: list of str, header of the csv file.
+        :return: callable.
+        """
+        return functools.partial(example_from_row, self.ex_type, None)
+
+    def _csv_format(self) -> Dict[str, str]:
+        """ Get format params of csv reader and writer. """
+        return {
+            'delimiter': self._DATA_W_DELIMITER,
+            'quotechar': self._DATA_W_QUOTCHAR
+        }
+
+    def _load_jsonl_data(self) -> Iterator[Any]:
+        """ Load data from JSON Lines file, the first line
+        contains names of the record fields. The examples
+        are created while reading.
+
+        :exception ValueError: if the fields are not the fields
+         of the examples of the Corpus.
+        """
+        with self._open_data('r') as f:
+            fields = tuple(ujson.loads(f.readline()))
+            if fields != self.ex_type._RECORD_FIELDS:
+                msg = f"Records of {self.ex_type.__name__} expected, " \
+                      f"but the fields are {fields}"
+                logger.error(msg)
+                raise ValueError(msg)
 
-        return data
+            for line in f:
+                yield self.ex_type(*ujson.loads(line))
+
+    def _load_csv_data(self) -> Iterator[Any]:
+        """ Load data from csv file, the first row contains headers.
+        The examples are created while reading.
+        """
+        with self._open_data('r') as f:
+            reader = csv.reader(f, **self._csv_format())
+            parse = self._row_parser(next(reader))
+            for row in reader:
+                yield parse(row)
+
+    def _load_data(self) -> Iterator[Any]:
+        """ Load data from csv, JSON Lines file or SQLite database,
+        the examples are created while reading, so they might
+        be spilled to disk (see memory_limit) while loading.
+        """
+        if self._file_format == 'sqlite':
+            return self._load_sqlite_data()
+        if self._file_format == 'jsonl':
+            return self._load_jsonl_data()
+        return self._load_csv_data()
+
+    def _map_data(self) -> cstore.MappedCsv or cstore.MappedSqlite or None:
+        """ Map the csv file or SQLite database
+        to read the examples on access.
+
+        :return: MappedCsv, MappedSqlite or None if the file is not
+         uncompressed csv or there is no offsets index.
+        """
+        if self._file_format == 'sqlite':
+            return cstore.MappedSqlite(
+                self._sqlite_store(), self.ex_type,
+                **Corpus._sqlite_filters(self._where))
+        if self._file_format != 'csv' or self._compression:
+            logger.warning("Only uncompressed csv file or SQLite database "
+                           "might be read lazily, all examples will be loaded")
+            return None
+        offsets = cstore.read_index(self.file)
+        if offsets is None:
+            logger.warning("There is no offsets index of the file, "
+                           "dump the data to write it, all examples "
+                           "will be loaded")
+            return None
+
+        with self._open_data('r') as f:
+            columns = next(csv.reader(f, **self._csv_format()))
+        return cstore.MappedCsv(
+            self.file, offsets, self._row_parser(columns),
+            **self._csv_format())
+
+    def _plain_path(self) -> Path:
+        """ Get path to the data file without compression suffix. """
+        if self._compression is None:
+            return self._data_path
+        return self._data_path.with_suffix('')
+
+    @staticmethod
+    def _compressed_path(path: Path,
+                         compression: str or None) -> Path:
+        """ Add suffix of the compression to the path. """
+        if compression is None:
+            return path
+        return path.with_name(f"{path.name}{cstore.COMPRESSIONS[compression]}")
+
+    def _open_data(self,
+                   mode: str) -> Any:
+        """ Open the data file, it is (de)compressed while
+        reading or writing if it is compressed.
+        """
+        return cstore.open_text(self.file, mode, self._compression)
 
     def _load_params(self) -> Dict:
-        """ Load request params from json file. """
+        """ Load request params from json file or SQLite database.
+
+        :exception FileExistsError: if there are no params in the database.
+        """
+        if self._file_format == 'sqlite':
+            params = self._sqlite_store().config()
+            if not params:
+                raise FileExistsError("There is no config in the database")
+            return params
+
         with self._config_path.open('r', encoding='utf-8') as f:
             return ujson.load(f)
 
@@ -514,9 +916,21 @@ class Corpus(ABC):
                 'g-em' in tag.attrs.get('class', ''))
         ]
 
+    @staticmethod
+    def _find_searched_words_in_element(element: Any) -> List[str]:
+        """ Get found words from lxml element, see _find_searched_words. """
+        return [
+            child.text_content().strip()
+            for child in element
+            if 'g-em' in (child.get('class') or '').split()
+        ]
+
     @property
     def data(self) -> List:
-        """ Get list of all examples """
+        """ Get list of all examples. If the examples are
+        shared with other Corpus objects, they are copied.
+        """
+        self._own_data()
         return self._data
 
     @property
@@ -542,7 +956,7 @@ class Corpus(ABC):
     @property
     def file(self) -> Path:
         """ Get path to local database file. """
-        return self._csv_path
+        return self._data_path
 
     @property
     def marker(self) -> Callable:
@@ -556,8 +970,10 @@ class Corpus(ABC):
 
     @property
     def found_wordforms(self) -> Dict[str, int]:
-        """ Get info about found wordforms, {form: frequency}. """
-        return self._found_wordforms
+        """ Get info about found wordforms, {form: frequency}.
+        It is updated with the data, so it must not be changed.
+        """
+        return self._get_wordforms().counts
 
     @property
     def url(self) -> str:
@@ -646,6 +1062,52 @@ class Corpus(ABC):
 
             self._add_info = additional_info
 
+    def share(self,
+              name: str = None) -> str:
+        """ Publish the params and examples to shared memory, other
+        processes attach to them with Corpus(shared=name) and read
+        one copy of the examples instead of loading their own ones.
+
+        The block is kept until unshare() is called, changing
+        the data does not change the published examples.
+
+        :param name: str, name of the block. Optional, random by default.
+        :return: str, name of the block.
+        :exception RuntimeError: if there are no data.
+        :exception ImportError: if there is no multiprocessing.shared_memory.
+        :exception FileExistsError: if the block with the name exists.
+        """
+        if not self._data:
+            msg = "There is no data to share"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        self.unshare()
+        self._shared_memory = cstore.share_examples(
+            self._data, self._config(), name)
+        return self._shared_memory.name
+
+    def unshare(self) -> None:
+        """ Remove the block published with share(), the processes
+        attached to it keep reading it until they exit.
+
+        :return: None.
+        """
+        if self._shared_memory is None:
+            return
+        cstore.unlink_shared(self._shared_memory)
+        self._shared_memory = None
+
+    def refresh_info(self) -> None:
+        """ Request additional info (amount of found docs and
+        contexts, link to the graphic) from RNC. It is not requested
+        when the Corpus is loaded from the file, the dumped one is used.
+
+        :return: None.
+        :exception BaseRequestError: if the request is wrong.
+        """
+        self._get_additional_info()
+
     def _page_parser_and_ex_type(self) -> None:
         """ Add 'parser' and 'ex_type' params.
         They are depended on 'out' tag.
@@ -657,6 +1119,9 @@ class Corpus(ABC):
             self._page_parser = self._parse_page_kwic
             self._ex_type = expl.KwicExample
 
+        if self._transport == 'json':
+            self._page_parser = self._parse_page_json
+
     def _query_to_http(self) -> None:
         """ Convert the query to HTTP tags, add them to params.
 
@@ -736,15 +1201,58 @@ class Corpus(ABC):
                 logger.error(msg)
                 raise ValueError(msg)
 
-    def _add_wordforms(self,
-                       forms: List[str]) -> None:
-        """ Add found wordforms to counter. """
-        if not forms:
-            return
+    @staticmethod
+    def _normalize_wordform(form: str) -> str:
+        """ Normalize found wordform to count it. """
+        return clean_text_up(form).lower()
+
+    def _get_wordforms(self) -> cindex.WordformIndex:
+        """ Get the index of found wordforms, build it if it's dropped. """
+        if self._wordforms is None:
+            data = self._data
+            if isinstance(data, cstore.ExampleTable):
+                # examples are not created, only the forms are counted
+                self._wordforms = cindex.WordformIndex(
+                    Corpus._normalize_wordform, keep_examples=False)
+                for forms in data.column('found_wordforms'):
+                    self._wordforms.count(forms)
+                return self._wordforms
+
+            # examples created on access are not kept
+            if isinstance(data, cstore.DataView):
+                data = data.base
+            keep_examples = isinstance(data, list)
+            self._wordforms = cindex.WordformIndex(
+                Corpus._normalize_wordform, self._data, keep_examples)
+        return self._wordforms
+
+    def wordform_frequency(self,
+                           form: str) -> int:
+        """ Get frequency of the found wordform.
+
+        :param form: str, wordform.
+        :return: int, how many times it was found.
+        """
+        return self._get_wordforms().frequency(form)
 
-        for form in forms:
-            form = clean_text_up(form).lower()
-            self._found_wordforms[form] += 1
+    def examples_with_wordform(self,
+                               form: str) -> List[Any]:
+        """ Get examples where the wordform was found.
+
+        :param form: str, wordform.
+        :return: list of examples.
+        """
+        wordforms = self._get_wordforms()
+        if wordforms.keeps_examples:
+            return wordforms.examples(form)
+
+        form = Corpus._normalize_wordform(form)
+        return [
+            example
+            for example in self._data
+            if form in map(Corpus._normalize_wordform,
+                           example.found_wordforms)
+        ]
 
     @abstractmethod
     def _parse_doc(self,
@@ -768,31 +1276,135 @@ class Corpus(ABC):
         """
         pass
 
+    @staticmethod
+    def _parse_fields(example: bs4.element.Tag,
+                      fields: Tuple[str]) -> Tuple[
+        str, str, str, List[str], str]:
+        """ Get text, source, ambiguation, found wordforms
+        and doc url from the example.
+
+        Only the requested fields are extracted,
+        the others are left empty.
+        """
+        txt = src = ambiguation = doc_url = ''
+        found_words = []
+
+        # source is required to cut it from the text
+        if 'txt' in fields or 'src' in fields:
+            src = Corpus._get_source(example)
+        if 'txt' in fields:
+            txt = Corpus._get_text(example)
+            txt = txt[:txt.index(src)]
+            txt = txt[:txt.rindex('[')].strip()
+        if 'src' not in fields:
+            src = ''
+
+        if 'doc_url' in fields:
+            doc_url = Corpus._get_doc_url(example)
+        if 'ambiguation' in fields:
+            ambiguation = Corpus._get_ambiguation(example)
+        if 'found_wordforms' in fields:
+            found_words = Corpus._find_searched_words(example)
+
+        return txt, src, ambiguation, found_words, doc_url
+
+    @staticmethod
+    def _find_element(element: Any,
+                      tag: str,
+                      class_name: str) -> Any:
+        """ Find the first descendant of lxml element with
+        the tag and the class, None if there is no such one.
+        """
+        for found in element.iterdescendants(tag):
+            if class_name in (found.get('class') or '').split():
+                return found
+
+    @staticmethod
+    def _parse_element_fields(element: Any,
+                              fields: Tuple[str]) -> Tuple[
+        str, str, str, str]:
+        """ Get text, source, ambiguation and doc url from lxml
+        element of the example as _parse_fields does from the tag.
+
+        Only the requested fields are extracted,
+        the others are left empty.
+        """
+        txt = src = ambiguation = doc_url = ''
+
+        # source is required to cut it from the text
+        if 'txt' in fields or 'src' in fields:
+            src = Corpus._find_element(element, 'span', 'doc')
+            src = "Not found" if src is None else \
+                clean_text_up(src.text_content())[1:-1].strip()
+        if 'txt' in fields:
+            txt = clean_text_up(element.text_content())
+            txt = txt[:txt.index(src)]
+            txt = txt[:txt.rindex('[')].strip()
+        if 'src' not in fields:
+            src = ''
+
+        if 'doc_url' in fields:
+            link = next(element.iterdescendants('a'), None)
+            doc_url = 'Not found' if link is None else \
+                create_doc_url(link.attrib['href'])
+        if 'ambiguation' in fields:
+            ambiguation = Corpus._find_element(element, 'span', 'off')
+            if ambiguation is None:
+                ambiguation = Corpus._find_element(element, 'span', 'on')
+            ambiguation = 'Not found' if ambiguation is None else \
+                ambiguation.text_content().strip()[1:-1].strip()
+
+        return txt, src, ambiguation, doc_url
+
+    @staticmethod
+    def _unfold_fragment(fragment: str,
+                         fields: Tuple[str],
+                         intern: Callable) -> Tuple[str, str, str, str]:
+        """ Get text, source, ambiguation and doc url
+        from HTML code of a lazy example.
+
+        :param intern: callable, get the equal stored string.
+        """
+        example = lxml.html.fragment_fromstring(fragment)
+        txt, src, ambiguation, doc_url = Corpus._parse_element_fields(
+            example, fields)
+
+        return txt, intern(src, src), intern(ambiguation, ambiguation), \
+            intern(doc_url, doc_url)
+
     def _parse_kwic_example(self,
                             left: bs4.element.Tag,
                             center: bs4.element.Tag,
                             right: bs4.element.Tag) -> expl.KwicExample:
-        l_txt = clean_text_up(left.text)
-        c_txt = clean_text_up(center.text)
-        # remove ←…→ symbol too
-        r_txt = clean_text_up(right.text)[:-4].rstrip()
-
-        found_wordforms = Corpus._find_searched_words(left)
-        found_wordforms += Corpus._find_searched_words(center)
-        found_wordforms += Corpus._find_searched_words(right)
-
-        try:
-            src = right.a.attrs['msg'].strip()
-            url = right.a.attrs['href']
-        except (KeyError, AttributeError, TypeError) as e:
-            logger.error(f"Source or url not found:\n{e}")
-            src = url = ''
+        fields = self._fields
+        l_txt = c_txt = r_txt = src = url = ''
+        found_wordforms = []
+
+        if 'txt' in fields:
+            l_txt = clean_text_up(left.text)
+            c_txt = clean_text_up(center.text)
+            # remove ←…→ symbol too
+            r_txt = clean_text_up(right.text)[:-4].rstrip()
+
+        if 'found_wordforms' in fields:
+            found_wordforms = Corpus._find_searched_words(left)
+            found_wordforms += Corpus._find_searched_words(center)
+            found_wordforms += Corpus._find_searched_words(right)
+
+        if 'src' in fields or 'doc_url' in fields:
+            try:
+                src = right.a.attrs['msg'].strip()
+                url = right.a.attrs['href']
+            except (KeyError, AttributeError, TypeError) as e:
+                logger.error(f"Source or url not found:\n{e}")
+                src = url = ''
 
-        url = create_doc_url(url)
+            src = src * ('src' in fields)
+            url = create_doc_url(url) * ('doc_url' in fields)
 
         new_ex = expl.KwicExample(
             l_txt, c_txt, r_txt, src, found_wordforms, url)
-        new_ex.mark_found_words(self.marker)
+        new_ex.mark_found_words(self.marker, defer=True)
 
         return new_ex
 
@@ -819,7 +1431,71 @@ class Corpus(ABC):
         for left, center, right in zip(nobr[::3], nobr[1::3], nobr[2::3]):
             new_ex = self._parse_kwic_example(left, center, right)
             res += [new_ex]
-            self._add_wordforms(new_ex.found_wordforms)
+        return res
+
+    def _parse_json_fields(self,
+                           doc: Dict[str, Any],
+                           example: Dict[str, Any],
+                           text_key: str = 'text') -> Tuple[
+        Any, str, str, List[str], str]:
+        """ Get text, source, ambiguation, found wordforms and doc url
+        from JSON search results. Only the requested fields are taken.
+
+        Document: {"source": str, "url": str, "examples": [...]},
+        example: {"text": str, "ambiguation": str, "found_wordforms": [str]}.
+        """
+        fields = self._fields
+
+        def get(obj: Dict[str, Any], key: str, field: str) -> Any:
+            return obj.get(key, '') if field in fields else ''
+
+        return (get(example, text_key, 'txt'),
+                get(doc, 'source', 'src'),
+                get(example, 'ambiguation', 'ambiguation'),
+                get(example, 'found_wordforms', 'found_wordforms'),
+                create_doc_url(get(doc, 'url', 'doc_url')))
+
+    def _parse_json_example(self,
+                            doc: Dict[str, Any],
+                            example: Dict[str, Any]) -> Any:
+        """ Convert the example from JSON search results to Example obj.
+
+        If 'out' is 'kwic', there are "left", "center"
+        and "right" instead of "text" in the example.
+        """
+        if self.out == 'kwic':
+            _, src, _, found_words, doc_url = self._parse_json_fields(
+                doc, example)
+            with_txt = 'txt' in self._fields
+            left, center, right = (
+                example.get(key, '') * with_txt
+                for key in ('left', 'center', 'right')
+            )
+            return expl.KwicExample(
+                left, center, right, src, found_words, doc_url)
+
+        return self.ex_type(*self._parse_json_fields(doc, example))
+
+    def _parse_page_json(self,
+                         page: str) -> List:
+        """ Convert structured search results to examples without
+        parsing HTML: {"stats": {...}, "documents": [doc, ...]}.
+
+        :exception ValueError: if the documents not found.
+        """
+        try:
+            docs = ujson.loads(page)['documents']
+        except (ValueError, KeyError, TypeError) as e:
+            msg = f"Documents not found in the JSON search results:\n{e}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        res = []
+        for doc in docs:
+            for example in doc.get('examples', []):
+                new_ex = self._parse_json_example(doc, example)
+                new_ex.mark_found_words(self.marker, defer=True)
+                res += [new_ex]
         return res
 
     def _parse_page_normal(self,
@@ -838,83 +1514,371 @@ class Corpus(ABC):
 
         return res
 
+    def _page_cache_path(self,
+                         page: str) -> Path or None:
+        """ Get path to the cached examples of the page. The key
+        is hash of the page content and the way to parse it.
+
+        :return: path or None if the page can't be cached,
+         because the marker has no name.
+        """
+        marker = ''
+        if self.marker is not None:
+            marker = getattr(self.marker, '__qualname__', '')
+            if not marker or '<' in marker:
+                return
+            marker = f"{getattr(self.marker, '__module__', '')}.{marker}"
+
+        key = hashlib.sha256()
+        key.update(f"{PARSER_VERSION}|{self.__class__.__name__}|"
+                   f"{self.out}|{','.join(self._fields)}|{marker}|"
+                   .encode('utf-8'))
+        key.update(page.encode('utf-8'))
+
+        return self.CACHE_FOLDER / f"{key.hexdigest()}.json"
+
+    def _parse_page(self,
+                    page: str) -> List:
+        """ Parse the page or load its examples from the cache. """
+        path = self._cache and self._page_cache_path(page)
+        if not path:
+            return self._page_parser(page)
+
+        if path.exists():
+            with path.open('r', encoding='utf-8') as f:
+                records = ujson.load(f)
+            return [self.ex_type(*record) for record in records]
+
+        res = self._page_parser(page)
+        # lazy examples would be parsed to be cached
+        if not self._lazy:
+            os.makedirs(self.CACHE_FOLDER, exist_ok=True)
+            with path.open('w', encoding='utf-8') as f:
+                ujson.dump([example.record for example in res], f,
+                           ensure_ascii=False)
+        return res
+
     def _parse_all_pages(self,
-                         pages: List[str]) -> List:
-        """ Parse all pages. """
-        parsed = [
-            self._page_parser(page)
+                         pages: List[str],
+                         dedupe: bool = False) -> List:
+        """ Parse all pages, drop repeated examples if dedupe is True.
+
+        :return: the storage of examples, see _new_data.
+        """
+        parsed = itertools.chain.from_iterable(
+            self._parse_page(page)
             for page in pages
-        ]
-        return sum(parsed, [])
+        )
+        if dedupe:
+            index = cindex.FingerprintIndex()
+            parsed = self._unique(parsed, index)
+        # the examples are stored while they are parsed
+        return self._new_data(self._intern_examples(parsed))
+
+    def _new_data(self,
+                  examples: Iterable[Any]) -> List[Any]:
+        """ Create the storage of examples: SpilledList if there
+        is memory limit, ExampleTable if the Corpus is columnar,
+        list otherwise.
+        """
+        if self._memory_limit is not None:
+            return cstore.SpilledList(
+                self.ex_type, self._memory_limit,
+                self.SPILL_FOLDER, examples)
+        if self._columnar:
+            return cstore.ExampleTable(self.ex_type, examples)
+        return list(examples)
+
+    def _set_data(self,
+                  data: List[Any]) -> None:
+        """ Replace the data, indexes will be built again. """
+        self._data = data
+        self._data_shared = False
+        self._dumped = None
+        self._drop_indexes()
+
+    def _changed_at(self,
+                    position: int or None) -> None:
+        """ Mark the data changed at the position, if the
+        examples are dumped there, the file will be rewritten.
+
+        :param position: int, non negative index or None
+         if the data are changed anywhere.
+        :return: None.
+        """
+        if self._dumped is None:
+            return
+        if position is None or position < self._dumped:
+            self._dumped = None
+
+    def _drop_indexes(self) -> None:
+        """ Drop the data indexes, they will be built on demand. """
+        self._fingerprints = None
+        self._wordforms = None
+        self._search_index = None
+
+    def _remember(self,
+                  examples: List[Any]) -> None:
+        """ Add the examples to the data indexes. """
+        for example in examples:
+            if self._fingerprints is not None:
+                self._fingerprints.add(example)
+            if self._wordforms is not None:
+                self._wordforms.add(example)
+
+    def _forget(self,
+                examples: List[Any],
+                key: int or slice = None) -> None:
+        """ Remove the examples from the data indexes.
+
+        If an example is not found (it was changed in place or
+        created from ExampleTable) the index is dropped.
+
+        :param examples: list of removed examples.
+        :param key: int or slice, where the examples were, if they
+         are removed from the positions. Optional.
+        :return: None.
+        """
+        if self._search_index is not None and key is not None:
+            texts = [search_text(example.txt) for example in examples]
+            self._search_index.delete(key, texts)
+
+        for example in examples:
+            try:
+                if self._fingerprints is not None:
+                    self._fingerprints.remove(example)
+            except KeyError:
+                self._fingerprints = None
+            try:
+                if self._wordforms is not None:
+                    self._wordforms.remove(example)
+            except KeyError:
+                self._wordforms = None
+
+    def _unique(self,
+                examples: Iterable[Any],
+                index: cindex.FingerprintIndex) -> Iterator[Any]:
+        """ Yield the examples which are not in the index yet,
+        add them there.
+        """
+        for example in examples:
+            if example not in index:
+                index.add(example)
+                yield example
+
+    def _intern_examples(self,
+                         examples: Iterable[Any]) -> Iterator[Any]:
+        """ Store strings repeated in the examples once,
+        yield the examples.
+        """
+        for example in examples:
+            example._intern(self._interned)
+            yield example
+
+    def _csv_columns(self) -> List[str]:
+        """ Get header of the csv file.
+        Here it is assumed that the data exist.
+        """
+        return self[0].columns
 
-    def _data_to_csv(self) -> None:
+    def _csv_items(self,
+                   example: Any) -> List[Any]:
+        """ Get values of the columns of the example. """
+        return example.items
+
+    def _csv_rows(self,
+                  start: int = 0) -> Iterator[List[Any]]:
+        """ Get values of the columns of the examples from the start,
+        they are read from the columns if the examples are stored there.
+        """
+        if isinstance(self._data, cstore.ExampleTable):
+            return (
+                [
+                    ', '.join(value) if isinstance(value, list) else value
+                    for value in record
+                ]
+                for record in self._data.rows(start)
+            )
+        # examples might be read from disk, they are not collected
+        return (
+            self._csv_items(self._data[index])
+            for index in range(start, len(self._data))
+        )
+
+    def _data_to_csv(self,
+                     start: int = 0) -> None:
         """ Dump the data to csv file.
         Here it is assumed that the data exist.
+
+        :param start: int, index of the first example to write, if it
+         is not 0, the examples are appended to the file.
+        :return: None.
         """
-        data = [
-            example.items
-            for example in self.data
-        ]
-        columns = self[0].columns
-        with self.file.open('w', encoding='utf-8', newline='') as f:
-            # class constants
-            dm = self._DATA_W_DELIMITER
-            qch = self._DATA_W_QUOTCHAR
+        columns = self._csv_columns()
+        rows = self._csv_rows(start)
+        if self._compression is None:
+            # with offsets index to read the file lazily
+            cstore.write_indexed_csv(
+                self.file, rows, None if start else columns,
+                quoting=csv.QUOTE_MINIMAL, **self._csv_format())
+            return
 
+        with self._open_data('a' if start else 'w') as f:
             writer = csv.writer(
-                f, delimiter=dm, quotechar=qch, quoting=csv.QUOTE_MINIMAL)
-            writer.writerows([columns] + data)
-
-    def _params_to_json(self) -> None:
-        """ Write the request params to json file.
+                f, quoting=csv.QUOTE_MINIMAL, **self._csv_format())
+            if not start:
+                writer.writerow(columns)
+            writer.writerows(rows)
+
+    def _data_to_jsonl(self,
+                       start: int = 0) -> None:
+        """ Dump records of the examples to JSON Lines file, the
+        first line contains names of the record fields.
+        Here it is assumed that the data exist.
 
-        Here it is assumed that these params exist.
+        :param start: int, index of the first example to write, if it
+         is not 0, the examples are appended to the file.
+        :return: None.
         """
-        to_write = {
+        with self._open_data('a' if start else 'w') as f:
+            if not start:
+                fields = ujson.dumps(self.ex_type._RECORD_FIELDS)
+                f.write(f"{fields}\n")
+            if isinstance(self._data, cstore.ExampleTable):
+                records = (
+                    ujson.dumps(record, ensure_ascii=False)
+                    for record in self._data.rows(start)
+                )
+            else:
+                # examples might be read from disk, they are not collected
+                records = (
+                    cstore.encode_record(self._data[index])
+                    for index in range(start, len(self._data))
+                )
+            f.writelines(f"{record}\n" for record in records)
+
+    def _config(self) -> Dict[str, Any]:
+        """ Get the request params and additional info to dump. """
+        return {
             'query': self.query,
             'p_count': self.p_count,
-            'params': self.params
+            'params': self.params,
+            'add_info': self._add_info
         }
-        with self._config_path.open('w', encoding='utf-8') as f:
+
+    def _params_to_json(self) -> None:
+        """ Write the request params and additional info to json file.
+
+        Here it is assumed that these params exist.
+        """
+        to_write = self._config()
+        path = self._config_path
+        # the config is replaced at once, it is not broken if
+        # writing fails and it is not read half-written
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with tmp_path.open('w', encoding='utf-8') as f:
             ujson.dump(to_write, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, path)
 
-    def dump(self) -> None:
-        """ Write the data to csv file, request params to json file.
+    def _data_to_sqlite(self,
+                        start: int = 0,
+                        append: bool = False) -> None:
+        """ Write the data, request params and additional
+        info to SQLite database.
 
+        :param start: int, index of the first example to write.
+        :param append: bool, whether the examples are appended
+         to the database or replace the examples there.
         :return: None.
-        :exception RuntimeError: If there are no data, params or files exist.
+        """
+        config = self._config()
+        examples = (
+            self._data[index]
+            for index in range(start, len(self._data))
+        )
+        store = self._sqlite_store()
+        if append:
+            count = store.append(examples, config, Corpus._normalize_wordform)
+        else:
+            count = store.write(examples, config, Corpus._normalize_wordform)
+        logger.debug(f"{count} examples wrote to the database")
+
+    def dump(self,
+             compression: str = None,
+             append: bool = False) -> None:
+        """ Write the data to csv or JSON Lines file, request params to
+        json file. If the file is SQLite database, write all them there.
+
+        :param compression: str, 'gzip', 'xz' or 'zstd' (if zstandard is
+         installed), csv or JSON Lines file is compressed while writing,
+         suffix of the compression is added to the filename. Optional,
+         compression of the file by default.
+        :param append: bool, whether only the examples added after the
+         last dump or loading will be written to the end of the file,
+         the config is replaced. If the dumped examples are changed,
+         the file is rewritten. Optional, False by default.
+        :return: None.
+        :exception RuntimeError: If there are no data, params or files exist;
+         the examples filtered while loading from SQLite database should be
+         written again, it would remove the other examples there.
+        :exception ValueError: if the compression is wrong or
+         it is given with SQLite database.
+        :exception ImportError: if zstd is given, but
+         zstandard is not installed.
         """
         msg = "There is no data to write"
-        if not self.data:
+        if not self._data:
             logger.error(msg)
             raise RuntimeError(msg)
         if not (self.query and self.p_count and self.params):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        os.makedirs(self.DATA_FOLDER, exist_ok=True)
-
-        self._data_to_csv()
-        self._params_to_json()
-
-        logger.info(
-            f"Data wrote to files: {self.file} and {self._config_path}")
-
-    def request_examples(self) -> None:
-        """ Request examples, parse them and update the data.
-
-        If there are no results found, last page does not exist,
-        params or query is wrong then exception.
+        if compression is not None and compression != self._compression:
+            if self._file_format not in COMPRESSIBLE_FORMATS:
+                msg = f"{self._file_format} file might not be compressed"
+                logger.error(msg)
+                raise ValueError(msg)
+            cstore.check_compression(compression)
+
+            path = self._compressed_path(self._plain_path(), compression)
+            self._data_path, self._compression = path, compression
+            # there are no examples in the new file
+            self._dumped = None
+
+        start = 0
+        append = append and self._dumped is not None and self.file.exists()
+        if append:
+            start = self._dumped
+        elif self._where:
+            msg = "The examples are filtered while loading, writing " \
+                  "them all would remove the other examples from the " \
+                  "database, only the new ones might be appended"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        else:
+            logger.debug("All examples will be written to the file")
 
-        :return: None.
+        os.makedirs(self.file.parent, exist_ok=True)
 
-        :exception RuntimeError: if the data still exist.
+        if self._file_format == 'sqlite':
+            self._data_to_sqlite(start, append)
+            logger.info(f"Data wrote to the database: {self.file}")
+        else:
+            # nothing to append, but the config is replaced
+            if len(self._data) > start and self._file_format == 'jsonl':
+                self._data_to_jsonl(start)
+            elif len(self._data) > start:
+                self._data_to_csv(start)
+            self._params_to_json()
+            logger.info(
+                f"Data wrote to files: {self.file} and {self._config_path}")
+        self._dumped = len(self._data)
+
+    def _request_html_pages(self) -> List[str]:
+        """ Validate the request, get additional info
+        and request all HTML pages.
         """
-        if self.data:
-            logger.error("Tried to request new examples, however data exist")
-            raise RuntimeError("Data still exist")
-
-        start = time.time()
         try:
             first, last = creq.is_request_correct(
                 RNC_URL, self.p_count, **self.params)
@@ -941,11 +1905,102 @@ class Corpus(ABC):
             htmls = [first]
             if self.p_count == 2:
                 htmls += [last]
+        return htmls
+
+    def _request_json_pages(self) -> List[str]:
+        """ Request all pages of structured search results,
+        get additional info from the first one.
+
+        :exception NoResultFound: if there are no documents
+         on the first page or it is not JSON.
+        """
+        pages = creq.get_htmls(self.JSON_URL, 0, self.p_count, **self.params)
+
+        try:
+            first = ujson.loads(pages[0])
+            if not first['documents']:
+                raise ValueError
+        except (IndexError, KeyError, TypeError, ValueError):
+            msg = f"No result found, query = {self.forms_in_query}, " \
+                  f"{self.p_count}, {self.params}"
+            logger.error(msg)
+            raise creq.NoResultFound(msg)
+
+        stats = first.get('stats', {})
+        self._add_info = {
+            key: stats[key]
+            for key in ('docs', 'contexts', 'graphic_link')
+            if key in stats
+        }
+        return pages
+
+    def request_examples(self,
+                         fields: List[str] = None,
+                         lazy: bool = False,
+                         cache: bool = False,
+                         dedupe: bool = False) -> None:
+        """ Request examples, parse them and update the data.
+
+        If there are no results found, last page does not exist,
+        params or query is wrong then exception.
+
+        :param fields: list of str, fields of examples to extract,
+         see EXAMPLE_FIELDS. The others are left empty. Found wordforms
+         are required to mark the text. Optional, all fields by default.
+        :param lazy: bool, whether only found wordforms will be parsed,
+         other fields are parsed on the first access to them.
+         Works only with 'normal' output in MainCorpus and its descendants.
+         Optional, False by default.
+        :param cache: bool, whether parsed pages will be cached to
+         CACHE_FOLDER and loaded from there without parsing. The marker
+         should be a named function to be cached. Optional, False by default.
+        :param dedupe: bool, whether repeated examples will be dropped
+         while parsing. Lazy examples are unfolded to be compared.
+         Optional, False by default.
+        :return: None.
+
+        :exception RuntimeError: if the data still exist.
+        :exception ValueError: if a field is wrong.
+        """
+        if self._data:
+            logger.error("Tried to request new examples, however data exist")
+            raise RuntimeError("Data still exist")
+
+        fields = fields or EXAMPLE_FIELDS
+        wrong_fields = set(fields) - set(EXAMPLE_FIELDS)
+        if wrong_fields:
+            msg = f"'{wrong_fields}' are wrong fields, " \
+                  f"expected: {EXAMPLE_FIELDS}"
+            logger.error(msg)
+            raise ValueError(msg)
+        self._fields = tuple(fields)
+
+        self._lazy = lazy
+        lazy_supported = (self._LAZY_SUPPORTED and self.out == 'normal' and
+                          self._transport == 'html')
+        if lazy and not lazy_supported:
+            logger.warning(
+                f"Lazy parsing isn't supported in {self.__class__.__name__} "
+                f"with '{self.out}' output and '{self._transport}' transport, "
+                f"examples will be parsed at once")
+            self._lazy = False
+        if self._lazy and self._columnar:
+            # examples are unfolded when they are stored in columns
+            logger.warning("Lazy parsing isn't supported with columnar "
+                           "storage, examples will be parsed at once")
+            self._lazy = False
+        self._cache = cache
+
+        start = time.time()
+        if self._transport == 'json':
+            htmls = self._request_json_pages()
+        else:
+            htmls = self._request_html_pages()
 
         logger.debug("Parsing html started")
         try:
             parsing_start = time.time()
-            parsed = self._parse_all_pages(htmls)
+            parsed = self._parse_all_pages(htmls, dedupe)
             parsing_stop = time.time()
         except Exception as e:
             logger.error(f"Error while parsing, query = {self.params}\n{e}")
@@ -954,14 +2009,47 @@ class Corpus(ABC):
             logger.debug("Parsing completed")
             logger.info(f"Parsing time: {parsing_stop - parsing_start:.2f}")
             logger.info(f"Overall time: {parsing_stop - start:.2f}")
-            self._data = parsed[:]
+            self._set_data(parsed)
+
+    def _derive(self,
+                data: Any) -> Any:
+        """ Create new obj with the same params and the data
+        without calling __init__. The data are shared, so
+        they are copied before changing in both objects.
+        """
+        new_obj = self.__class__.__new__(self.__class__)
+        new_obj.__dict__.update(self.__dict__)
+        new_obj._params = self._params.copy()
+        new_obj._add_info = self._add_info.copy()
+        # the block is unlinked by the obj published it
+        new_obj._shared_memory = None
+        if isinstance(self._query, dict):
+            new_obj._query = self._query.copy()
+
+        new_obj._set_data(data)
+        new_obj._data_shared = self._data_shared = True
+        return new_obj
+
+    def _own_data(self) -> None:
+        """ Copy the data if they are shared, before changing them. """
+        if not self._data_shared:
+            return
+        base = self._data
+        if isinstance(base, cstore.DataView):
+            base = base.base
+        if isinstance(base, (cstore.MappedCsv, cstore.MappedSqlite,
+                             cstore.SharedExamples)):
+            # the examples (or the viewed ones) are loaded from the
+            # file or shared memory to the storage of the Corpus
+            data = self._intern_examples(self._data)
+            self._data = self._new_data(data)
+        else:
+            self._data = self._data.copy()
+        self._data_shared = False
 
     def copy(self) -> Any:
-        copy_obj = self.__class__(
-            self.query, self.p_count, file=self.file,
-            marker=self.marker, **self.params)
-        copy_obj._data = self.data.copy()
-        return copy_obj
+        """ Copy the Corpus, the data are copied on changing. """
+        return self._derive(self._data)
 
     def sort_data(self,
                   **kwargs) -> None:
@@ -979,20 +2067,65 @@ class Corpus(ABC):
         if not callable(key):
             logger.error("Given uncallable key to sort")
             raise TypeError("Sort key must be callable")
+        self._own_data()
         self._data.sort(key=key, reverse=reverse)
+        # positions of the examples are changed
+        self._search_index = None
+        self._changed_at(None)
 
     def pop(self,
             index: int) -> Any:
         """ Remove and return element from data at the index. """
-        return self._data.pop(index)
+        self._own_data()
+        example = self._data.pop(index)
+        self._forget([example], index)
+        self._changed_at(index % (len(self._data) + 1))
+        return example
+
+    def extend(self,
+               examples: Iterable[Any]) -> None:
+        """ Add the examples to the end of the data.
+
+        They are written to the file by dump(append=True)
+        without writing the other examples again.
+
+        :param examples: iterable of Example objects.
+        :return: None.
+        :exception TypeError: if wrong type given.
+        """
+        examples = list(examples)
+        for example in examples:
+            if not isinstance(example, self.ex_type):
+                msg = f"{self.ex_type} expected, " \
+                      f"but {type(example)} found"
+                logger.error(msg)
+                raise TypeError(msg)
+
+        self._own_data()
+        examples = list(self._intern_examples(examples))
+        self._data.extend(examples)
+        self._remember(examples)
+        if self._search_index is not None:
+            for example in examples:
+                self._search_index.insert(
+                    len(self._search_index), search_text(example.txt))
 
     def shuffle(self) -> None:
         """ Shuffle list of examples. """
-        random.shuffle(self._data)
+        self._own_data()
+        if isinstance(self._data, cstore.SpilledList):
+            # do not write the spilled examples again
+            order = list(range(len(self._data)))
+            random.shuffle(order)
+            self._data.reorder(order)
+        else:
+            random.shuffle(self._data)
+        self._search_index = None
+        self._changed_at(None)
 
     def clear(self) -> None:
         """ Clear examples list. """
-        self._data.clear()
+        self._set_data(self._new_data([]))
 
     def filter(self,
                key: Callable) -> None:
@@ -1002,19 +2135,153 @@ class Corpus(ABC):
         objects inside the data list.
         :return: None.
         """
-        filtered_data = list(filter(key, self.data))
-        self._data = filtered_data[:]
+        if isinstance(self._data, cstore.ExampleTable):
+            # do not encode the examples again
+            self._set_data(self._data.take(
+                index
+                for index, example in enumerate(self._data)
+                if key(example)
+            ))
+            return
+        self._set_data(self._new_data(filter(key, self._data)))
+
+    def dedupe(self) -> int:
+        """ Remove repeated examples, the first ones are kept.
+
+        :return: int, count of removed examples.
+        """
+        index = cindex.FingerprintIndex()
+        kept = []
+        for num, example in enumerate(self._data):
+            if example not in index:
+                index.add(example)
+                kept.append(num)
+
+        removed = len(self._data) - len(kept)
+        if not removed:
+            return 0
+
+        if isinstance(self._data, cstore.ExampleTable):
+            data = self._data.take(kept)
+        else:
+            data = self._new_data(self._data[num] for num in kept)
+
+        self._set_data(data)
+        self._fingerprints = index
+        logger.debug(f"{removed} repeated examples removed")
+        return removed
+
+    def _texts(self) -> List[str]:
+        """ Get texts of the examples, from the column
+        if the examples are stored in columns.
+        """
+        if (isinstance(self._data, cstore.ExampleTable) and
+                'txt' in self._data.fields):
+            return list(map(search_text, self._data.column('txt')))
+        return [search_text(example.txt) for example in self._data]
+
+    def _text(self,
+              index: int) -> Any:
+        """ Get text of the example at the index. """
+        if (isinstance(self._data, cstore.ExampleTable) and
+                'txt' in self._data.fields):
+            return search_text(self._data.value(index, 'txt'))
+        return search_text(self._data[index].txt)
+
+    def build_search_index(self) -> None:
+        """ Index tokens of the texts, findall, finditer and
+        examples_containing will check only the examples containing
+        literal parts of the pattern. The index is updated with
+        the data, set changed examples back to update it.
+
+        :return: None.
+        """
+        self._search_index = cindex.TokenIndex(self._texts())
+        self._searchable = True
+
+    def _candidates(self,
+                    literals: List[str]) -> Iterable[int]:
+        """ Get positions of the examples which might
+        contain the literals, all of them if there is no index.
+        """
+        if self._searchable and self._search_index is None:
+            self.build_search_index()
+        if self._search_index is None:
+            return range(len(self))
+
+        positions = self._search_index.candidates(literals)
+        if positions is None:
+            return range(len(self))
+        return positions
+
+    def examples_containing(self,
+                            item: str) -> Iterator[Any]:
+        """ Yield the examples containing the item, registers
+        equaled, see Example.__contains__.
+        """
+        for index in self._candidates([item.casefold()]):
+            example = self[index]
+            if item in example:
+                yield example
+
+    def _findall_in_pool(self,
+                         pattern: Pattern or str,
+                         args: Tuple,
+                         positions: Iterable[int],
+                         workers: int) -> Iterator[Tuple[int, List]]:
+        """ Apply the pattern to the texts at the positions in the
+        pool of processes. Yield positions and matches in order.
+        """
+        positions = list(positions)
+        # several chunks per process to balance the load
+        size = max(1, math.ceil(len(positions) / (workers * 8)))
+        chunks = [
+            positions[start:start + size]
+            for start in range(0, len(positions), size)
+        ]
+
+        texts = self._texts()
+        with ProcessPoolExecutor(
+                workers, initializer=_compile_worker_pattern,
+                initargs=(pattern, args)) as executor:
+            chunks_texts = (
+                [texts[index] for index in chunk]
+                for chunk in chunks
+            )
+            found = executor.map(_findall_in_worker, chunks_texts)
+            for chunk, chunk_found in zip(chunks, found):
+                for offset, match in chunk_found:
+                    yield chunk[offset], match
 
     def findall(self,
                 pattern: Pattern or str,
-                *args) -> Tuple[expl.Example, List[str]]:
+                *args,
+                workers: int = None) -> Tuple[expl.Example, List[str]]:
         """ Apply the pattern to the examples' text with re.findall.
         Yield all examples which are satisfy the pattern and match.
+
+        Texts of ParallelExample are joined with new lines.
+
+        :param pattern: compiled pattern or str.
+        :param args: flags of the pattern.
+        :param workers: int, count of processes to search in,
+         the pattern is compiled once in each of them. Optional,
+         the search is in this process by default.
         """
-        for example in self:
-            match = re.findall(pattern, example.txt, *args)
+        literals = cindex.required_literals(pattern, *args)
+        positions = self._candidates(literals)
+
+        if workers is not None and workers > 1:
+            found = self._findall_in_pool(pattern, args, positions, workers)
+        else:
+            found = (
+                (index, re.findall(pattern, self._text(index), *args))
+                for index in positions
+            )
+
+        for index, match in found:
             if match:
-                yield example, match
+                yield self[index], match
 
     def finditer(self,
                  pattern: Pattern or str,
@@ -1022,10 +2289,12 @@ class Corpus(ABC):
         """ Apply the pattern to the examples' text with re.finditer.
         Yield all examples which are satisfy the pattern and match.
         """
-        for example in self:
-            match = re.finditer(pattern, example.txt, *args)
-            if match:
-                yield example, match
+        literals = cindex.required_literals(pattern, *args)
+        for index in self._candidates(literals):
+            matches = re.finditer(pattern, self._text(index), *args)
+            first = next(matches, None)
+            if first is not None:
+                yield self[index], itertools.chain([first], matches)
 
     def __repr__(self) -> str:
         """ Format:
@@ -1052,11 +2321,11 @@ class Corpus(ABC):
                    f"Class: {self.__class__.__name__}, len = {len(self)}\n" \
                    f"{self.p_count} pages of '{q_forms}' requested"
 
-        data = self.data
+        data = self._data
         is_restricted = False
         if self.__RESTRICT_SHOW is not False and \
                 len(data) > self.__RESTRICT_SHOW:
-            data = self.data[:self.__RESTRICT_SHOW]
+            data = self._data[:self.__RESTRICT_SHOW]
             is_restricted = True
 
         examples = '\n\n'.join(
@@ -1067,23 +2336,58 @@ class Corpus(ABC):
 
         return f"{metainfo}\n\n{examples}"
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """ Get the state to pickle: the params and records of the
+        examples streamed from the storage (whatever stores them).
+        Indexes and interned strings are built again after unpickling.
+        """
+        state = self.__dict__.copy()
+        state['_data'] = cstore.RecordStream(self._data)
+        state['_data_shared'] = False
+        state['_fingerprints'] = None
+        state['_wordforms'] = None
+        state['_search_index'] = None
+        state['_interned'] = {}
+        state['_shared_memory'] = None
+        # it is bound to the obj
+        state['_page_parser'] = None
+        return state
+
+    def __setstate__(self,
+                     state: Dict[str, Any]) -> None:
+        """ Restore the obj from the pickled state, the
+        examples are stored as the data of the Corpus are.
+        """
+        data = state.pop('_data')
+        self.__dict__.update(state)
+        self._page_parser_and_ex_type()
+
+        records = cstore.RecordStream.records(
+            data, len(self.ex_type._RECORD_FIELDS))
+        examples = (self.ex_type(*record) for record in records)
+        self._data = self._new_data(self._intern_examples(examples))
+
     def __len__(self) -> int:
-        return len(self.data)
+        return len(self._data)
 
     def __bool__(self) -> bool:
-        return bool(self.data)
+        return bool(self._data)
 
     def __call__(self) -> None:
         """ All the same to request_examples() """
         self.request_examples()
 
     def __iter__(self) -> iter:
-        return iter(self.data)
+        return iter(self._data)
 
     def __contains__(self,
                      item: Any) -> bool:
         """ Whether the Corpus obj contains the Example obj.
 
+        Fingerprints of the examples are indexed on the first call,
+        so set the changed example back (corp[0] = example)
+        to keep the index up to date.
+
         :param item: obj with the same ex_type.
 
         :exception TypeError: if wrong type (different Example) given.
@@ -1093,17 +2397,20 @@ class Corpus(ABC):
                   f"objects, but '{item.__class__.__name__}' found"
             logger.error(msg)
             raise TypeError(msg)
-        return any(
-            item == example
-            for example in self.data
-        )
+        if self._fingerprints is None:
+            self._fingerprints = cindex.FingerprintIndex(self._data)
+        return item in self._fingerprints
 
     def __getattr__(self,
                     item: str) -> str or int or List or None:
         """ Get request param.
 
         :return: param value or None if it does not exist.
+        :exception AttributeError: if the name is private.
         """
+        if item.startswith('_'):
+            # attributes which are not set yet, e.g. while unpickling
+            raise AttributeError(item)
         try:
             return getattr(super(), item)
         except AttributeError:
@@ -1132,12 +2439,9 @@ class Corpus(ABC):
             raise TypeError(msg)
 
         if isinstance(item, int):
-            return self.data[item]
+            return self._data[item]
 
-        new_data = self.data[item]
-        new_obj = self.copy()
-        new_obj._data = new_data.copy()
-        return new_obj
+        return self._derive(cstore.DataView(self._data, item))
 
     def __setitem__(self,
                     index: int,
@@ -1156,11 +2460,20 @@ class Corpus(ABC):
             logger.error(msg)
             raise TypeError(msg)
 
+        self._own_data()
         try:
+            old_example = self._data[index]
             self._data[index] = new_example
         except Exception as e:
             logger.error(f'Setting item: {new_example} to {index}\n{e}')
             raise
+        self._changed_at(index % len(self._data))
+        self._forget([old_example])
+        self._remember([new_example])
+        if self._search_index is not None:
+            self._search_index.replace(
+                index, search_text(old_example.txt),
+                search_text(new_example.txt))
 
     def __delitem__(self,
                     key: int or slice) -> None:
@@ -1178,15 +2491,26 @@ class Corpus(ABC):
 
         :param key: int or slice, address of item(s) to delete.
         """
+        self._own_data()
         try:
+            removed = self._data[key]
             del self._data[key]
         except Exception as e:
             logger.error(f"Deleting item: {key}\n{e}")
             raise
+        if isinstance(key, int):
+            removed = [removed]
+            self._changed_at(key % (len(self._data) + 1))
+        else:
+            positions = range(len(self._data) + len(removed))[key]
+            if positions:
+                self._changed_at(min(positions))
+        self._forget(removed, key)
 
 
 class MainCorpus(Corpus):
     _MODE = 'main'
+    _LAZY_SUPPORTED = True
 
     def __init__(self, *args, **kwargs):
         # for descendants
@@ -1197,18 +2521,62 @@ class MainCorpus(Corpus):
     def _parse_example(self,
                        example: bs4.element.Tag):
         """ Parse example to Example object. """
-        src = Corpus._get_source(example)
-        txt = Corpus._get_text(example)
-        txt = txt[:txt.index(src)]
-        txt = txt[:txt.rindex('[')].strip()
+        new_ex = self.ex_type(*self._parse_fields(example, self._fields))
+        new_ex.mark_found_words(self.marker, defer=True)
+        return new_ex
 
-        doc_url = Corpus._get_doc_url(example)
-        ambiguation = Corpus._get_ambiguation(example)
-        found_words = Corpus._find_searched_words(example)
+    def _parse_page_normal(self,
+                           page: str) -> List:
+        """ Parse page if 'out' is 'normal', lazy examples
+        are cut from the page, see _parse_page_lazy.
+        """
+        if self._lazy:
+            return self._parse_page_lazy(page)
+        return super()._parse_page_normal(page)
+
+    def _parse_page_lazy(self,
+                         page: str) -> List:
+        """ Cut HTML code of the examples from the page without
+        building the soup: the page is parsed by lxml, only found
+        wordforms are got now, other fields are got on access.
+        """
+        try:
+            root = lxml.html.fromstring(page)
+        except (lxml.etree.ParserError, ValueError) as e:
+            logger.error(f"Error while parsing page:\n{e}")
+            return []
 
-        new_ex = self.ex_type(txt, src, ambiguation, found_words, doc_url)
-        new_ex.mark_found_words(self.marker)
-        return new_ex
+        unfold = functools.partial(
+            Corpus._unfold_fragment, fields=self._fields,
+            intern=self._interned.setdefault)
+        find_words = 'found_wordforms' in self._fields
+        # text is cut at the source
+        find_source = 'txt' in self._fields or 'src' in self._fields
+        res = []
+        # examples are 'li' in the doc 'li' as in _parse_page_normal
+        for doc in root.iter('li'):
+            examples = list(doc.iterdescendants('li'))
+            # the doc is dropped as _parse_page_normal does
+            if find_source and any(
+                    Corpus._find_element(example, 'span', 'doc') is None
+                    for example in examples):
+                logger.error("Error while parsing doc:\n"
+                             "the example has no source")
+                continue
+
+            for example in examples:
+                found_words = []
+                if find_words:
+                    found_words = Corpus._find_searched_words_in_element(
+                        example)
+                fragment = lxml.html.tostring(
+                    example, encoding='unicode', with_tail=False)
+
+                new_ex = self.ex_type.from_fragment(
+                    fragment, found_words, unfold)
+                new_ex.mark_found_words(self.marker, defer=True)
+                res += [new_ex]
+        return res
 
     def _parse_doc(self,
                    doc: bs4.element.Tag) -> List[expl.MainExample]:
@@ -1221,7 +2589,6 @@ class MainCorpus(Corpus):
         for example in doc.find_all('li'):
             new_ex = self._parse_example(example)
             res += [new_ex]
-            self._add_wordforms(new_ex.found_wordforms)
         return res
 
 
@@ -1281,37 +2648,29 @@ class ParallelCorpus(Corpus):
         """ Parse one element of the pair: original – translation.
         Means parse original or translation.
         """
-        src = Corpus._get_source(text)
-        txt = Corpus._get_text(text)
-        # remove source from text
-        txt = txt[:txt.index(src)]
-        txt = txt[:txt.rindex('[')].strip()
-
-        found_words = Corpus._find_searched_words(text)
+        txt, src, ambiguation, found_words, doc_url = self._parse_fields(
+            text, self._fields)
 
         new_txt = self.ex_type(
             txt={lang: txt},
             src=src,
-            ambiguation=Corpus._get_ambiguation(text),
+            ambiguation=ambiguation,
             found_wordforms=found_words,
-            doc_url=Corpus._get_doc_url(text)
+            doc_url=doc_url
         )
-        new_txt.mark_found_words(self.marker)
+        new_txt.mark_found_words(self.marker, defer=True)
         return new_txt
 
     def _parse_example(self,
                        tag: bs4.element.Tag) -> Any:
         """ Parse a pair: original – translation to Example. """
-        # this example is expected to have default args
-        result_example = self.ex_type()
-
         langs = tag.find_all('td', {'class': "para-lang"})
         texts = tag.find_all('li')
-        for lang, text in zip(langs, texts):
-            lang = lang.text.strip()
-            new_txt = self._parse_text(lang, text)
-            result_example += new_txt
-        return result_example
+        # the texts are joined at once
+        return self.ex_type.join(
+            self._parse_text(lang.text.strip(), text)
+            for lang, text in zip(langs, texts)
+        )
 
     def _parse_doc(self,
                    doc: bs4.element.Tag) -> List:
@@ -1320,57 +2679,117 @@ class ParallelCorpus(Corpus):
         for example in doc.find_all('table', {'class': 'para'}):
             new_ex = self._parse_example(example)
             res += [new_ex]
-            self._add_wordforms(new_ex.found_wordforms)
         return res
 
-    def _load_data(self) -> List:
-        """ Load data from csv file. """
-        if self.out == 'kwic':
-            return super()._load_data()
-
-        with self.file.open('r', encoding='utf-8') as f:
-            dm = self._DATA_W_DELIMITER
-            qch = self._DATA_W_QUOTCHAR
-            reader = csv.reader(f, delimiter=dm, quotechar=qch)
-
-            columns = next(reader)
-            end_lang_tags = columns.index('source')
-            lang_tags = columns[:end_lang_tags]
-            data = []
-
-            for row in reader:
-                # to create dict {lang: text in the lang}
-                langs = {}
-                for num, lang in enumerate(lang_tags):
-                    langs[lang] = row[num]
+    def _csv_rows(self,
+                  start: int = 0) -> Iterator[List[Any]]:
+        """ Texts of the example are stored in one column,
+        so the values are got from the examples.
+        """
+        return (
+            self._csv_items(self._data[index])
+            for index in range(start, len(self._data))
+        )
 
-                new_ex = self.ex_type(langs, *row[end_lang_tags:])
-                data += [new_ex]
+    def _parse_json_example(self,
+                            doc: Dict[str, Any],
+                            example: Dict[str, Any]) -> Any:
+        """ Convert the pair from JSON search results to Example obj,
+        texts are in "texts": {language tag: text}.
+        """
+        if self.out == 'kwic':
+            return super()._parse_json_example(doc, example)
+        return self.ex_type(*self._parse_json_fields(doc, example, 'texts'))
 
-                self._add_wordforms(new_ex.found_wordforms)
+    def _row_parser(self,
+                    columns: List[str]) -> Callable:
+        """ Texts in the languages are the first columns. """
+        if self.out == 'kwic':
+            return super()._row_parser(columns)
 
-        return data
+        # the examples share the languages
+        lang_tags = tuple(columns[:columns.index('source')])
+        return functools.partial(example_from_row, self.ex_type, lang_tags)
 
 
 class MultilingualParaCorpus(ParallelCorpus):
     _MODE = 'multi'
+    # language tags of the csv file, they are set when
+    # the file is loaded or dumped, see _data_to_csv
+    _csv_langs = ()
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs,
                          ex_type=expl.MultilingualParaExample)
         self._params['mode'] = self._MODE
 
-    def _from_file(self) -> None:
-        msg = f"Working with files not supported" \
-              f" in {self.__class__.__name__}"
-        logger.error(msg)
-        raise NotImplementedError(msg)
+    def _languages(self,
+                   start: int = 0) -> List[str]:
+        """ Get sorted language tags of the examples from the start. """
+        schemas = {
+            self._data[index].langs
+            for index in range(start, len(self._data))
+        }
+        return sorted(set().union(*schemas))
 
-    def dump(self) -> None:
-        msg = f"Working with files not supported" \
-              f" in {self.__class__.__name__}"
-        logger.error(msg)
-        raise NotImplementedError(msg)
+    def _csv_columns(self) -> List[str]:
+        """ The examples have texts in different languages, so
+        the first columns are the languages of all examples.
+        """
+        if self.out == 'kwic':
+            return super()._csv_columns()
+
+        example = self[0]
+        fields = example.columns[len(example.langs):]
+        return list(self._csv_langs) + fields
+
+    def _csv_items(self,
+                   example: Any) -> List[Any]:
+        """ Texts in the languages which the example
+        does not have are empty.
+        """
+        if self.out == 'kwic':
+            return super()._csv_items(example)
+
+        texts = [
+            example[lang] or ''
+            for lang in self._csv_langs
+        ]
+        return texts + example.items[len(example.langs):]
+
+    def _data_to_csv(self,
+                     start: int = 0) -> None:
+        """ Dump the data to csv file, if the appended examples
+        have new languages, the file is rewritten.
+
+        :param start: int, index of the first example to write, if it
+         is not 0, the examples are appended to the file.
+        :return: None.
+        """
+        if start and self.out != 'kwic':
+            # languages of the dumped examples are in the file,
+            # only the appended examples are checked
+            if not set(self._languages(start)) <= set(self._csv_langs):
+                logger.info("There are new languages, "
+                            "the file will be rewritten")
+                start = 0
+        if not start:
+            self._csv_langs = tuple(self._languages())
+
+        super()._data_to_csv(start)
+
+    def _row_parser(self,
+                    columns: List[str]) -> Callable:
+        """ Texts in the languages are the first columns,
+        empty ones are skipped.
+        """
+        if self.out == 'kwic':
+            return super()._row_parser(columns)
+
+        lang_tags = tuple(columns[:columns.index('source')])
+        self._csv_langs = lang_tags
+        return functools.partial(
+            example_from_sparse_row, self.ex_type, lang_tags)
 
 
 class TutoringCorpus(MainCorpus):
@@ -1426,16 +2845,7 @@ class MultimodalCorpus(Corpus):
                        example: bs4.element.Tag) -> Tuple[
         str, str, str, list, str]:
         """ Parse example get text, source etc. """
-        src = Corpus._get_source(example)
-        txt = Corpus._get_text(example)
-        txt = txt[:txt.index(src)]
-        txt = txt[:txt.rindex('[')].strip()
-
-        doc_url = Corpus._get_doc_url(example)
-        ambiguation = Corpus._get_ambiguation(example)
-        found_words = Corpus._find_searched_words(example)
-
-        return txt, src, ambiguation, found_words, doc_url
+        return self._parse_fields(example, self._fields)
 
     def _parse_media(self,
                      media: bs4.element.Tag) -> Tuple[str, str]:
@@ -1463,12 +2873,24 @@ class MultimodalCorpus(Corpus):
         data_from_example = self._parse_example(example)
 
         new_ex = self.ex_type(*data_from_example, media_url, filename)
-        new_ex.mark_found_words(self.marker)
-        self._add_wordforms(new_ex.found_wordforms)
+        new_ex.mark_found_words(self.marker, defer=True)
         examples += [new_ex]
 
         return examples
 
+    def _parse_json_example(self,
+                            doc: Dict[str, Any],
+                            example: Dict[str, Any]) -> Any:
+        """ Convert the example from JSON search results to Example obj,
+        media file is in the document: "media_url" and "filename".
+        """
+        if self.out == 'kwic':
+            return super()._parse_json_example(doc, example)
+
+        filename = self.MEDIA_FOLDER / doc.get('filename', '')
+        return self.ex_type(*self._parse_json_fields(doc, example),
+                            doc.get('media_url', ''), filename)
+
     def download_all(self) -> None:
         """ Download all files. """
         os.makedirs(self.MEDIA_FOLDER, exist_ok=True)
@@ -0,0 +1,428 @@
+"""
+Module for indexes of Corpus examples, they are
+updated with the data and answer queries without scanning it.
+"""
+
+__all__ = (
+    'FingerprintIndex',
+    'WordformIndex',
+    'TokenIndex',
+    'required_literals',
+)
+
+import logging
+import re
+from typing import Any, Callable, Dict, Iterable, List, Pattern, Set
+
+# the parser of re is private, without it the literals
+# are not found and the search is not narrowed
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:
+    try:
+        # python < 3.11
+        import sre_constants
+        import sre_parse
+    except ImportError:
+        sre_constants = sre_parse = None
+
+logger = logging.getLogger("rnc")
+
+# words of the texts to index
+TOKEN_PATTERN = re.compile(r'\w+')
+# shorter literals are not used to narrow the search
+MIN_LITERAL_LENGTH = 3
+# length of the parts of the tokens they are found by,
+# it must not be greater than MIN_LITERAL_LENGTH
+GRAM_LENGTH = 3
+
+
+def _literal_runs(parsed: Any,
+                  runs: List[str],
+                  current: List[str]) -> List[str]:
+    """ Add strings of consecutive literals of the parsed pattern to runs.
+
+    :return: list of str, chars of the last run.
+    """
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            current.append(chr(av))
+        elif op is sre_constants.AT:
+            # anchors do not consume chars
+            continue
+        elif op is sre_constants.SUBPATTERN:
+            # the group is matched once, it continues the run
+            current = _literal_runs(av[-1], runs, current)
+        else:
+            runs.append(''.join(current))
+            current = []
+    return current
+
+
+def required_literals(pattern: Pattern or str,
+                      flags: int = 0) -> List[str]:
+    """ Get strings every match of the pattern contains.
+
+    :param pattern: compiled pattern or str.
+    :param flags: int, flags of the pattern.
+    :return: list of str, casefolded literals, empty if the pattern
+     is not str, it is wrong or the parser of re is not available.
+    """
+    if isinstance(pattern, re.Pattern):
+        pattern, flags = pattern.pattern, pattern.flags
+    if not isinstance(pattern, str) or sre_parse is None:
+        return []
+
+    runs = []
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+        runs.append(''.join(_literal_runs(parsed, runs, [])))
+    except re.error:
+        return []
+    except (AttributeError, TypeError, ValueError):
+        # the parser of re is private, it might be changed
+        logger.debug(f"Literals of the pattern are not found: '{pattern}'")
+        return []
+    return [
+        run.casefold()
+        for run in runs
+        if len(run) >= MIN_LITERAL_LENGTH
+    ]
+
+
+class FingerprintIndex:
+    """ Counts of examples' fingerprints: equal examples
+    have the same fingerprint (see Example.fingerprint).
+    """
+    __slots__ = '_counts',
+
+    def __init__(self,
+                 examples: Iterable = None) -> None:
+        """
+        :param examples: iterable of Example objects to add. Optional.
+        :return: None.
+        """
+        # {fingerprint: count of examples with it}
+        self._counts = {}
+        for example in examples or ():
+            self.add(example)
+
+    def add(self,
+            example: Any) -> None:
+        """ Add the example.
+
+        :param example: Example object.
+        :return: None.
+        """
+        fingerprint = example.fingerprint
+        self._counts[fingerprint] = self._counts.get(fingerprint, 0) + 1
+
+    def remove(self,
+               example: Any) -> None:
+        """ Remove the example, if there are no equal ones
+        it is not in the index after that.
+
+        :param example: Example object.
+        :return: None.
+        :exception KeyError: if the example is not in the index.
+        """
+        fingerprint = example.fingerprint
+        count = self._counts[fingerprint]
+        if count == 1:
+            del self._counts[fingerprint]
+        else:
+            self._counts[fingerprint] = count - 1
+
+    def count(self,
+              example: Any) -> int:
+        """ Get count of the examples equal to the given one. """
+        return self._counts.get(example.fingerprint, 0)
+
+    def __contains__(self,
+                     example: Any) -> bool:
+        """ Whether there is the example equal to the given one. """
+        return example.fingerprint in self._counts
+
+    def __len__(self) -> int:
+        """ Count of unique examples. """
+        return len(self._counts)
+
+
+class WordformIndex:
+    """ Found wordforms of examples: their frequency
+    and examples containing them.
+
+    Examples are indexed by identity, so an example changed
+    in place is removed with the wordforms it was added with.
+    If the examples are not kept (they are created on access
+    from the storage), only frequency is indexed and
+    the examples cannot be removed.
+    """
+    __slots__ = (
+        '_normalize', '_keep_examples', '_counts', '_examples', '_forms')
+
+    def __init__(self,
+                 normalize: Callable,
+                 examples: Iterable = None,
+                 keep_examples: bool = True) -> None:
+        """
+        :param normalize: callable, function to normalize wordforms.
+        :param examples: iterable of Example objects to add. Optional.
+        :param keep_examples: bool, whether the examples will be kept
+         to find them by wordforms. Optional, True by default.
+        :return: None.
+        """
+        self._normalize = normalize
+        self._keep_examples = keep_examples
+        # {form: frequency}
+        self._counts = {}
+        # {form: {id of example: example}}
+        self._examples = {}
+        # {id of example: its normalized forms}
+        self._forms = {}
+        for example in examples or ():
+            self.add(example)
+
+    @property
+    def keeps_examples(self) -> bool:
+        """ Whether the examples are kept. """
+        return self._keep_examples
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """ Get frequency of the wordforms, {form: frequency}.
+        It must not be changed.
+        """
+        return self._counts
+
+    def add(self,
+            example: Any) -> None:
+        """ Add the example.
+
+        :param example: Example object.
+        :return: None.
+        """
+        forms = self.count(example.found_wordforms)
+        if not self._keep_examples:
+            return
+
+        key = id(example)
+        self._forms[key] = forms
+        for form in forms:
+            self._examples.setdefault(form, {})[key] = example
+
+    def count(self,
+              forms: Iterable[str]) -> List[str]:
+        """ Count found wordforms of an example without adding it,
+        e.g. when the examples are not kept.
+
+        :param forms: iterable of str, found wordforms.
+        :return: list of str, normalized wordforms.
+        """
+        forms = [
+            self._normalize(form)
+            for form in forms
+        ]
+        for form in forms:
+            self._counts[form] = self._counts.get(form, 0) + 1
+        return forms
+
+    def remove(self,
+               example: Any) -> None:
+        """ Remove the example.
+
+        :param example: Example object.
+        :return: None.
+        :exception KeyError: if the example is not in the index
+         or the examples are not kept.
+        """
+        key = id(example)
+        forms = self._forms.pop(key)
+        for form in forms:
+            count = self._counts[form] - 1
+            if count:
+                self._counts[form] = count
+            else:
+                del self._counts[form]
+
+        for form in set(forms):
+            examples = self._examples[form]
+            del examples[key]
+            if not examples:
+                del self._examples[form]
+
+    def frequency(self,
+                  form: str) -> int:
+        """ Get frequency of the wordform. """
+        return self._counts.get(self._normalize(form), 0)
+
+    def examples(self,
+                 form: str) -> List[Any]:
+        """ Get examples containing the wordform,
+        empty list if the examples are not kept.
+        """
+        examples = self._examples.get(self._normalize(form), {})
+        return list(examples.values())
+
+
+class TokenIndex:
+    """ Inverted index of tokens (words) of the examples' texts, it
+    gives positions of the examples which might contain strings.
+
+    Texts are casefolded, so the search is case insensitive.
+    Texts which are not str are not indexed, they are always candidates.
+    """
+    __slots__ = '_postings', '_grams', '_keys', '_unindexed', '_next_key'
+
+    def __init__(self,
+                 texts: Iterable = None) -> None:
+        """
+        :param texts: iterable of texts of the examples. Optional.
+        :return: None.
+        """
+        # {token: keys of the texts containing it}
+        self._postings = {}
+        # {part of GRAM_LENGTH chars: tokens containing it},
+        # tokens containing a string are found by its parts
+        self._grams = {}
+        # key of the text at each position
+        self._keys = []
+        # keys of the texts which are not indexed
+        self._unindexed = set()
+        self._next_key = 0
+        for text in texts or ():
+            self.insert(len(self._keys), text)
+
+    @staticmethod
+    def tokens(text: str) -> Set[str]:
+        """ Get casefolded tokens of the text. """
+        return set(TOKEN_PATTERN.findall(text.casefold()))
+
+    @staticmethod
+    def grams(token: str) -> Set[str]:
+        """ Get parts of GRAM_LENGTH chars of the token. """
+        return {
+            token[start:start + GRAM_LENGTH]
+            for start in range(len(token) - GRAM_LENGTH + 1)
+        }
+
+    def _add(self,
+             key: int,
+             text: Any) -> None:
+        if not isinstance(text, str):
+            self._unindexed.add(key)
+            return
+        for token in self.tokens(text):
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+                for gram in self.grams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+            keys.add(key)
+
+    def _discard(self,
+                 key: int,
+                 text: Any) -> None:
+        if not isinstance(text, str):
+            self._unindexed.discard(key)
+            return
+        for token in self.tokens(text):
+            keys = self._postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[token]
+                    self._discard_grams(token)
+
+    def _discard_grams(self,
+                       token: str) -> None:
+        for gram in self.grams(token):
+            tokens = self._grams[gram]
+            tokens.discard(token)
+            if not tokens:
+                del self._grams[gram]
+
+    def _containing(self,
+                    part: str) -> Set[str]:
+        """ Get tokens containing the part, they are
+        looked for among the tokens with its rarest gram.
+        """
+        tokens = min(
+            (self._grams.get(gram, ()) for gram in self.grams(part)),
+            key=len
+        )
+        return {
+            token
+            for token in tokens
+            if part in token
+        }
+
+    def insert(self,
+               position: int,
+               text: Any) -> None:
+        """ Insert the text before the position. """
+        key = self._next_key
+        self._next_key += 1
+        self._keys.insert(position, key)
+        self._add(key, text)
+
+    def replace(self,
+                position: int,
+                old_text: Any,
+                new_text: Any) -> None:
+        """ Replace the text at the position. """
+        key = self._keys[position]
+        self._discard(key, old_text)
+        self._add(key, new_text)
+
+    def delete(self,
+               item: int or slice,
+               texts: List[Any]) -> None:
+        """ Delete the texts at the index or several ones.
+
+        :param item: int or slice, position of the texts.
+        :param texts: list of deleted texts.
+        :return: None.
+        """
+        keys = self._keys[item]
+        if isinstance(item, int):
+            keys = [keys]
+        del self._keys[item]
+
+        for key, text in zip(keys, texts):
+            self._discard(key, text)
+
+    def candidates(self,
+                   literals: List[str]) -> List[int] or None:
+        """ Get positions of the texts containing all the literals.
+
+        Every word part of a literal is a part of some token
+        of the text, so the texts containing such tokens are taken.
+        The tokens are found by the parts of GRAM_LENGTH chars.
+
+        :param literals: list of str, strings to find.
+        :return: list of int or None if the literals are too
+         short to narrow the search.
+        """
+        keys = None
+        for literal in literals:
+            for part in self.tokens(literal):
+                if len(part) < MIN_LITERAL_LENGTH:
+                    continue
+                found = set()
+                for token in self._containing(part):
+                    found |= self._postings[token]
+                keys = found if keys is None else keys & found
+
+        if keys is None:
+            return None
+
+        keys |= self._unindexed
+        return [
+            position
+            for position, key in enumerate(self._keys)
+            if key in keys
+        ]
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,1363 @@
+"""
+Module for storing examples of a Corpus
+not as a plain list of Example objects.
+"""
+
+__all__ = (
+    'ExampleTable',
+    'DataView',
+    'SpilledList',
+    'SqliteStore',
+    'MappedCsv',
+    'MappedSqlite',
+    'SharedExamples',
+    'share_examples',
+    'unlink_shared',
+    'encode_record',
+    'RecordStream',
+    'open_text',
+    'write_indexed_csv',
+    'read_index',
+    'COMPRESSIONS',
+)
+
+import csv
+import gzip
+import io
+import itertools
+import logging
+import lzma
+import mmap
+import os
+import sqlite3
+import tempfile
+from array import array
+from pathlib import Path
+from collections.abc import MutableSequence, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+import ujson
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # python < 3.8
+    resource_tracker = shared_memory = None
+
+logger = logging.getLogger("rnc")
+
+# ways to compress the files and suffixes of the compressed files
+COMPRESSIONS = {
+    'gzip': '.gz',
+    'xz': '.xz',
+    'zstd': '.zst',
+}
+# default gzip level is slow for large dumps
+GZIP_LEVEL = 6
+
+# records are written to shared memory by batches of this size
+SHARED_BATCH_SIZE = 1 << 20
+
+# these fields are repeated in many examples,
+# so they are stored as codes of the unique values
+ENCODED_FIELDS = (
+    'src', 'ambiguation', 'doc_url', 'media_url'
+)
+
+
+def check_compression(compression: str) -> None:
+    """ Check the compression might be used.
+
+    :param compression: str, name of the compression.
+    :return: None.
+    :exception ValueError: if the compression is wrong.
+    :exception ImportError: if zstd is given, but zstandard is not installed.
+    """
+    if compression not in COMPRESSIONS:
+        msg = f"'{compression}' is wrong compression, " \
+              f"expected: {tuple(COMPRESSIONS)}"
+        logger.error(msg)
+        raise ValueError(msg)
+    if compression == 'zstd' and zstandard is None:
+        msg = "zstandard package is required to use zstd compression"
+        logger.error(msg)
+        raise ImportError(msg)
+
+
+def open_text(path: str or Path,
+              mode: str = 'r',
+              compression: str = None) -> Any:
+    """ Open the text file in utf-8, the compressed file is
+    (de)compressed while reading or writing.
+
+    :param path: str or Path, the file.
+    :param mode: str, 'r', 'w' or 'a'. Optional, 'r' by default.
+    :param compression: str, 'gzip', 'xz' or 'zstd'. Optional,
+     the file is not compressed by default.
+    :return: text file obj.
+    :exception ValueError: if the compression is wrong.
+    :exception ImportError: if zstd is given, but zstandard is not installed.
+    """
+    if compression is None:
+        return Path(path).open(mode, encoding='utf-8', newline='')
+
+    check_compression(compression)
+    mode = f"{mode}t"
+    if compression == 'gzip':
+        return gzip.open(path, mode, compresslevel=GZIP_LEVEL,
+                         encoding='utf-8', newline='')
+    if compression == 'xz':
+        return lzma.open(path, mode, encoding='utf-8', newline='')
+    return zstandard.open(path, mode, encoding='utf-8', newline='')
+
+
+def check_shared_memory() -> None:
+    """ Check shared memory might be used.
+
+    :return: None.
+    :exception ImportError: if there is no multiprocessing.shared_memory.
+    """
+    if shared_memory is None:
+        msg = "Shared memory requires python 3.8 or newer"
+        logger.error(msg)
+        raise ImportError(msg)
+
+
+def encode_record(example: Any) -> str:
+    """ Dump the record of the example to JSON, paths
+    are already str there (see MultimodalExample.record).
+
+    :param example: Example object.
+    :return: str, JSON array.
+    """
+    return ujson.dumps(example.record, ensure_ascii=False)
+
+
+class RecordStream:
+    """ Records of the examples pickled as one flat stream of
+    values: the pickler takes them from the examples by batches,
+    so the storage is not loaded to memory. It is unpickled as the
+    list of the values, see records().
+    """
+    __slots__ = '_examples',
+
+    def __init__(self,
+                 examples: Iterable[Any]) -> None:
+        """
+        :param examples: iterable of Example objects.
+        :return: None.
+        """
+        self._examples = examples
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Iterate over the values of all records. """
+        return itertools.chain.from_iterable(
+            example.record for example in self._examples)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """ The values are appended to the empty list while
+        pickling, it is what is unpickled.
+        """
+        return list, (), None, iter(self)
+
+    @staticmethod
+    def records(values: Iterable[Any],
+                width: int) -> Iterator[List[Any]]:
+        """ Split the values to the records.
+
+        :param values: iterable of any types, unpickled
+         stream or RecordStream obj.
+        :param width: int, count of the fields of the record.
+        :return: yield lists of values.
+        """
+        values = iter(values)
+        while True:
+            record = list(itertools.islice(values, width))
+            if not record:
+                return
+            yield record
+
+
+class ExampleTable(MutableSequence):
+    """ Columnar storage of examples: one column per field of the
+    example record, repeated fields (source, URL etc.) are stored as
+    codes of their unique values.
+
+    Examples are created on demand, so changing
+    them does not change the table, set them back.
+    """
+
+    def __init__(self,
+                 ex_type: Any,
+                 examples: Iterable = None) -> None:
+        """
+        :param ex_type: type of Example objects.
+        :param examples: iterable of ex_type objects to add. Optional.
+        :return: None.
+        """
+        self._ex_type = ex_type
+        self._fields = ex_type._RECORD_FIELDS
+        self._columns = {
+            field: array('l') if field in ENCODED_FIELDS else []
+            for field in self._fields
+        }
+        # unique values of encoded fields and their codes
+        self._values = {
+            field: []
+            for field in self._fields
+            if field in ENCODED_FIELDS
+        }
+        self._codes = {
+            field: {}
+            for field in self._values
+        }
+
+        if examples is not None:
+            self.extend(examples)
+
+    @property
+    def ex_type(self) -> Any:
+        """ Get type of Example objects. """
+        return self._ex_type
+
+    @property
+    def fields(self) -> Tuple[str]:
+        """ Get names of the columns. """
+        return self._fields
+
+    def _encode(self,
+                field: str,
+                value: Any) -> int:
+        """ Get code of the value, add it if it's new. """
+        codes = self._codes[field]
+        try:
+            return codes[value]
+        except KeyError:
+            code = codes[value] = len(self._values[field])
+        except TypeError:
+            # unhashable values are not shared
+            code = len(self._values[field])
+        self._values[field].append(value)
+        return code
+
+    def _encode_record(self,
+                       example: Any) -> List[Any]:
+        """ Get values of the example to store in the columns.
+
+        :exception TypeError: if the example has wrong type.
+        """
+        if not isinstance(example, self.ex_type):
+            msg = f"{self.ex_type} expected, but {type(example)} found"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        return [
+            self._encode(field, value) if field in self._values else value
+            for field, value in zip(self.fields, example.record)
+        ]
+
+    def _new(self) -> Any:
+        """ Create an empty table with the same unique values.
+
+        Unique values are only appended, so they
+        might be shared between tables.
+        """
+        new_table = self.__class__(self.ex_type)
+        new_table._values = self._values
+        new_table._codes = self._codes
+        return new_table
+
+    def column(self,
+               field: str) -> List[Any]:
+        """ Get all values of the field.
+
+        :exception KeyError: if there is no such field.
+        """
+        column = self._columns[field]
+        if field in self._values:
+            values = self._values[field]
+            return [values[code] for code in column]
+        return list(column)
+
+    def value(self,
+              index: int,
+              field: str) -> Any:
+        """ Get value of the field of the example at the index
+        without creating it.
+
+        :exception KeyError: if there is no such field.
+        :exception IndexError: if there is no such example.
+        """
+        value = self._columns[field][index]
+        if field in self._values:
+            return self._values[field][value]
+        return value
+
+    def rows(self,
+             start: int = 0) -> Iterator[Tuple[Any]]:
+        """ Iterate over records of examples from the
+        start without creating them.
+        """
+        columns = []
+        for field, column in self._columns.items():
+            column = itertools.islice(column, start, None)
+            if field in self._values:
+                column = map(self._values[field].__getitem__, column)
+            columns.append(column)
+        return zip(*columns)
+
+    def take(self,
+             indexes: Iterable[int]) -> Any:
+        """ Create new table with the examples at the indexes. """
+        indexes = list(indexes)
+        new_table = self._new()
+        for field, column in self._columns.items():
+            new_column = new_table._columns[field]
+            new_column.extend(column[index] for index in indexes)
+        return new_table
+
+    def sort(self,
+             key: Any = None,
+             reverse: bool = False) -> None:
+        """ Sort examples, key is applied to Example objects.
+
+        Sort by the text by default, it is read from the column.
+        """
+        if key is None and 'txt' in self._columns:
+            values = self._columns['txt']
+        else:
+            key = key or (lambda example: example.txt)
+            values = [key(example) for example in self]
+        order = sorted(range(len(self)),
+                       key=values.__getitem__,
+                       reverse=reverse)
+        self._columns = self.take(order)._columns
+
+    def copy(self) -> Any:
+        """ Create a copy of the table. """
+        return self.take(range(len(self)))
+
+    def clear(self) -> None:
+        """ Remove all examples. """
+        for column in self._columns.values():
+            del column[:]
+
+    def __getitem__(self,
+                    item: int or slice) -> Any:
+        """ Create the example at the index
+        or new table with sliced examples.
+        """
+        if isinstance(item, slice):
+            return self.take(range(len(self))[item])
+
+        record = [
+            self._values[field][column[item]] if field in self._values else
+            column[item]
+            for field, column in self._columns.items()
+        ]
+        # found wordforms should not be shared with the table
+        record = [
+            value.copy() if isinstance(value, list) else value
+            for value in record
+        ]
+        return self.ex_type(*record)
+
+    def __setitem__(self,
+                    index: int,
+                    example: Any) -> None:
+        """ Change the example at the index. """
+        record = self._encode_record(example)
+        for column, value in zip(self._columns.values(), record):
+            column[index] = value
+
+    def __delitem__(self,
+                    item: int or slice) -> None:
+        """ Delete the example at the index or several ones. """
+        for column in self._columns.values():
+            del column[item]
+
+    def __len__(self) -> int:
+        return len(self._columns[self.fields[0]])
+
+    def insert(self,
+               index: int,
+               example: Any) -> None:
+        """ Insert the example before the index. """
+        record = self._encode_record(example)
+        for column, value in zip(self._columns.values(), record):
+            column.insert(index, value)
+
+    def append(self,
+               example: Any) -> None:
+        """ Add the example to the end. """
+        record = self._encode_record(example)
+        for column, value in zip(self._columns.values(), record):
+            column.append(value)
+
+    def __eq__(self,
+               other: Any) -> bool:
+        """ Whether the examples are equal. """
+        try:
+            return len(self) == len(other) and all(
+                lhs == rhs for lhs, rhs in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.ex_type.__name__}, " \
+               f"{len(self)} examples)"
+
+
+class DataView(Sequence):
+    """ Read-only view of a range of examples of a list,
+    ExampleTable or other view. The viewed storage must not be
+    changed while the view exists, copy() it to change.
+    """
+    __slots__ = '_base', '_range'
+
+    def __init__(self,
+                 base: Any,
+                 item: slice = slice(None)) -> None:
+        """
+        :param base: list, ExampleTable or DataView.
+        :param item: slice, range of the examples to view.
+         Optional, all of them by default.
+        :return: None.
+        """
+        if isinstance(base, DataView):
+            self._range = base._range[item]
+            self._base = base._base
+        else:
+            self._range = range(len(base))[item]
+            self._base = base
+
+    @property
+    def base(self) -> Any:
+        """ Get the viewed storage. """
+        return self._base
+
+    def copy(self) -> Any:
+        """ Copy the examples to the storage of the base type,
+        the examples of read only storages (MappedCsv etc.) are
+        copied to list.
+        """
+        if isinstance(self._base, (ExampleTable, SpilledList)):
+            return self._base.take(self._range)
+        start, stop, step = \
+            self._range.start, self._range.stop, self._range.step
+        # stop might be -1 with negative step
+        if stop < 0:
+            stop = None
+        return self._base[start:stop:step]
+
+    def __getitem__(self,
+                    item: int or slice) -> Any:
+        """ Get the example at the index or view of the sliced ones. """
+        if isinstance(item, slice):
+            return DataView(self, item)
+        return self._base[self._range[item]]
+
+    def __iter__(self) -> Iterator[Any]:
+        base = self._base
+        for index in self._range:
+            yield base[index]
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __eq__(self,
+               other: Any) -> bool:
+        """ Whether the examples are equal. """
+        try:
+            return len(self) == len(other) and all(
+                lhs == rhs for lhs, rhs in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}" \
+               f"({type(self._base).__name__}, {self._range})"
+
+
+class SpilledList(MutableSequence):
+    """ List of examples keeping in memory not more than the limit of
+    them, the older ones are spilled to the temporary file (segment)
+    as JSON lines with their records and read on access.
+
+    The segment is only appended, examples are addressed by the
+    offsets of their lines, so changing an example on disk writes
+    it again. Examples read from disk are new objects, so changing
+    them does not change the list, set them back.
+    """
+
+    def __init__(self,
+                 ex_type: Any,
+                 memory_limit: int,
+                 folder: str or Path,
+                 examples: Iterable = None) -> None:
+        """
+        :param ex_type: type of Example objects.
+        :param memory_limit: int, count of examples kept in memory.
+        :param folder: str or Path, where the segment will be created.
+        :param examples: iterable of ex_type objects to add. Optional.
+        :return: None.
+        :exception ValueError: if the limit is not positive.
+        """
+        if memory_limit < 1:
+            msg = f"Memory limit must be positive, but {memory_limit} found"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        self._ex_type = ex_type
+        self._memory_limit = memory_limit
+        self._folder = Path(folder)
+        # offsets of the spilled examples, they are the first ones
+        self._offsets = array('q')
+        # the newer examples
+        self._memory = []
+        # the segment is created on the first spilling
+        self._segment = None
+
+        if examples is not None:
+            self.extend(examples)
+
+    @property
+    def ex_type(self) -> Any:
+        """ Get type of Example objects. """
+        return self._ex_type
+
+    @property
+    def spilled(self) -> int:
+        """ Get count of examples on disk. """
+        return len(self._offsets)
+
+    def _write(self,
+               examples: Iterable[Any]) -> List[int]:
+        """ Write the examples to the end of the segment.
+
+        :return: list of int, offsets of their lines.
+        """
+        if self._segment is None:
+            os.makedirs(self._folder, exist_ok=True)
+            # the file is removed when it is closed
+            self._segment = tempfile.TemporaryFile(
+                'w+b', dir=self._folder, suffix='.jsonl')
+
+        segment = self._segment
+        offset = segment.seek(0, os.SEEK_END)
+        offsets = []
+        for example in examples:
+            line = f"{encode_record(example)}\n".encode('utf-8')
+            segment.write(line)
+            offsets.append(offset)
+            offset += len(line)
+        return offsets
+
+    def _read(self,
+              offset: int) -> Any:
+        """ Read the example from its line in the segment. """
+        self._segment.seek(offset)
+        record = ujson.loads(self._segment.readline())
+        return self.ex_type(*record)
+
+    def _spill(self) -> None:
+        """ Spill the older examples from memory if there are
+        more of them than the limit, a half of the limit is kept.
+        """
+        if len(self._memory) <= self._memory_limit:
+            return
+
+        count = len(self._memory) - self._memory_limit // 2
+        self._offsets.extend(self._write(self._memory[:count]))
+        del self._memory[:count]
+        logger.debug(f"{count} examples spilled to disk")
+
+    def _position(self,
+                  index: int) -> int:
+        """ Get the non negative index.
+
+        :exception IndexError: if there is no such example.
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Index out of range")
+        return index
+
+    def reorder(self,
+                order: List[int]) -> None:
+        """ Put the examples in the order of their indexes,
+        without writing the spilled ones again.
+
+        :param order: list of int, all indexes in new order.
+        :return: None.
+        """
+        offsets, memory = self._offsets, self._memory
+        spilled = len(offsets)
+
+        new_offsets, new_memory, to_write = array('q'), [], []
+        for new_index, index in enumerate(order):
+            if new_index < spilled:
+                if index < spilled:
+                    new_offsets.append(offsets[index])
+                else:
+                    # it will be written below
+                    new_offsets.append(-1)
+                    to_write.append((new_index, memory[index - spilled]))
+            elif index < spilled:
+                new_memory.append(self._read(offsets[index]))
+            else:
+                new_memory.append(memory[index - spilled])
+
+        written = self._write(example for _, example in to_write)
+        for (new_index, _), offset in zip(to_write, written):
+            new_offsets[new_index] = offset
+        self._offsets, self._memory = new_offsets, new_memory
+
+    def sort(self,
+             key: Any = None,
+             reverse: bool = False) -> None:
+        """ Sort examples, key is applied to Example objects.
+        Only the keys are kept in memory.
+
+        Sort by the text by default.
+        """
+        key = key or (lambda example: example.txt)
+        keys = [key(example) for example in self]
+        order = sorted(range(len(keys)),
+                       key=keys.__getitem__,
+                       reverse=reverse)
+        self.reorder(order)
+
+    def take(self,
+             indexes: Iterable[int]) -> Any:
+        """ Create a list of the examples at the indexes,
+        it shares the segment.
+
+        :param indexes: iterable of int, indexes of examples.
+        :return: SpilledList.
+        """
+        new_list = self.__class__(
+            self.ex_type, self._memory_limit, self._folder)
+        new_list._segment = self._segment
+        spilled = len(self._offsets)
+        for index in indexes:
+            if index >= spilled:
+                new_list.append(self._memory[index - spilled])
+            elif not new_list._memory:
+                # the spilled examples are not written again
+                new_list._offsets.append(self._offsets[index])
+            else:
+                new_list.append(self._read(self._offsets[index]))
+        return new_list
+
+    def copy(self) -> Any:
+        """ Create a copy of the list, it shares the segment. """
+        new_list = self.__class__(
+            self.ex_type, self._memory_limit, self._folder)
+        new_list._segment = self._segment
+        new_list._offsets = array('q', self._offsets)
+        new_list._memory = self._memory.copy()
+        return new_list
+
+    def clear(self) -> None:
+        """ Remove all examples. """
+        self._offsets = array('q')
+        self._memory = []
+
+    def __getitem__(self,
+                    item: int or slice) -> Any:
+        """ Get the example at the index or list of sliced examples. """
+        if isinstance(item, slice):
+            return [self[index] for index in range(len(self))[item]]
+
+        index = self._position(item)
+        if index < len(self._offsets):
+            return self._read(self._offsets[index])
+        return self._memory[index - len(self._offsets)]
+
+    def __setitem__(self,
+                    index: int,
+                    example: Any) -> None:
+        """ Change the example at the index. """
+        index = self._position(index)
+        if index < len(self._offsets):
+            self._offsets[index] = self._write([example])[0]
+        else:
+            self._memory[index - len(self._offsets)] = example
+
+    def __delitem__(self,
+                    item: int or slice) -> None:
+        """ Delete the example at the index or several ones. """
+        if isinstance(item, slice):
+            indexes = sorted(range(len(self))[item], reverse=True)
+        else:
+            indexes = [self._position(item)]
+
+        for index in indexes:
+            if index < len(self._offsets):
+                del self._offsets[index]
+            else:
+                del self._memory[index - len(self._offsets)]
+
+    def __iter__(self) -> Iterator[Any]:
+        for offset in self._offsets:
+            yield self._read(offset)
+        yield from self._memory
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._memory)
+
+    def insert(self,
+               index: int,
+               example: Any) -> None:
+        """ Insert the example before the index. """
+        spilled = len(self._offsets)
+        index = min(max(index + len(self) if index < 0 else index, 0),
+                    len(self))
+        if index < spilled:
+            self._offsets.insert(index, self._write([example])[0])
+        else:
+            self._memory.insert(index - spilled, example)
+            self._spill()
+
+    def append(self,
+               example: Any) -> None:
+        """ Add the example to the end. """
+        self._memory.append(example)
+        self._spill()
+
+    def __eq__(self,
+               other: Any) -> bool:
+        """ Whether the examples are equal. """
+        try:
+            return len(self) == len(other) and all(
+                lhs == rhs for lhs, rhs in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.ex_type.__name__}, " \
+               f"{len(self)} examples, {self.spilled} on disk)"
+
+
+class SqliteStore:
+    """ SQLite database with examples, params and stats of a Corpus.
+
+    Examples are stored as JSON records with their source and URL,
+    found wordforms are in the separate table, they are indexed
+    to load or count only the examples matching the filters.
+    """
+    # fields examples might be filtered by
+    FILTERS = ('src', 'doc_url', 'wordform')
+    # count of examples inserted at once
+    BATCH_SIZE = 1000
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS examples (
+        id INTEGER PRIMARY KEY,
+        src TEXT,
+        doc_url TEXT,
+        record TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS wordforms (
+        example_id INTEGER NOT NULL REFERENCES examples (id),
+        form TEXT NOT NULL
+    );
+    """
+    _INDEXES = """
+    CREATE INDEX IF NOT EXISTS examples_src ON examples (src);
+    CREATE INDEX IF NOT EXISTS examples_doc_url ON examples (doc_url);
+    CREATE INDEX IF NOT EXISTS wordforms_form ON wordforms (form);
+    """
+
+    def __init__(self,
+                 path: str or Path) -> None:
+        """
+        :param path: str or Path, the database file.
+        :return: None.
+        """
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        """ Get path to the database file. """
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.path))
+        connection.executescript(self._SCHEMA)
+        return connection
+
+    @staticmethod
+    def _where(where: Dict[str, str]) -> Tuple[str, List[str]]:
+        """ Build WHERE clause of the filters.
+
+        :param where: dict of str, {field: value}.
+        :return: tuple of str and list, the clause and its args.
+        :exception ValueError: if the field is wrong.
+        """
+        conditions, args = [], []
+        for field, value in where.items():
+            if field not in SqliteStore.FILTERS:
+                msg = f"'{field}' is wrong filter, " \
+                      f"expected: {SqliteStore.FILTERS}"
+                logger.error(msg)
+                raise ValueError(msg)
+
+            if field == 'wordform':
+                conditions.append(
+                    "id IN (SELECT example_id FROM wordforms WHERE form = ?)")
+            else:
+                conditions.append(f"{field} = ?")
+            args.append(value)
+
+        if not conditions:
+            return '', args
+        return f" WHERE {' AND '.join(conditions)}", args
+
+    def write(self,
+              examples: Iterable[Any],
+              config: Dict[str, Any],
+              normalize: Callable = str) -> int:
+        """ Replace examples and config in the database.
+
+        :param examples: iterable of Example objects.
+        :param config: dict, params and stats to save, values
+         must be JSON serializable.
+        :param normalize: callable, function to normalize wordforms.
+         Optional, they are not changed by default.
+        :return: int, count of written examples.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM wordforms")
+                connection.execute("DELETE FROM examples")
+                # indexes are built after inserting
+                connection.execute("DROP INDEX IF EXISTS examples_src")
+                connection.execute("DROP INDEX IF EXISTS examples_doc_url")
+                connection.execute("DROP INDEX IF EXISTS wordforms_form")
+                self._write_config(connection, config)
+                count = self._insert(connection, examples, 0, normalize)
+            connection.executescript(self._INDEXES)
+        finally:
+            connection.close()
+        return count
+
+    def append(self,
+               examples: Iterable[Any],
+               config: Dict[str, Any],
+               normalize: Callable = str) -> int:
+        """ Add examples to the end, replace config, see write.
+        Both are changed in one transaction.
+
+        :return: int, count of written examples.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                start, = connection.execute(
+                    "SELECT COALESCE(MAX(id) + 1, 0) FROM examples").fetchone()
+                self._write_config(connection, config)
+                count = self._insert(connection, examples, start, normalize)
+        finally:
+            connection.close()
+        return count
+
+    @staticmethod
+    def _write_config(connection: sqlite3.Connection,
+                      config: Dict[str, Any]) -> None:
+        """ Replace the config. """
+        connection.execute("DELETE FROM meta")
+        connection.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            ((key, ujson.dumps(value, ensure_ascii=False))
+             for key, value in config.items())
+        )
+
+    def _insert(self,
+                connection: sqlite3.Connection,
+                examples: Iterable[Any],
+                start: int,
+                normalize: Callable) -> int:
+        """ Insert the examples in batches, ids start from the given one.
+
+        :return: int, count of inserted examples.
+        """
+        count = 0
+        examples = iter(examples)
+        while True:
+            batch = list(itertools.islice(examples, self.BATCH_SIZE))
+            if not batch:
+                break
+            ids = range(start + count, start + count + len(batch))
+            connection.executemany(
+                "INSERT INTO examples (id, src, doc_url, record) "
+                "VALUES (?, ?, ?, ?)",
+                ((num, str(example.src), str(example.doc_url),
+                  encode_record(example))
+                 for num, example in zip(ids, batch))
+            )
+            connection.executemany(
+                "INSERT INTO wordforms (example_id, form) VALUES (?, ?)",
+                ((num, normalize(form))
+                 for num, example in zip(ids, batch)
+                 for form in example.found_wordforms)
+            )
+            count += len(batch)
+        return count
+
+    def config(self) -> Dict[str, Any]:
+        """ Get params and stats saved with the examples. """
+        connection = self._connect()
+        try:
+            rows = connection.execute("SELECT key, value FROM meta")
+            return {
+                key: ujson.loads(value)
+                for key, value in rows
+            }
+        finally:
+            connection.close()
+
+    def records(self,
+                **where) -> Iterator[List[Any]]:
+        """ Get records of the examples matching the filters,
+        in order they were written. They are read while iterating.
+
+        :keyword src: str, source of the examples.
+        :keyword doc_url: str, URL of the examples.
+        :keyword wordform: str, normalized found wordform.
+        :return: iterator over lists, args of the examples' constructor.
+        :exception ValueError: if the filter is wrong.
+        """
+        clause, args = self._where(where)
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                f"SELECT record FROM examples{clause} ORDER BY id", args)
+            for record, in rows:
+                yield ujson.loads(record)
+        finally:
+            connection.close()
+
+    def ids(self,
+            **where) -> array:
+        """ Get ids of the examples matching the filters,
+        in order they were written, see records.
+
+        :return: array of int.
+        :exception ValueError: if the filter is wrong.
+        """
+        clause, args = self._where(where)
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                f"SELECT id FROM examples{clause} ORDER BY id", args)
+            return array('q', (num for num, in rows))
+        finally:
+            connection.close()
+
+    def count(self,
+              **where) -> int:
+        """ Count the examples matching the filters, see records.
+
+        :exception ValueError: if the filter is wrong.
+        """
+        clause, args = self._where(where)
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                f"SELECT COUNT(*) FROM examples{clause}", args).fetchone()
+            return row[0]
+        finally:
+            connection.close()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.path}')"
+
+
+def index_path(path: str or Path) -> Path:
+    """ Get path to the offsets index of the csv file. """
+    path = Path(path)
+    return path.with_name(f"{path.name}.idx")
+
+
+def read_index(path: str or Path) -> array or None:
+    """ Read offsets index of the csv file, it contains offsets
+    of the rows (except for the header) and size of the file.
+
+    :param path: str or Path, the csv file.
+    :return: array of int or None if there is no index
+     or it does not match the file.
+    """
+    path = Path(path)
+    try:
+        with index_path(path).open('rb') as f:
+            offsets = array('q', f.read())
+    except FileNotFoundError:
+        return None
+
+    if not offsets or offsets[-1] != path.stat().st_size:
+        logger.warning(f"Offsets index does not match the file: '{path}'")
+        return None
+    return offsets
+
+
+def write_indexed_csv(path: str or Path,
+                      rows: Iterable[List[Any]],
+                      header: List[str] = None,
+                      **fmtparams) -> None:
+    """ Write the rows to the uncompressed csv file, their offsets
+    to the index (see read_index).
+
+    If the header is given, the file is written to the temporary one
+    and replaces the old one, so the old file is not broken while writing.
+    Otherwise the rows are appended, if the index does not match the file,
+    it is removed.
+
+    :param path: str or Path, the csv file.
+    :param rows: iterable of lists, rows to write.
+    :param header: list of str, names of the columns. Optional.
+    :param fmtparams: format params of csv.writer.
+    :return: None.
+    """
+    path = Path(path)
+    append = header is None
+    index = index_path(path)
+    target = path if append else path.with_name(f"{path.name}.tmp")
+
+    # offsets of the new rows and the new size
+    offsets = array('q')
+    indexed = not append or read_index(path) is not None
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer, **fmtparams)
+
+    def encode(row: List[Any]) -> bytes:
+        writer.writerow(row)
+        chunk = buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    with target.open('ab' if append else 'wb') as f:
+        position = f.seek(0, os.SEEK_END)
+        if header is not None:
+            position += f.write(encode(header))
+        for row in rows:
+            offsets.append(position)
+            position += f.write(encode(row))
+    offsets.append(position)
+
+    if append and not indexed:
+        try:
+            os.remove(index)
+        except FileNotFoundError:
+            pass
+    elif append:
+        # the old size is replaced with the new offsets
+        with index.open('r+b') as f:
+            f.seek(-offsets.itemsize, os.SEEK_END)
+            offsets.tofile(f)
+    else:
+        tmp_index = index.with_name(f"{index.name}.tmp")
+        with tmp_index.open('wb') as f:
+            offsets.tofile(f)
+        os.replace(target, path)
+        os.replace(tmp_index, index)
+
+
+class MappedCsv(Sequence):
+    """ Read only examples of the csv file, the file is memory-mapped,
+    the rows are found by the offsets index (see read_index)
+    and parsed on access.
+    """
+
+    def __init__(self,
+                 path: str or Path,
+                 offsets: array,
+                 make: Callable,
+                 **fmtparams) -> None:
+        """
+        :param path: str or Path, the csv file.
+        :param offsets: array of int, offsets of the rows and size of the file.
+        :param make: callable, function to create Example obj from the row.
+        :param fmtparams: format params of csv.reader.
+        :return: None.
+        """
+        self._path = Path(path)
+        self._offsets = offsets
+        self._make = make
+        self._fmtparams = fmtparams
+        with self._path.open('rb') as f:
+            # the map is valid after closing the file
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def path(self) -> Path:
+        """ Get path to the csv file. """
+        return self._path
+
+    def _read(self,
+              index: int) -> Any:
+        """ Parse the row at the index. """
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        text = self._map[start:stop].decode('utf-8')
+        row = next(csv.reader(io.StringIO(text, newline=''),
+                              **self._fmtparams))
+        return self._make(row)
+
+    def copy(self) -> List[Any]:
+        """ Read all examples to the list. """
+        return list(self)
+
+    def __getitem__(self,
+                    item: int or slice) -> Any:
+        """ Get the example at the index or list of sliced examples. """
+        if isinstance(item, slice):
+            return [self._read(index) for index in range(len(self))[item]]
+        return self._read(range(len(self))[item])
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Parse the rows one by one. """
+        with self._path.open('rb') as f:
+            f.seek(self._offsets[0])
+            text = io.TextIOWrapper(f, encoding='utf-8', newline='')
+            reader = csv.reader(text, **self._fmtparams)
+            for row in itertools.islice(reader, len(self)):
+                yield self._make(row)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.path}', {len(self)} rows)"
+
+
+class MappedSqlite(Sequence):
+    """ Read only examples of SQLite database matching the filters,
+    only their ids are kept, the records are read on access.
+    """
+
+    def __init__(self,
+                 store: SqliteStore,
+                 ex_type: Any,
+                 **where) -> None:
+        """
+        :param store: SqliteStore obj, the database.
+        :param ex_type: type of Example objects.
+        :param where: filters of the examples, see SqliteStore.records.
+        :return: None.
+        :exception ValueError: if the filter is wrong.
+        """
+        self._store = store
+        self._ex_type = ex_type
+        self._where = where
+        self._ids = store.ids(**where)
+        # the connection is opened on the first access
+        self._connection = None
+
+    @property
+    def path(self) -> Path:
+        """ Get path to the database file. """
+        return self._store.path
+
+    def _read(self,
+              index: int) -> Any:
+        """ Read the record at the index. """
+        if self._connection is None:
+            self._connection = sqlite3.connect(str(self.path))
+        record, = self._connection.execute(
+            "SELECT record FROM examples WHERE id = ?",
+            (self._ids[index],)).fetchone()
+        return self._ex_type(*ujson.loads(record))
+
+    def copy(self) -> List[Any]:
+        """ Read all examples to the list. """
+        return list(self)
+
+    def __getitem__(self,
+                    item: int or slice) -> Any:
+        """ Get the example at the index or list of sliced examples. """
+        if isinstance(item, slice):
+            return [self._read(index) for index in range(len(self))[item]]
+        return self._read(range(len(self))[item])
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Read the records one by one, the examples
+        added to the database after mapping are skipped.
+        """
+        records = self._store.records(**self._where)
+        for record in itertools.islice(records, len(self)):
+            yield self._ex_type(*record)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.path}', {len(self)} rows)"
+
+
+def share_examples(examples: Sequence,
+                   config: Dict[str, Any],
+                   name: str = None) -> Any:
+    """ Publish the config and records of the examples to new shared
+    memory block, see SharedExamples. The block is kept until it
+    is unlinked by the caller, see unlink_shared.
+
+    Layout: count of the examples, size of the config, offsets
+    of the records (count + 1 int64), the config in JSON,
+    the records in JSON one after another.
+
+    The records are encoded twice: to measure the block and to write
+    them there, so they are not kept in memory besides the block.
+
+    :param examples: sequence of Example objects, it is iterated twice.
+    :param config: dict, params of the Corpus.
+    :param name: str, name of the block. Optional, random by default.
+    :return: SharedMemory obj.
+    :exception ImportError: if there is no multiprocessing.shared_memory.
+    :exception FileExistsError: if the block with the name exists.
+    """
+    check_shared_memory()
+    config = ujson.dumps(config, ensure_ascii=False).encode('utf-8')
+
+    offsets = array('q', [0])
+    for example in examples:
+        size = len(encode_record(example).encode('utf-8'))
+        offsets.append(offsets[-1] + size)
+    header = array('q', [len(offsets) - 1, len(config)])
+    prefix = b''.join((header.tobytes(), offsets.tobytes(), config))
+
+    start = len(prefix)
+    memory = shared_memory.SharedMemory(
+        name=name, create=True, size=start + offsets[-1])
+    memory.buf[:start] = prefix
+
+    position, batch = start, bytearray()
+    for example in examples:
+        batch += encode_record(example).encode('utf-8')
+        if len(batch) >= SHARED_BATCH_SIZE:
+            memory.buf[position:position + len(batch)] = batch
+            position += len(batch)
+            batch = bytearray()
+    memory.buf[position:position + len(batch)] = batch
+    return memory
+
+
+def _tracked_name(memory: Any) -> str:
+    """ Get name of the block in the resource tracker: on POSIX
+    SharedMemory registers the public name with leading slash.
+
+    :param memory: SharedMemory obj.
+    :return: str.
+    """
+    return f"/{memory.name}"
+
+
+def unlink_shared(memory: Any) -> None:
+    """ Close and unlink the published block.
+
+    With python < 3.13 attached processes untrack the block (see
+    SharedExamples), if they share the resource tracker with this
+    one, the block is not tracked here too, so it is tracked again
+    not to fail unlinking.
+
+    :param memory: SharedMemory obj, see share_examples.
+    :return: None.
+    """
+    memory.close()
+    if os.name == 'posix':
+        # registering the tracked block again does nothing
+        resource_tracker.register(_tracked_name(memory), 'shared_memory')
+    memory.unlink()
+
+
+class SharedExamples(Sequence):
+    """ Read only examples published to shared memory by another
+    process (see share_examples), the records are not copied,
+    the examples are created on access.
+    """
+
+    def __init__(self,
+                 name: str) -> None:
+        """
+        :param name: str, name of the shared memory block.
+        :return: None.
+        :exception ImportError: if there is no multiprocessing.shared_memory.
+        :exception FileNotFoundError: if there is no block with the name.
+        """
+        check_shared_memory()
+        try:
+            # the block is unlinked by the process published it
+            self._memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # python 3.8-3.12 tracks the attached block and unlinks
+            # it when the process exits (bpo-39959), there is no
+            # 'track' param, so the block is untracked here
+            self._memory = shared_memory.SharedMemory(name=name)
+            if os.name == 'posix':
+                resource_tracker.unregister(
+                    _tracked_name(self._memory), 'shared_memory')
+
+        header_size = 2 * array('q').itemsize
+        header = array('q', bytes(self._memory.buf[:header_size]))
+        count, config_size = header
+        stop = header_size + (count + 1) * header.itemsize
+        # the offsets are copied, the block might be closed then
+        self._offsets = array('q', bytes(self._memory.buf[header_size:stop]))
+        self._config = ujson.loads(
+            bytes(self._memory.buf[stop:stop + config_size]))
+        self._start = stop + config_size
+        # type of the examples, set it after reading the config
+        self.ex_type = None
+
+    @property
+    def name(self) -> str:
+        """ Get name of the shared memory block. """
+        return self._memory.name
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """ Get params of the Corpus. """
+        return self._config
+
+    def _read(self,
+              index: int) -> Any:
+        """ Create the example at the index. """
+        start = self._start + self._offsets[index]
+        stop = self._start + self._offsets[index + 1]
+        record = str(self._memory.buf[start:stop], 'utf-8')
+        return self.ex_type(*ujson.loads(record))
+
+    def copy(self) -> List[Any]:
+        """ Create all examples to the list. """
+        return list(self)
+
+    def close(self) -> None:
+        """ Detach from the block, the examples might not be read. """
+        self._memory.close()
+
+    def __getitem__(self,
+                    item: int or slice) -> Any:
+        """ Get the example at the index or list of sliced examples. """
+        if isinstance(item, slice):
+            return [self._read(index) for index in range(len(self))[item]]
+        return self._read(range(len(self))[item])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}('{self.name}', "
+                f"{len(self)} examples)")
@@ -17,18 +17,35 @@ __all__ = (
     'KwicExample'
 )
 
+import functools
+import hashlib
 import logging
 import os
 import re
 import webbrowser
 from pathlib import Path
-from typing import List, Callable, Dict, Any
+from typing import (
+    List, Callable, Dict, Any, FrozenSet, Iterable, Pattern, Tuple
+)
 
 import rnc.corpora_requests as creq
 
 logger = logging.getLogger("rnc")
 
 
+@functools.lru_cache(maxsize=1024)
+def words_pattern(words: FrozenSet[str]) -> Pattern:
+    """ Compile one pattern to find all the words.
+
+    :param words: frozenset of str, words to find.
+    :return: compiled pattern.
+    """
+    # the longest words first, not to find their parts
+    words = sorted(filter(None, words), key=len, reverse=True)
+    alternation = '|'.join(map(re.escape, words))
+    return re.compile(fr'\b(?:{alternation})\b')
+
+
 def mark_found_words(txt: str,
                      words: List[str],
                      marker: Callable) -> str:
@@ -39,12 +56,32 @@ def mark_found_words(txt: str,
     :param marker: callable, function to mark words with it.
     :return: str with marked words.
     """
-    if marker is None:
+    if marker is None or not any(words):
         return txt
 
-    for word in words:
-        txt = re.sub(fr'\b{word}\b', marker(word), txt)
-    return txt
+    pattern = words_pattern(frozenset(words))
+    return pattern.sub(lambda match: marker(match.group(0)), txt)
+
+
+@functools.lru_cache(maxsize=None)
+def _state_slots(ex_type: type) -> Tuple[str, ...]:
+    """ Get names of the slots of the example type to pickle,
+    cached and pending fields are not pickled.
+
+    :param ex_type: type of the example.
+    :return: tuple of str.
+    """
+    names = []
+    for cls in reversed(ex_type.__mro__):
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = slots,
+        names += [
+            name
+            for name in slots
+            if name not in ex_type._CACHED_SLOTS
+        ]
+    return tuple(names)
 
 
 # TODO
@@ -56,7 +93,12 @@ class Example:
     """ Base examples class """
     __slots__ = (
         '_txt', '_src', '_doc_url',
-        '_ambiguation', '_found_wordforms')
+        '_ambiguation', '_found_wordforms', '_pending', '_fingerprint')
+    # names of the constructor args, in the same order
+    _RECORD_FIELDS = (
+        'txt', 'src', 'ambiguation', 'found_wordforms', 'doc_url')
+    # slots which are not pickled, they are None after unpickling
+    _CACHED_SLOTS = '_pending', '_fingerprint'
 
     def __init__(self,
                  txt: str,
@@ -81,13 +123,103 @@ class Example:
         wf = found_wordforms or []
         if isinstance(wf, str):
             wf = found_wordforms.split(', ')
+        elif not isinstance(wf, list):
+            wf = list(wf)
         self._found_wordforms = wf
 
+        # None or HTML code of the lazy example, function
+        # to get the fields from it and deferred marker
+        self._pending = None
+        # None or cached fingerprint with hash of the found
+        # wordforms it is got with (see fingerprint)
+        self._fingerprint = None
+
+    @classmethod
+    def from_fragment(cls,
+                      fragment: str,
+                      found_wordforms: List[str],
+                      unfold: Callable) -> Any:
+        """ Create a lazy example. Its text, source, ambiguation
+        and URL will be got from the fragment on the first access.
+
+        :param fragment: str, HTML code of the example.
+        :param found_wordforms: list of str, example's found wordforms.
+        :param unfold: callable, function getting text, source,
+         ambiguation and URL from the fragment.
+        :return: new obj.
+        """
+        new_ex = cls('', '', '', found_wordforms, '')
+        new_ex._pending = fragment, unfold, None
+        return new_ex
+
+    def _resolve(self) -> None:
+        """ Get the fields of the lazy example from its fragment,
+        mark found wordforms if marking was deferred.
+
+        :return: None.
+        :exception ValueError: if the fragment is wrong.
+        """
+        fragment, unfold, marker = self._pending
+
+        if fragment is not None:
+            try:
+                fields = unfold(fragment)
+            except Exception as e:
+                # the example is kept lazy, it fails on every access
+                msg = f"Error while parsing the lazy example:\n{e}"
+                logger.error(msg)
+                raise ValueError(msg) from e
+            self._txt, self._src, self._ambiguation, self._doc_url = fields
+            self._fingerprint = None
+        self._pending = None
+        if marker is not None:
+            self._mark(marker)
+
+    def _build_data(self) -> Dict[str, Any]:
+        """ Build the dict with all fields except for doc_url. """
+        return {
+            'text': self.txt,
+            'source': self.src,
+            'ambiguation': self.ambiguation,
+            'found wordforms': ', '.join(self.found_wordforms)
+        }
+
+    def _build_row(self) -> Tuple[Any]:
+        """ Build the tuple with values of the columns. """
+        # ATTENTION:
+        # these order must be the same as in the constructor
+        return (*self._build_data().values(), self.doc_url)
+
+    def _intern(self,
+                table: Dict[str, str]) -> None:
+        """ Replace source, ambiguation, URL and found wordforms with
+        the equal strings from the table, add them there if they
+        are not found. So the strings repeated in many examples are
+        stored once.
+
+        :param table: dict of str, {string: the same string}.
+        :return: None.
+        """
+        def intern(value: Any) -> Any:
+            if isinstance(value, str):
+                return table.setdefault(value, value)
+            return value
+
+        self._src = intern(self._src)
+        self._ambiguation = intern(self._ambiguation)
+        self._doc_url = intern(self._doc_url)
+        self._found_wordforms = [
+            intern(form)
+            for form in self._found_wordforms
+        ]
+
     @property
     def txt(self) -> Any:
         """
         :return: any type, example's text.
         """
+        if self._pending is not None:
+            self._resolve()
         return self._txt
 
     @property
@@ -95,6 +227,8 @@ class Example:
         """
         :return: any type, example's source.
         """
+        if self._pending is not None:
+            self._resolve()
         return self._src
 
     @property
@@ -102,6 +236,8 @@ class Example:
         """
         :return: any type, example's ambiguation.
         """
+        if self._pending is not None:
+            self._resolve()
         return self._ambiguation
 
     @property
@@ -109,6 +245,8 @@ class Example:
         """
         :return: str, example's URL.
         """
+        if self._pending is not None:
+            self._resolve()
         return self._doc_url
 
     @property
@@ -124,7 +262,7 @@ class Example:
 
         :return: list of str, names of columns.
         """
-        return list(self.data.keys()) + ['URL']
+        return list(self._build_data().keys()) + ['URL']
 
     @property
     def items(self) -> List[Any]:
@@ -132,9 +270,38 @@ class Example:
 
         :return: list of any types, values of columns.
         """
-        # ATTENTION:
-        # these order must be the same as in the constructor
-        return list(self.data.values()) + [self.doc_url]
+        return list(self._build_row())
+
+    @property
+    def fingerprint(self) -> bytes:
+        """ Stable hash of the example's content: it is the same
+        for equal examples in different sessions.
+
+        It is cached, setters drop it, it is got again
+        if found wordforms are changed in place.
+
+        :return: bytes, 16 bytes of BLAKE2b digest.
+        """
+        key = hash(tuple(self._found_wordforms))
+        cached = self._fingerprint
+        if cached is None or cached[1] != key:
+            content = '\x1f'.join(map(str, self._build_row()))
+            digest = hashlib.blake2b(
+                content.encode('utf-8'), digest_size=16).digest()
+            cached = self._fingerprint = digest, key
+        return cached[0]
+
+    @property
+    def record(self) -> List[Any]:
+        """ Args of the constructor to create the same example.
+        Found wordforms are not joined.
+
+        :return: list of any types.
+        """
+        return [
+            getattr(self, field)
+            for field in self._RECORD_FIELDS
+        ]
 
     @property
     def data(self) -> Dict[str, Any]:
@@ -143,13 +310,7 @@ class Example:
 
         :return: dict with fields names and their values.
         """
-        data = {
-            'text': self.txt,
-            'source': self.src,
-            'ambiguation': self.ambiguation,
-            'found wordforms': ', '.join(self.found_wordforms)
-        }
-        return data
+        return self._build_data()
 
     @txt.setter
     def txt(self,
@@ -164,7 +325,10 @@ class Example:
             logger.warning(f"As a text to {class_name} "
                            f"set {type(other)}, str expected")
 
+        if self._pending is not None:
+            self._resolve()
         self._txt = other
+        self._fingerprint = None
 
     @src.setter
     def src(self,
@@ -179,7 +343,10 @@ class Example:
             logger.warning(f"As a source to {class_name} "
                            f"set {type(other)}, str expected")
 
+        if self._pending is not None:
+            self._resolve()
         self._src = other
+        self._fingerprint = None
 
     @ambiguation.setter
     def ambiguation(self,
@@ -193,7 +360,11 @@ class Example:
             class_name = self.__class__.__name__
             logger.warning(f"As a ambiguation to {class_name} "
                            f"set {type(other)}, str expected")
+
+        if self._pending is not None:
+            self._resolve()
         self._ambiguation = other
+        self._fingerprint = None
 
     def open_doc(self) -> None:
         """ Open the doc in the new tab of the default browser.
@@ -202,36 +373,87 @@ class Example:
         :exception: if something is wrong.
         """
         try:
-            webbrowser.open_new_tab(self._doc_url)
+            webbrowser.open_new_tab(self.doc_url)
         except Exception:
             logger.exception(
-                f"Error while opening doc with url: {self._doc_url}")
+                f"Error while opening doc with url: {self.doc_url}")
             raise
 
-    def mark_found_words(self,
-                         marker: Callable) -> None:
+    def _mark(self,
+              marker: Callable) -> None:
         """ Mark found wordforms in the text with marker.
 
         :param marker: function to mark found wordforms.
         :return: None.
         """
         self._txt = mark_found_words(
-            self.txt, self.found_wordforms, marker)
+            self._txt, self.found_wordforms, marker)
+        self._fingerprint = None
+
+    def mark_found_words(self,
+                         marker: Callable,
+                         defer: bool = False) -> None:
+        """ Mark found wordforms in the text with marker.
+
+        :param marker: function to mark found wordforms.
+        :param defer: bool, whether the text will be marked
+         on the first access to it. Optional, False by default.
+        :return: None.
+        """
+        if marker is None:
+            return
+
+        if defer:
+            fragment, unfold, pending_marker = self._pending or (None,) * 3
+            if pending_marker is None:
+                self._pending = fragment, unfold, marker
+                return
+
+        if self._pending is not None:
+            self._resolve()
+        self._mark(marker)
 
     def copy(self) -> Any:
         """
         :return: copied obj.
         """
-        return self.__class__(*self.data.values(), self.doc_url)
+        return self.__class__(*self._build_row())
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """ Get values of the slots to pickle, the lazy
+        example is parsed, cached views are not pickled.
+        """
+        if self._pending is not None:
+            self._resolve()
+        return tuple(
+            getattr(self, name)
+            for name in _state_slots(self.__class__)
+        )
+
+    def __setstate__(self,
+                     state: Tuple[Any, ...]) -> None:
+        """ Set values of the slots from the pickled state. """
+        for name, value in zip(_state_slots(self.__class__), state):
+            setattr(self, name, value)
+        for name in self._CACHED_SLOTS:
+            setattr(self, name, None)
 
     def __eq__(self,
                other: Any) -> bool:
         """ ==
 
+        Fields are compared one by one, so the first different
+        one stops the comparison.
+
         :param other: other Example object.
         :return: bool, whether data equal.
         """
-        return self.items == other.items
+        if self._RECORD_FIELDS != other._RECORD_FIELDS:
+            return False
+        return all(
+            getattr(self, field) == getattr(other, field)
+            for field in self._RECORD_FIELDS
+        )
 
     def __contains__(self,
                      item: Any) -> bool:
@@ -242,7 +464,7 @@ class Example:
         :return: whether item is in text.
         """
         try:
-            return item.lower() in self.txt.lower()
+            return item.casefold() in self.txt.casefold()
         except AttributeError:
             return item in self.txt
 
@@ -257,7 +479,7 @@ class Example:
         """
         res = '\n'.join(
             f"{key.upper()}: {val}"
-            for key, val in self.data.items()
+            for key, val in self._build_data().items()
         )
         return res
 
@@ -273,27 +495,31 @@ class Example:
         """
         fields = '\n'.join(
             f"{key}: {val}"
-            for key, val in self.data.items()
+            for key, val in self._build_data().items()
         )
         url = f"URL: {self.doc_url}"
         return f"{fields}\n{url}"
 
     def __hash__(self) -> int:
-        """ Hash str with all example fields.
+        """ Hash the fingerprint of the example.
 
         :return: int, hash.
         """
-        return hash(repr(self))
+        return hash(self.fingerprint)
 
     def __bool__(self) -> bool:
         """ .
         :return: bool, whether fields (expect for url) exist
         """
-        return all(val for val in self.data.values())
+        return all(val for val in self._build_data().values())
 
 
 class KwicExample(Example):
     __slots__ = '_left', '_center', '_right'
+    _RECORD_FIELDS = (
+        'left', 'center', 'right', 'src', 'found_wordforms', 'doc_url')
+    # the joined text is kept in _txt, it is got again after unpickling
+    _CACHED_SLOTS = Example._CACHED_SLOTS + ('_txt',)
 
     def __init__(self,
                  left: str,
@@ -311,16 +537,20 @@ class KwicExample(Example):
         :param found_wordforms: list of str or str, example's found wordforms.
         :param doc_url: str, example's URL.
         """
+        super().__init__('', src, '', found_wordforms, doc_url)
         self._left = left
         self._center = center
         self._right = right
-        super().__init__(self.txt, src, '', found_wordforms, doc_url)
+        # joined contexts, they are joined on the first access
+        self._txt = None
 
     @property
     def left(self) -> Any:
         """
         :return: str, example's left context.
         """
+        if self._pending is not None:
+            self._resolve()
         return self._left
 
     @property
@@ -328,6 +558,8 @@ class KwicExample(Example):
         """
         :return: str, example's center context.
         """
+        if self._pending is not None:
+            self._resolve()
         return self._center
 
     @property
@@ -335,15 +567,21 @@ class KwicExample(Example):
         """
         :return: str, example's right context.
         """
+        if self._pending is not None:
+            self._resolve()
         return self._right
 
     @property
     def txt(self) -> str:
         """
+        It is cached, setters of the contexts drop it.
+
         :return: str, joined left, center and right contexts.
         """
-        # it's assumed that all contexts are stripped
-        return f"{self.left} {self.center} {self.right}"
+        if self._txt is None:
+            # it's assumed that all contexts are stripped
+            self._txt = f"{self.left} {self.center} {self.right}"
+        return self._txt
 
     @property
     def ambiguation(self) -> None:
@@ -351,8 +589,7 @@ class KwicExample(Example):
         logger.error(msg)
         raise NotImplementedError(msg)
 
-    @property
-    def data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """ All fields except for URL.
 
         :return: dict with fields' names and their values.
@@ -378,7 +615,12 @@ class KwicExample(Example):
             class_name = self.__class__.__name__
             logger.warning(f"As a left context to {class_name} "
                            f"set {type(other)}, str expected")
+
+        if self._pending is not None:
+            self._resolve()
         self._left = other
+        self._txt = None
+        self._fingerprint = None
 
     @center.setter
     def center(self,
@@ -392,7 +634,12 @@ class KwicExample(Example):
             class_name = self.__class__.__name__
             logger.warning(f"As a center context to {class_name} "
                            f"set {type(other)}, str expected")
+
+        if self._pending is not None:
+            self._resolve()
         self._center = other
+        self._txt = None
+        self._fingerprint = None
 
     @right.setter
     def right(self,
@@ -406,7 +653,12 @@ class KwicExample(Example):
             class_name = self.__class__.__name__
             logger.warning(f"As a right context to {class_name} "
                            f"set {type(other)}, str expected")
+
+        if self._pending is not None:
+            self._resolve()
         self._right = other
+        self._txt = None
+        self._fingerprint = None
 
     @txt.setter
     def txt(self,
@@ -416,36 +668,93 @@ class KwicExample(Example):
         logger.error(msg)
         raise NotImplementedError(msg)
 
-    def mark_found_words(self,
-                         marker: Callable) -> None:
+    def _mark(self,
+              marker: Callable) -> None:
         """ Mark found wordforms in all contexts using marker.
 
         :param marker: function to mark found wordforms.
         :return: None.
         """
         words = self.found_wordforms
-        self._left = mark_found_words(self.left, words, marker)
-        self._center = mark_found_words(self.center, words, marker)
-        self._right = mark_found_words(self.right, words, marker)
+        self._left = mark_found_words(self._left, words, marker)
+        self._center = mark_found_words(self._center, words, marker)
+        self._right = mark_found_words(self._right, words, marker)
+        self._txt = None
+        self._fingerprint = None
 
 
 class MainExample(Example):
-    pass
+    __slots__ = ()
 
 
 class SyntaxExample(Example):
-    pass
+    __slots__ = ()
 
 
 class Paper2000Example(Example):
-    pass
+    __slots__ = ()
 
 
 class PaperRegionalExample(Example):
-    pass
+    __slots__ = ()
+
+
+class LanguageSchema:
+    """ Language tags of parallel examples in their order,
+    examples with the same tags share one schema.
+    """
+    __slots__ = '_langs', '_index'
+
+    def __init__(self,
+                 langs: Tuple[str, ...]) -> None:
+        """
+        :param langs: tuple of str, language tags.
+        :return: None.
+        """
+        self._langs = langs
+        # {language tag: its position}
+        self._index = {
+            lang: num
+            for num, lang in enumerate(langs)
+        }
+
+    @property
+    def langs(self) -> Tuple[str, ...]:
+        """ Get the language tags. """
+        return self._langs
+
+    def position(self,
+                 lang: str) -> int or None:
+        """ Get position of the language, None if there is no such one. """
+        return self._index.get(lang)
+
+    def __len__(self) -> int:
+        return len(self._langs)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{self._langs}"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """ Unpickled schema is the shared one. """
+        return language_schema, (self._langs,)
+
+
+@functools.lru_cache(maxsize=1024)
+def language_schema(langs: Tuple[str, ...]) -> LanguageSchema:
+    """ Get the shared schema of the language tags.
+
+    :param langs: tuple of str, language tags in their order.
+    :return: LanguageSchema.
+    """
+    return LanguageSchema(langs)
 
 
 class ParallelExample(Example):
+    """ Texts are stored in the list aligned with the language
+    schema, so getting the text in a language is a lookup.
+    """
+    __slots__ = '_schema',
+
     def __init__(self,
                  txt: Dict[str, str] = None,
                  src: str = '',
@@ -460,17 +769,85 @@ class ParallelExample(Example):
         :param doc_url: str, examples URL.
         """
         txt = txt or {}
+        langs = tuple(sorted(txt))
+
+        super().__init__([txt[lang] for lang in langs],
+                         src, ambiguation, found_wordforms, doc_url)
+        self._schema = language_schema(langs)
+
+    @classmethod
+    def from_columns(cls,
+                     langs: Tuple[str, ...],
+                     texts: List[Any],
+                     *args) -> Any:
+        """ Create the example from texts aligned with the
+        language tags, their order is kept.
+
+        :param langs: tuple of str, language tags.
+        :param texts: list of any types, texts in the languages.
+        :param args: other fields of the example, see __init__.
+        :return: new obj.
+        """
+        new_ex = cls(None, *args)
+        new_ex._schema = language_schema(tuple(langs))
+        new_ex._txt = list(texts)
+        return new_ex
+
+    @classmethod
+    def join(cls,
+             examples: Iterable[Any]) -> Any:
+        """ Concatenate the examples in one step, see __iadd__,
+        languages are sorted once.
+
+        Deferred marking of the examples is deferred in the new one,
+        every joined text is marked with found wordforms of its example.
+
+        :param examples: iterable of the examples of the class.
+        :return: new obj.
+        """
+        new_ex = cls()
+        texts, marker = {}, None
+        # {language tag: [(end of the example's text, its found wordforms)]}
+        parts = {}
+        for example in examples:
+            fragment, _, pending_marker = example._pending or (None,) * 3
+            if fragment is not None:
+                example._resolve()
+            elif pending_marker is not None:
+                marker = pending_marker
+            new_ex._join_fields(example)
+            for lang, txt in zip(example.langs, example._txt):
+                texts[lang] = f"{texts.get(lang, '')} {txt}".lstrip()
+                parts.setdefault(lang, []).append(
+                    (len(texts[lang]), example.found_wordforms))
+
+        langs = tuple(sorted(texts))
+        new_ex._schema = language_schema(langs)
+        new_ex._txt = [texts[lang] for lang in langs]
+        if marker is not None:
+            new_ex.mark_found_words((marker, parts), defer=True)
+        return new_ex
+
+    def _intern(self,
+                table: Dict[str, str]) -> None:
+        """ Share the language schema too, see Example._intern. """
+        super()._intern(table)
+        self._schema = language_schema(self._schema.langs)
 
-        super().__init__(txt, src, ambiguation, found_wordforms, doc_url)
-        self.sort()
+    @property
+    def langs(self) -> Tuple[str, ...]:
+        """ Get the language tags in order of the texts. """
+        return self._schema.langs
 
     @property
     def txt(self) -> Dict[str, Any]:
-        """ Get dict with texts.
+        """ Get dict with texts, changing it does not change the example.
 
         :return: dict of any types.
         """
-        return self._txt
+        if self._pending is not None:
+            self._resolve()
+        return dict(zip(self._schema.langs, self._txt))
 
     @txt.setter
     def txt(self,
@@ -481,30 +858,45 @@ class ParallelExample(Example):
         logger.error(msg)
         raise NotImplementedError(msg)
 
-    @property
-    def data(self) -> Dict[str, Any]:
+    def _build_data(self) -> Dict[str, Any]:
         """ There are all fields except for doc_url.
         Found wordforms joined with ', '.
 
         :return: dict with fields' names and their values.
         """
-        data = self.txt.copy()
+        data = self.txt
         data['source'] = self.src
         data['ambiguation'] = self.ambiguation
         data['found wordforms'] = ', '.join(self.found_wordforms)
 
         return data
 
-    def mark_found_words(self,
-                         marker: Callable) -> None:
+    def _mark(self,
+              marker: Callable or Tuple[Callable, Dict[str, List]]
+              ) -> None:
         """ Mark found wordforms in the text with marker.
 
-        :param marker: function to mark.
+        :param marker: function to mark or pair of it and the joined
+         parts of the texts (see join), every part is marked with
+         its found wordforms. Other texts are marked with all ones.
         :return: None.
         """
-        for lang, txt in self.txt.items():
-            self[lang] = mark_found_words(
-                txt, self.found_wordforms, marker)
+        parts = {}
+        if isinstance(marker, tuple):
+            marker, parts = marker
+
+        texts = []
+        for lang, txt in zip(self._schema.langs, self._txt):
+            if lang not in parts:
+                texts += [mark_found_words(txt, self.found_wordforms, marker)]
+                continue
+            marked, start = [], 0
+            for end, words in parts[lang]:
+                marked += [mark_found_words(txt[start:end], words, marker)]
+                start = end
+            texts += [''.join(marked)]
+        self._txt = texts
+        self._fingerprint = None
 
     @staticmethod
     def _best_src(f_src: str,
@@ -520,6 +912,28 @@ class ParallelExample(Example):
             return s_src
         return f_src
 
+    def _join_fields(self,
+                     other: Any) -> None:
+        """ Join the fields except for the texts, see __iadd__.
+
+        :param other: instance of the same class.
+        :return: None.
+        """
+        # source contains two translations
+        self._src = self.__class__._best_src(self.src, other.src)
+
+        # for MultilingualParaCorpus
+        if not self.src:
+            self._src = other.src
+
+        o_amb = other.ambiguation
+        if not self.ambiguation or o_amb and 'not' not in o_amb:
+            self._ambiguation = o_amb
+        if not self.doc_url:
+            self._doc_url = other.doc_url
+        self._found_wordforms += other.found_wordforms
+        self._fingerprint = None
+
     def sort(self,
              key: Callable = None,
              reverse: bool = False) -> None:
@@ -532,18 +946,42 @@ class ParallelExample(Example):
         """
         key = key or (lambda items: items[0])
         data = sorted(self.txt.items(), key=key, reverse=reverse)
-        self._txt = dict(data)
+        self._schema = language_schema(tuple(lang for lang, _ in data))
+        self._txt = [txt for _, txt in data]
+        self._fingerprint = None
 
     def copy(self) -> Any:
         """
         :return: copied obj.
         """
-        txt_copy = self.txt.copy()
-        return self.__class__(
-            txt_copy, self.src, self.ambiguation,
-            self.found_wordforms, self.doc_url
+        if self._pending is not None:
+            self._resolve()
+        return self.__class__.from_columns(
+            self.langs, self._txt, self.src, self.ambiguation,
+            self.found_wordforms.copy(), self.doc_url
+        )
+
+    def __eq__(self,
+               other: Any) -> bool:
+        """ ==, the texts are compared in order of the languages.
+
+        :param other: other Example object.
+        :return: bool, whether data equal.
+        """
+        if not isinstance(other, ParallelExample) or \
+                self.langs != other.langs:
+            return False
+        if self._pending is not None:
+            self._resolve()
+        if other._pending is not None:
+            other._resolve()
+        return self._txt == other._txt and all(
+            getattr(self, field) == getattr(other, field)
+            for field in self._RECORD_FIELDS[1:]
         )
 
+    __hash__ = Example.__hash__
+
     def __contains__(self,
                      item: Any) -> bool:
         """ Whether the item is in the text.
@@ -552,10 +990,13 @@ class ParallelExample(Example):
         :param item: any type, item to check.
         :return: whether item is in text.
         """
+        if self._pending is not None:
+            self._resolve()
         try:
-            return any(item.lower() in i.lower() for i in self.txt.values())
+            folded = item.casefold()
+            return any(folded in txt.casefold() for txt in self._txt)
         except AttributeError:
-            return any(item in i for i in self.txt.values())
+            return any(item in i for i in self._txt)
 
     def __iadd__(self,
                  other: Any) -> Any:
@@ -580,24 +1021,14 @@ class ParallelExample(Example):
             logger.error(msg)
             raise TypeError(msg)
 
+        texts = self.txt
         for lang, txt in other.txt.items():
-            new_txt = f"{self.txt.get(lang, '')} {txt}"
-            self[lang] = new_txt.lstrip()
+            texts[lang] = f"{texts.get(lang, '')} {txt}".lstrip()
         # save the order of languages
-        self.sort(lambda x: x[0])
-        # source contains two translations
-        self._src = self.__class__._best_src(self.src, other.src)
-
-        # for MultilingualParaCorpus
-        if not self.src:
-            self._src = other.src
-
-        o_amb = other.ambiguation
-        if not self.ambiguation or o_amb and 'not' not in o_amb:
-            self._ambiguation = o_amb
-        if not self.doc_url:
-            self._doc_url = other.doc_url
-        self._found_wordforms += other.found_wordforms
+        langs = tuple(sorted(texts))
+        self._schema = language_schema(langs)
+        self._txt = [texts[lang] for lang in langs]
+        self._join_fields(other)
 
         return self
 
@@ -607,11 +1038,12 @@ class ParallelExample(Example):
 
         :param item: str, language tag.
         :return: str or None, text in the language if exists.
+        :exception AttributeError: if the name is private.
         """
-        try:
-            return getattr(super(), item)
-        except AttributeError:
-            return self.txt.get(item, None)
+        if item.startswith('_'):
+            # slots which are not set yet, e.g. while copying
+            raise AttributeError(item)
+        return self[item]
 
     def __getitem__(self,
                     lang: str) -> Any:
@@ -620,50 +1052,67 @@ class ParallelExample(Example):
         :param lang: str, language tag.
         :return: str or None, text in the language if exists.
         """
-        return self.txt.get(lang, None)
+        if self._pending is not None:
+            self._resolve()
+        position = self._schema.position(lang)
+        if position is None:
+            return None
+        return self._txt[position]
 
     def __setitem__(self,
                     lang: str,
                     txt: Any) -> None:
-        """ Change text in the language.
+        """ Change text in the language, the new language is added
+        to the end.
 
         :param lang: str, language tag.
         :param txt: any type, new text.
         :return: None.
-        :exception ValueError: if the text in the language does not exist.
         """
         if not isinstance(txt, str):
             class_name = self.__class__.__name__
             logger.warning(f"As a '{lang}' to {class_name} "
                            f"set {type(txt)}, str expected")
-        self._txt[lang] = txt
+
+        if self._pending is not None:
+            self._resolve()
+        position = self._schema.position(lang)
+        if position is None:
+            self._schema = language_schema(self._schema.langs + (lang,))
+            self._txt.append(txt)
+        else:
+            self._txt[position] = txt
+        self._fingerprint = None
 
 
 class MultilingualParaExample(ParallelExample):
-    pass
+    __slots__ = ()
 
 
 class TutoringExample(Example):
-    pass
+    __slots__ = ()
 
 
 class DialectalExample(Example):
-    pass
+    __slots__ = ()
 
 
 class PoeticExample(Example):
-    pass
+    __slots__ = ()
 
 
 class SpokenExample(Example):
-    pass
+    __slots__ = ()
 
 
 class AccentologicalExample(Example):
-    pass
+    __slots__ = ()
 
 
 class MultimodalExample(Example):
+    __slots__ = '_media_url', '_filepath'
+    _RECORD_FIELDS = Example._RECORD_FIELDS + ('media_url', 'filepath')
+
     def __init__(self,
                  txt: str,
                  src: str,
@@ -687,6 +1136,14 @@ class MultimodalExample(Example):
         self._media_url = media_url
         self._filepath = Path(filename)
 
+    @property
+    def media_url(self) -> str:
+        """ Get URL to the media file.
+
+        :return: str, URL.
+        """
+        return self._media_url
+
     @property
     def filepath(self) -> Path:
         """ Get the path to the local file.
@@ -707,6 +1164,7 @@ class MultimodalExample(Example):
         :return: None.
         """
         self._filepath = Path(other)
+        self._fingerprint = None
 
     @property
     def columns(self) -> List[str]:
@@ -716,13 +1174,20 @@ class MultimodalExample(Example):
         """
         return super().columns + ['media_url', 'filename']
 
+    def _build_row(self) -> Tuple[Any]:
+        """ Build the tuple with values of the columns. """
+        return super()._build_row() + (self._media_url, self.filepath)
+
     @property
-    def items(self) -> List[Any]:
-        """ For csv writing.
+    def record(self) -> List[Any]:
+        """ Args of the constructor to create the same example.
 
-        :return: list of any types, values of columns.
+        :return: list of any types.
         """
-        return super().items + [self._media_url, self.filepath]
+        record = super().record
+        # Path is not serializable
+        record[-1] = str(record[-1])
+        return record
 
     def download_file(self) -> None:
         """ Download the media file.
@@ -740,14 +1205,14 @@ class MultimodalExample(Example):
 
     def copy(self) -> Any:
         return self.__class__(
-            *self.data.values(), self.doc_url,
+            *self._build_data().values(), self.doc_url,
             self._media_url, str(self.filepath)
         )
 
 
 class MultiPARCExample(Example):
-    pass
+    __slots__ = ()
 
 
 class HistoricalExample(Example):
-    pass
+    __slots__ = ()
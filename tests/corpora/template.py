@@ -1,10 +1,12 @@
 import os
+import pickle
 from pathlib import Path
 from time import sleep
 
 import pytest
 
 import rnc.corpora as rnc
+from tests.helpers import dumped_corpus
 
 
 class TemplateCorpusTest:
@@ -25,6 +27,15 @@ class TemplateCorpusTest:
         }
     }
 
+    def dumped_corpus(self,
+                      path: Path) -> rnc.Corpus:
+        """ Create the Corpus with the file, its format is chosen
+        by the suffix, add the normal examples and dump them.
+        """
+        return dumped_corpus(
+            path, self.corp_normal_obj, self.corp_type,
+            self.corp_normal_obj.query, self.corp_normal_obj.p_count)
+
     #########################
     #    Test requesting    #
     #########################
@@ -120,6 +131,39 @@ class TemplateCorpusTest:
         assert len(corp) >= 1
         sleep(5)
 
+    def test_request_with_fields(self):
+        corp = self.corp_type('ты', 1, marker=str.upper)
+        corp.request_examples(fields=['txt', 'found_wordforms'])
+
+        assert len(corp) > 1
+        assert all(ex.found_wordforms and not ex.doc_url for ex in corp)
+        sleep(5)
+
+    def test_request_lazy(self):
+        corp = self.corp_type('ты', 1, marker=str.upper)
+        corp.request_examples(lazy=True)
+
+        assert len(corp) > 1
+        assert all(isinstance(ex.src, str) for ex in corp)
+        sleep(5)
+
+    def test_request_with_cache(self):
+        corp = self.corp_type('ты', 1, marker=str.upper)
+        corp.request_examples(cache=True)
+        sleep(5)
+
+        from_cache = self.corp_type('ты', 1, marker=str.upper)
+        from_cache.request_examples(cache=True)
+
+        assert from_cache.data == corp.data
+        assert from_cache.found_wordforms == corp.found_wordforms
+        sleep(5)
+
+    def test_request_with_wrong_fields(self):
+        corp = self.corp_type('ты', 1)
+        with pytest.raises(ValueError):
+            corp.request_examples(fields=['text'])
+
     def test_call(self):
         corp = self.corp_type('ты', 1, marker=str.capitalize, out='kwic')
         corp()
@@ -158,6 +202,118 @@ class TemplateCorpusTest:
         with pytest.raises(NotImplementedError):
             self.corp_type(file=f'data{os.sep}wrong_mode.csv')
 
+    def test_load_with_memory_limit(self):
+        self.corp_normal_obj.dump()
+        corp = self.corp_type(file=self.corp_normal_obj.file, memory_limit=2)
+
+        # the first examples are spilled to disk, they are read on access
+        assert corp[0] is not corp[0]
+        assert corp.data == self.corp_normal_obj.data
+        assert corp.found_wordforms == self.corp_normal_obj.found_wordforms
+
+    @pytest.mark.parametrize('name', ('corpus.csv.gz', 'corpus.csv.xz'))
+    def test_load_compressed(self, tmp_path, name):
+        corp = self.dumped_corpus(tmp_path / name)
+        loaded = self.corp_type(file=corp.file)
+
+        assert corp.file == tmp_path / name
+        assert loaded.data == self.corp_normal_obj.data
+
+    def test_dump_append(self, tmp_path):
+        corp = self.dumped_corpus(tmp_path / 'corpus.csv')
+        size = corp.file.stat().st_size
+
+        corp.extend(self.corp_normal_obj[:3])
+        corp.dump(append=True)
+        loaded = self.corp_type(file=corp.file)
+
+        assert corp.file.stat().st_size > size
+        assert loaded.data == self.corp_normal_obj.data + \
+               self.corp_normal_obj.data[:3]
+
+    def test_dump_append_after_changes(self, tmp_path):
+        corp = self.dumped_corpus(tmp_path / 'corpus.csv')
+
+        del corp[0]
+        corp.extend(self.corp_normal_obj[:1])
+        corp.dump(append=True)
+        loaded = self.corp_type(file=corp.file)
+
+        assert loaded.data == corp.data
+
+    def test_load_lazy(self, tmp_path):
+        corp = self.dumped_corpus(tmp_path / 'corpus.csv')
+        loaded = self.corp_type(file=corp.file, lazy=True)
+
+        assert len(loaded) == len(corp)
+        assert loaded[-1] == corp[-1]
+        assert list(loaded) == corp.data
+
+        del loaded[0]
+        assert loaded.data == corp.data[1:]
+
+    def test_pickle(self):
+        corp = pickle.loads(pickle.dumps(self.corp_normal_obj))
+
+        assert corp.data == self.corp_normal_obj.data
+        assert corp.params == self.corp_normal_obj.params
+        assert corp.found_wordforms == self.corp_normal_obj.found_wordforms
+
+    @pytest.mark.skipif(rnc.cstore.shared_memory is None,
+                        reason="shared memory is added in python 3.8")
+    def test_share(self):
+        corp = self.corp_normal_obj.copy()
+        name = corp.share()
+        try:
+            attached = self.corp_type(shared=name)
+
+            assert attached.data == corp.data
+            assert attached.params == corp.params
+            assert attached.amount_of_docs == corp.amount_of_docs
+
+            del attached[0]
+            assert attached.data == corp.data[1:]
+        finally:
+            corp.unshare()
+
+    def test_load_additional_info(self, tmp_path, monkeypatch):
+        corp = self.dumped_corpus(tmp_path / 'corpus.csv')
+        corp.refresh_info()
+        corp.dump()
+
+        def get_htmls(*args, **kwargs):
+            raise AssertionError("RNC must not be requested")
+
+        monkeypatch.setattr(rnc.creq, 'get_htmls', get_htmls)
+        loaded = self.corp_type(file=corp.file)
+
+        assert loaded.amount_of_docs == corp.amount_of_docs
+        assert loaded.amount_of_contexts == corp.amount_of_contexts
+        assert loaded.graphic_link == corp.graphic_link
+
+    @pytest.mark.parametrize('name', ('corpus.jsonl', 'corpus.jsonl.gz'))
+    def test_load_jsonl(self, tmp_path, name):
+        corp = self.dumped_corpus(tmp_path / name)
+        loaded = self.corp_type(file=corp.file)
+
+        assert corp.file == tmp_path / name
+        assert loaded.data == self.corp_normal_obj.data
+
+    def test_load_sqlite(self, tmp_path):
+        corp = self.dumped_corpus(tmp_path / 'corpus.db')
+        loaded = self.corp_type(file=corp.file)
+
+        assert loaded.data == self.corp_normal_obj.data
+        assert loaded.params == corp.params
+
+    def test_load_sqlite_with_filter(self, tmp_path):
+        corp = self.dumped_corpus(tmp_path / 'corpus.db')
+        src = corp[0].src
+        loaded = self.corp_type(file=corp.file, where={'src': src})
+
+        assert loaded.data == [ex for ex in corp if ex.src == src]
+        assert loaded.count_in_file() == len(loaded)
+
     def test_request_if_base_loaded(self):
         corp = self.corp_type(file=self.corp_normal_obj.file)
         with pytest.raises(RuntimeError):
@@ -183,6 +339,13 @@ class TemplateCorpusTest:
     def test_data_type(self):
         assert isinstance(self.corp_normal_obj.data, list)
 
+    def test_sources_interned(self):
+        sources = {}
+        for example in self.corp_normal_obj:
+            src = sources.setdefault(example.src, example.src)
+
+            assert src is example.src
+
     def test_data_elements_type(self):
         assert all(
             isinstance(ex, self.corp_normal_obj.ex_type)
@@ -251,6 +414,27 @@ class TemplateCorpusTest:
 
         assert copy.data == self.corp_normal_obj.data
 
+    def test_copy_on_write(self):
+        corp = self.corp_normal_obj
+        copy = corp.copy()
+        # the examples are shared until the copy is changed
+        assert copy[0] is corp[0]
+
+        length = len(corp)
+        example = copy.pop(0)
+        assert len(copy) == length - 1 and len(corp) == length
+        assert corp[0] is example
+
+    def test_slice_on_write(self):
+        corp = self.corp_normal_obj
+        sliced = corp[2:6]
+        assert list(sliced) == corp.data[2:6]
+
+        del sliced[0]
+        assert len(sliced) == 3
+        assert corp[2] in corp and len(corp[2:6]) == 4
+        assert list(sliced[::-1]) == corp.data[5:2:-1]
+
     def test_sort_data(self):
         copy = self.corp_normal_obj.copy()
         copy.sort_data(key=lambda x: len(x.txt))
@@ -276,6 +460,70 @@ class TemplateCorpusTest:
         assert (example in self.corp_normal_obj and
                 example not in copy)
 
+    def test_contains_after_changes(self):
+        copy = self.corp_normal_obj.copy()
+        first, second = copy[0], copy[1]
+        # build the index
+        assert first in copy
+
+        copy[0] = second
+        assert first not in copy and second in copy
+        del copy[0]
+        assert second in copy
+        del copy[0]
+        assert second not in copy
+
+    def test_found_wordforms_after_changes(self):
+        copy = self.corp_normal_obj.copy()
+        copy.pop(0)
+        del copy[:len(copy) // 2]
+
+        expected = {}
+        for example in copy:
+            for form in example.found_wordforms:
+                form = copy._normalize_wordform(form)
+                expected[form] = expected.get(form, 0) + 1
+        assert copy.found_wordforms == expected
+
+        form = next(iter(expected))
+        assert copy.wordform_frequency(form) == expected[form]
+        assert all(
+            form in map(copy._normalize_wordform, example.found_wordforms)
+            for example in copy.examples_with_wordform(form)
+        )
+
+    def test_findall_with_search_index(self):
+        copy = self.corp_normal_obj.copy()
+        pattern = copy.forms_in_query[0]
+        expected = list(copy.findall(pattern))
+        copy.build_search_index()
+
+        assert list(copy.findall(pattern)) == expected
+        assert all(list(match) for _, match in copy.finditer(pattern))
+
+    def test_findall_with_workers(self):
+        pattern = r'\w+'
+        expected = list(self.corp_normal_obj.findall(pattern))
+
+        assert expected
+        assert list(self.corp_normal_obj.findall(pattern, workers=2)) == expected
+
+    def test_dedupe(self):
+        copy = self.corp_normal_obj.copy()
+        copy.dedupe()
+        length = len(copy)
+        copy.extend(copy.data[:3])
+
+        assert copy.dedupe() == 3
+        assert len(copy) == length
+        assert copy.dedupe() == 0
+
+    def test_request_dedupe(self):
+        corp = self.corp_type('ты', 1)
+        corp.request_examples(dedupe=True)
+
+        assert len(set(corp)) == len(corp)
+
     def test_shuffle(self):
         copy = self.corp_normal_obj.copy()
         copy.shuffle()
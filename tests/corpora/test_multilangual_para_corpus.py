@@ -1,7 +1,5 @@
 from time import sleep
 
-import pytest
-
 import rnc.corpora as rnc
 from tests.corpora.template import TemplateCorpusTest
 
@@ -43,28 +41,15 @@ class TestMultilingualParaCorpus(TemplateCorpusTest):
 
         assert copy.data != self.corp_normal_obj.data
 
-    def test_dump_normal(self):
-        with pytest.raises(NotImplementedError):
-            super().test_dump_normal()
-
-    def test_dump_kwic(self):
-        with pytest.raises(NotImplementedError):
-            super().test_dump_kwic()
-
-    def test_load_kwic(self):
-        pass
-
-    def test_load_normal(self):
-        pass
-
-    def test_load_to_wrong_corpus(self):
-        pass
-
-    def test_request_if_base_loaded(self):
-        pass
-
-    def test_equality_wordforms_from_rnc_and_from_file(self):
-        pass
-
-    def test_found_wordforms_from_file(self):
-        pass
+    def test_dump_different_languages(self, tmp_path):
+        corp = self.dumped_corpus(tmp_path / 'corpus.csv')
+        example = corp[0].copy()
+        example['xx'] = 'text'
+        example.sort()
+        corp[0] = example
+        corp.dump()
+        loaded = self.corp_type(file=corp.file)
+
+        assert 'xx' in loaded[0].langs
+        assert 'xx' not in loaded[1].langs
+        assert loaded.data == corp.data
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+import rnc.corpora as rnc
+import rnc.examples as expl
+
+
+def examples(count: int = 6) -> list:
+    return [
+        expl.MainExample(f"text {num}", f"Author {num % 2}. Title",
+                         'disambiguated', [f"form{num}"],
+                         f"search.xml?docid={num % 2}")
+        for num in range(count)
+    ]
+
+
+def dumped_corpus(path: Path,
+                  data: list = None,
+                  corp_type: type = rnc.MainCorpus,
+                  query: str = 'ты',
+                  p_count: int = 1) -> rnc.Corpus:
+    """ Create the Corpus with the file, its format is chosen
+    by the suffix, add the examples (examples() by default)
+    and dump them.
+    """
+    corp = corp_type(query, p_count, file=path)
+    corp.extend(examples() if data is None else data)
+    corp.dump()
+    return corp
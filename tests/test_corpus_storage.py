@@ -0,0 +1,299 @@
+import pickle
+
+import pytest
+
+import rnc.corpora as rnc
+import rnc.examples as expl
+from tests.helpers import dumped_corpus, examples
+
+
+@pytest.fixture(autouse=True)
+def spill_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(rnc.Corpus, 'SPILL_FOLDER', tmp_path / 'spill')
+
+
+@pytest.mark.parametrize('storage,kept', (
+    ({}, True),
+    # the first examples are in columns or spilled to disk,
+    # they are created again on access
+    ({'columnar': True}, False),
+    ({'memory_limit': 2}, False),
+))
+def test_extend_new_corpus(storage, kept):
+    corp = rnc.MainCorpus('ты', 1, **storage)
+    exs = examples()
+    corp.extend(exs)
+
+    assert len(corp) == len(exs)
+    assert list(corp) == exs
+    assert (corp[0] is exs[0]) is kept
+    assert corp.found_wordforms == {f"form{num}": 1 for num in range(6)}
+
+
+@pytest.fixture
+def database(tmp_path):
+    return dumped_corpus(tmp_path / 'corpus.db').file
+
+
+def test_load_sqlite(tmp_path):
+    corp = dumped_corpus(tmp_path / 'corpus.db')
+    loaded = rnc.MainCorpus(file=corp.file)
+
+    assert not (tmp_path / 'corpus.json').exists()
+    assert loaded.data == examples()
+    assert loaded.params == corp.params
+    assert loaded.count_in_file() == len(loaded)
+
+
+@pytest.mark.parametrize('lazy', (False, True))
+def test_load_filtered(database, lazy):
+    exs = examples()
+    corp = rnc.MainCorpus(file=database, where={'src': exs[1].src},
+                          lazy=lazy)
+
+    assert len(corp) == 3
+    assert list(corp) == exs[1::2]
+    assert corp[-1] == exs[-1]
+    assert corp.count_in_file() == 3
+    assert corp.count_in_file(wordform='FORM2') == 1
+
+
+def test_dump_filtered(database):
+    exs = examples(8)
+    corp = rnc.MainCorpus(file=database, where={'src': exs[1].src})
+
+    # the other examples would be removed
+    with pytest.raises(RuntimeError):
+        corp.dump()
+    corp.extend(exs[6:])
+    corp.dump(append=True)
+    loaded = rnc.MainCorpus(file=database)
+
+    assert list(loaded) == exs
+    corp.sort_data(key=lambda example: example.txt, reverse=True)
+    with pytest.raises(RuntimeError):
+        corp.dump(append=True)
+
+
+def test_count_not_in_database():
+    corp = rnc.MainCorpus('ты', 1)
+
+    with pytest.raises(RuntimeError):
+        corp.count_in_file()
+
+
+@pytest.mark.parametrize('name', ('corpus.csv.gz', 'corpus.csv.xz'))
+def test_load_compressed(tmp_path, name):
+    corp = dumped_corpus(tmp_path / name)
+    loaded = rnc.MainCorpus(file=tmp_path / name)
+
+    assert corp.file == tmp_path / name
+    assert loaded.data == examples()
+    assert loaded.params == corp.params
+
+
+def test_dump_compressed(tmp_path):
+    corp = dumped_corpus(tmp_path / 'corpus.csv')
+    corp.dump(compression='gzip')
+    loaded = rnc.MainCorpus(file=tmp_path / 'corpus.csv.gz')
+
+    assert corp.file == tmp_path / 'corpus.csv.gz'
+    assert loaded.data == examples()
+    with pytest.raises(ValueError):
+        corp.dump(compression='bz2')
+
+
+@pytest.mark.parametrize('name', (
+    'corpus.csv', 'corpus.csv.gz', 'corpus.jsonl', 'corpus.db'
+))
+def test_dump_append(tmp_path, name):
+    exs = examples(8)
+    corp = dumped_corpus(tmp_path / name)
+    corp.extend(exs[6:])
+    corp.dump(append=True)
+    loaded = rnc.MainCorpus(file=corp.file)
+
+    assert loaded.data == exs
+
+
+@pytest.mark.parametrize('name', ('corpus.csv', 'corpus.jsonl'))
+def test_dump_columnar(tmp_path, name):
+    exs = examples(8)
+    corp = rnc.MainCorpus('ты', 1, file=tmp_path / name, columnar=True)
+    corp.extend(exs[:6])
+    corp.dump()
+    corp.extend(exs[6:])
+    corp.dump(append=True)
+    loaded = rnc.MainCorpus(file=corp.file)
+
+    assert loaded.data == exs
+    assert loaded.found_wordforms == corp.found_wordforms
+
+
+def test_dump_append_multilingual(tmp_path):
+    exs = [
+        expl.MultilingualParaExample(
+            {'en': f"text {num}", 'ru': f"текст {num}"},
+            'Author. Title', 'disambiguated', ['form'], 'search.xml')
+        for num in range(3)
+    ]
+    new_lang = expl.MultilingualParaExample(
+        {'de': 'Text'}, 'Author. Title', 'disambiguated', ['form'], 'url')
+    path = tmp_path / 'corpus.csv'
+    corp = rnc.MultilingualParaCorpus('ты', 1, file=path)
+    corp.extend(exs[:2])
+    corp.dump()
+    dumped = path.read_bytes()
+
+    loaded = rnc.MultilingualParaCorpus(file=path)
+    loaded.extend(exs[2:])
+    loaded.dump(append=True)
+    # the languages are the same, the example is appended
+    assert path.read_bytes().startswith(dumped)
+
+    loaded.extend([new_lang])
+    loaded.dump(append=True)
+    # there is new language, the file is rewritten
+    assert path.read_text('utf-8').startswith('de')
+    assert rnc.MultilingualParaCorpus(file=path).data == exs + [new_lang]
+
+
+def test_dump_append_after_changes(tmp_path):
+    exs = examples(8)
+    corp = dumped_corpus(tmp_path / 'corpus.csv')
+
+    del corp[0]
+    corp.extend(exs[6:])
+    corp.dump(append=True)
+    loaded = rnc.MainCorpus(file=corp.file)
+
+    assert loaded.data == exs[1:]
+
+
+def test_load_lazy(tmp_path):
+    exs = examples()
+    corp = dumped_corpus(tmp_path / 'corpus.csv')
+    loaded = rnc.MainCorpus(file=corp.file, lazy=True)
+
+    assert len(loaded) == len(exs)
+    assert loaded[-1] == exs[-1]
+    assert loaded[1:5:2].data == exs[1:5:2]
+    # the examples are read from the file on access
+    assert loaded[0] is not loaded[0]
+    assert list(loaded) == exs
+
+    del loaded[0]
+    assert loaded.data == exs[1:]
+
+
+@pytest.mark.parametrize('storage,kept', (
+    ({}, True), ({'memory_limit': 2}, False), ({'columnar': True}, False)
+))
+def test_change_slice_of_lazy(tmp_path, storage, kept):
+    exs = examples()
+    corp = dumped_corpus(tmp_path / 'corpus.csv')
+    loaded = rnc.MainCorpus(file=corp.file, lazy=True, **storage)
+    part = loaded[1:]
+    del part[0]
+
+    assert part.data == exs[2:]
+    assert loaded.data == exs
+    # the examples are loaded to the storage of the Corpus
+    assert (part[0] is part[0]) is kept
+
+
+def test_load_lazy_without_index(tmp_path):
+    corp = dumped_corpus(tmp_path / 'corpus.csv.gz')
+    loaded = rnc.MainCorpus(file=corp.file, lazy=True)
+
+    # compressed file is loaded
+    assert loaded[0] is loaded[0]
+    assert loaded.data == examples()
+
+
+@pytest.mark.parametrize('name', ('corpus.jsonl', 'corpus.jsonl.gz'))
+def test_load_jsonl(tmp_path, name):
+    corp = dumped_corpus(tmp_path / name)
+    loaded = rnc.MainCorpus(file=tmp_path / name)
+
+    assert (tmp_path / 'corpus.json').exists()
+    assert loaded.data == examples()
+    assert loaded.params == corp.params
+
+
+@pytest.mark.parametrize('name', ('corpus.csv', 'corpus.jsonl', 'corpus.db'))
+def test_load_additional_info(tmp_path, monkeypatch, name):
+    first_page = (
+        '<html><body><div class="content"><p class="res">'
+        '<span class="stat-number">1 024</span> docs '
+        '<span class="stat-number">12 345</span> contexts'
+        '<a target="_blank" href="graphic.png">graphic</a>'
+        '</p></div></body></html>'
+    )
+    monkeypatch.setattr(rnc.creq, 'get_htmls', lambda *a, **kw: [first_page])
+    corp = dumped_corpus(tmp_path / name)
+    corp.refresh_info()
+    corp.dump()
+
+    def get_htmls(*args, **kwargs):
+        raise AssertionError("RNC must not be requested")
+
+    monkeypatch.setattr(rnc.creq, 'get_htmls', get_htmls)
+    loaded = rnc.MainCorpus(file=corp.file)
+
+    assert loaded.amount_of_docs == 1024
+    assert loaded.amount_of_contexts == 12345
+    assert loaded.graphic_link == corp.graphic_link
+    assert loaded.graphic_link.endswith('/graphic.png')
+
+
+@pytest.mark.parametrize('name', ('corpus.csv', 'corpus.jsonl', 'corpus.db'))
+def test_load_with_memory_limit(tmp_path, name):
+    corp = dumped_corpus(tmp_path / name)
+    loaded = rnc.MainCorpus(file=corp.file, memory_limit=2)
+
+    # the first examples are spilled to disk, they are read on access
+    assert loaded[0] is not loaded[0]
+    assert loaded[-1] is loaded[-1]
+    assert loaded.data == examples()
+    assert loaded.found_wordforms == corp.found_wordforms
+
+
+@pytest.mark.parametrize('storage', (
+    {}, {'columnar': True}, {'memory_limit': 2}
+))
+def test_pickle(storage):
+    corp = rnc.MainCorpus('ты', 1, **storage)
+    corp.extend(examples())
+    loaded = pickle.loads(pickle.dumps(corp))
+
+    assert loaded.data == examples()
+    assert loaded.found_wordforms == corp.found_wordforms
+    # the storage is the same, so the examples are not kept
+    assert (loaded[0] is loaded[0]) is not bool(storage)
+
+
+@pytest.mark.parametrize('name', ('corpus.csv', 'corpus.db'))
+def test_pickle_mapped(tmp_path, name):
+    corp = dumped_corpus(tmp_path / name)
+    mapped = rnc.MainCorpus(file=corp.file, lazy=True)
+    loaded = pickle.loads(pickle.dumps(mapped))
+
+    assert loaded.data == examples()
+    # the mapped examples are not loaded while pickling
+    assert mapped[0] is not mapped[0]
+
+
+@pytest.mark.parametrize('storage', (
+    {}, {'columnar': True}, {'memory_limit': 2}
+))
+def test_dedupe(storage):
+    exs = examples()
+    corp = rnc.MainCorpus('ты', 1, **storage)
+    corp.extend(exs)
+    corp.extend(exs[:3])
+
+    assert exs[0] in corp
+    assert corp.dedupe() == 3
+    assert corp.data == exs
+    assert corp.dedupe() == 0
@@ -1,4 +1,5 @@
 import os
+import pickle
 from pathlib import Path
 
 import pytest
@@ -31,6 +32,12 @@ class TemplateTestExamples:
     def test_src_getter(self):
         assert isinstance(self.ex.src, str) and self.ex.src
 
+    def test_pickle(self):
+        copy = pickle.loads(pickle.dumps(self.ex))
+
+        assert copy == self.ex
+        assert copy.record == self.ex.record
+
     def test_src_setter(self):
         copy = self.ex.copy()
         new_src = 'test_source'
@@ -107,6 +114,42 @@ class TemplateTestExamples:
 
         assert copy.txt == expected_txt
 
+    def test_mark_words_deferred(self):
+        copy = self.ex.copy()
+        word = copy.found_wordforms[0]
+        copy.txt = f"{word} {word}"
+        copy.mark_found_words(lambda w: f"*{w}*", defer=True)
+
+        assert copy.txt == f"*{word}* *{word}*"
+
+    def test_fingerprint(self):
+        copy = self.ex.copy()
+        assert copy.fingerprint == self.ex.fingerprint
+        assert hash(copy) == hash(self.ex)
+
+        copy.src = f"{copy.src} changed"
+        assert copy.fingerprint != self.ex.fingerprint
+        assert copy != self.ex
+
+    def test_views_with_changed_wordforms(self):
+        copy = self.ex.copy()
+        items = copy.items
+        copy.found_wordforms.append('new')
+
+        assert copy.items != items
+        assert copy != self.ex
+
+    def test_fingerprint_after_pickling(self):
+        fingerprint = self.ex.fingerprint
+        copy = pickle.loads(pickle.dumps(self.ex))
+
+        assert copy.fingerprint == fingerprint
+        assert hash(copy) == hash(self.ex)
+
+    def test_slots(self):
+        with pytest.raises(AttributeError):
+            self.ex.new_attribute = 'sth'
+
     def test_deleter(self):
         with pytest.raises(AttributeError):
             del self.ex.txt
@@ -152,6 +195,14 @@ class TestKwicExample(TemplateTestExamples):
         with pytest.raises(NotImplementedError):
             self.ex.txt = 123
 
+    def test_text_of_changed_contexts(self):
+        copy = self.ex.copy()
+        txt = copy.txt
+        copy.center = 'new center'
+
+        assert copy.txt == f"{copy.left} new center {copy.right}"
+        assert copy.txt != txt and copy != self.ex
+
     def test_left_setter(self):
         copy = self.ex.copy()
         new_left = 'new left'
@@ -232,6 +283,14 @@ class TestKwicExample(TemplateTestExamples):
 
         assert copy.left == copy.center == copy.right == expected_txt
 
+    def test_mark_words_deferred(self):
+        copy = self.ex.copy()
+        word = copy.found_wordforms[0]
+        copy.left = f"{word} {word}"
+        copy.mark_found_words(lambda w: f"*{w}*", defer=True)
+
+        assert copy.left == f"*{word}* *{word}*"
+
     def test_contains_with_notstr_type(self):
         copy = self.ex.copy()
         copy.left = [1, 2, 3]
@@ -405,6 +464,64 @@ class TestParallelExample(TemplateTestExamples):
 
         assert copy.ru == new_txt
 
+    def test_setitem_new_lang(self):
+        copy = self.ex.copy()
+        copy['fr'] = 'texte'
+
+        assert copy.fr == 'texte'
+        assert copy.langs == self.ex.langs + ('fr',)
+        assert self.ex.fr is None
+
+    def test_join(self):
+        lhs = expl.ParallelExample({'ru': 'текст1'}, 'src', 'not amb', ['a'])
+        rhs = expl.ParallelExample({'en': 'text1', 'ru': 'и текст2'},
+                                   'src | new src', 'amb', ['b'])
+        joined = expl.ParallelExample.join([lhs, rhs])
+
+        lhs += rhs
+        assert joined == lhs
+        assert joined.langs == ('en', 'ru')
+        assert joined.ru == 'текст1 и текст2'
+
+    def test_join_deferred_marking(self):
+        lhs = expl.ParallelExample({'ru': 'мама мыла'}, 'src', '', ['мама'])
+        rhs = expl.ParallelExample({'en': 'mom washed'}, 'src', '', ['mom'])
+        lhs.mark_found_words(str.upper, defer=True)
+        rhs.mark_found_words(str.upper, defer=True)
+        joined = expl.ParallelExample.join([lhs, rhs])
+
+        assert joined._pending is not None
+        assert joined.txt == {'en': 'MOM washed', 'ru': 'МАМА мыла'}
+
+    def test_join_marks_texts_with_their_wordforms(self):
+        def parts(defer):
+            de = expl.ParallelExample({'de': 'die Katze'}, 'src', '', ['die'])
+            en = expl.ParallelExample(
+                {'en': 'the die is cast'}, 'src', '', ['cast'])
+            de.mark_found_words(str.upper, defer=defer)
+            en.mark_found_words(str.upper, defer=defer)
+            return de, en
+
+        # the texts were marked before joining while parsing
+        marked = expl.ParallelExample.join(parts(defer=False))
+        joined = expl.ParallelExample.join(parts(defer=True))
+
+        assert joined.txt == marked.txt
+        assert joined.txt == {'de': 'DIE Katze', 'en': 'the die is CAST'}
+
+    def test_from_columns(self):
+        ex = expl.ParallelExample.from_columns(
+            ('ru', 'en'), ['текст', 'text'], 'src', 'amb', ['w'], 'url')
+
+        assert ex.txt == {'ru': 'текст', 'en': 'text'}
+        assert ex.columns[:2] == ['ru', 'en']
+        assert ex.copy()._schema is ex._schema
+
+    def test_pickle_shares_schema(self):
+        copy = pickle.loads(pickle.dumps(self.ex))
+
+        assert copy._schema is self.ex._schema
+
     def test_sort(self):
         copy = self.ex.copy()
         copy.sort()
@@ -425,6 +542,14 @@ class TestParallelExample(TemplateTestExamples):
 
         assert copy.ru == expected_txt
 
+    def test_mark_words_deferred(self):
+        copy = self.ex.copy()
+        word = copy.found_wordforms[0]
+        copy['ru'] = f"{word} {word}"
+        copy.mark_found_words(lambda w: f"*{w}*", defer=True)
+
+        assert copy.ru == f"*{word}* *{word}*"
+
     def test_equality(self):
         assert self.ex['ru'] == self.ex.ru
 
@@ -0,0 +1,87 @@
+import pytest
+
+import rnc.corpora_index as cindex
+import rnc.examples as expl
+
+
+def example(txt: str, forms: list) -> expl.MainExample:
+    return expl.MainExample(txt, 'Author. Title', '', forms, 'url')
+
+
+def test_fingerprint_index():
+    first, second = example('first', ['f']), example('second', ['s'])
+    index = cindex.FingerprintIndex([first, first.copy()])
+
+    assert first in index and second not in index
+    assert index.count(first) == 2
+
+    index.remove(first)
+    assert first in index
+    index.remove(first)
+    assert first not in index and len(index) == 0
+
+    with pytest.raises(KeyError):
+        index.remove(second)
+
+
+def test_wordform_index():
+    first, second = example('first', ['Ты', 'ты']), example('second', ['тебя'])
+    index = cindex.WordformIndex(str.lower, [first, second])
+
+    assert index.counts == {'ты': 2, 'тебя': 1}
+    assert index.frequency('ТЫ') == 2
+    assert index.examples('ты') == [first]
+
+    index.remove(first)
+    assert index.counts == {'тебя': 1}
+    assert index.examples('ты') == []
+
+
+def test_wordform_index_with_changed_example():
+    first = example('first', ['ты'])
+    index = cindex.WordformIndex(str.lower, [first])
+    first.found_wordforms.append('тебя')
+    index.remove(first)
+
+    assert index.counts == {}
+
+
+@pytest.mark.parametrize('pattern,literals', (
+    (r'(?i)Мама\s+мыла', ['мама', 'мыла']),
+    (r'\bгот(ов)а?\b', ['готов']),
+    ('тебя|меня', []),
+    ('[', []),
+))
+def test_required_literals(pattern, literals):
+    assert cindex.required_literals(pattern) == literals
+
+
+def test_token_index():
+    index = cindex.TokenIndex(['Мама мыла раму', 'Ты готов?', {'ru': 'мама'}])
+
+    assert index.candidates(['мама мыла']) == [0, 2]
+    assert index.candidates(['гото']) == [1, 2]
+    assert index.candidates(['ты']) is None
+
+    index.delete(0, ['Мама мыла раму'])
+    index.replace(0, 'Ты готов?', 'Мама готова')
+    assert index.candidates(['мама']) == [0, 1]
+    assert index.candidates(['ты гот']) == [0, 1]
+
+
+def test_required_literals_without_parser(monkeypatch):
+    monkeypatch.setattr(cindex, 'sre_parse', None)
+
+    assert cindex.required_literals('мама') == []
+
+
+def test_token_index_grams():
+    index = cindex.TokenIndex(['готова', 'готов', 'приготовить'])
+
+    assert index.candidates(['гото']) == [0, 1, 2]
+    assert index.candidates(['товить']) == [2]
+    assert index.candidates(['товар']) == []
+
+    index.delete(slice(0, 2), ['готова', 'готов'])
+    assert index.candidates(['гото']) == [0]
+    assert index.candidates(['това']) == []
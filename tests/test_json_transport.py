@@ -0,0 +1,113 @@
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import ujson
+
+import rnc.corpora as rnc
+import rnc.examples as expl
+
+P_COUNT = 3
+DOCS_PER_PAGE = 2
+
+
+def page(p_index: int) -> dict:
+    docs = [
+        {
+            'source': f"Author {p_index}{num}. Title",
+            'url': f"search.xml?docid={p_index}{num}",
+            'media_url': f"media/{p_index}{num}.mp4",
+            'filename': f"{p_index}{num}.mp4",
+            'examples': [
+                {
+                    'text': 'ты готов идти',
+                    'texts': {'ru': 'ты готов', 'en': 'you are ready'},
+                    'left': 'ну', 'center': 'ты', 'right': 'готов',
+                    'ambiguation': 'disambiguated',
+                    'found_wordforms': ['ты']
+                }
+            ]
+        }
+        for num in range(DOCS_PER_PAGE)
+    ]
+    return {'stats': {'docs': 10, 'contexts': 20}, 'documents': docs}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = urllib.parse.urlparse(self.path).query
+        p_index = int(urllib.parse.parse_qs(query)['p'][0])
+        body = ujson.dumps(page(p_index)).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module', autouse=True)
+def stand_in_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}/search.json"
+    default_url, rnc.Corpus.JSON_URL = rnc.Corpus.JSON_URL, url
+    yield
+    rnc.Corpus.JSON_URL = default_url
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_wrong_transport():
+    with pytest.raises(ValueError):
+        rnc.MainCorpus('ты', 1, transport='xml')
+
+
+def test_main_corpus():
+    corp = rnc.MainCorpus('ты', P_COUNT, transport='json', marker=str.upper)
+    corp.request_examples()
+
+    assert len(corp) == P_COUNT * DOCS_PER_PAGE
+    assert all(isinstance(ex, expl.MainExample) for ex in corp)
+    assert corp[0].txt == 'ТЫ готов идти'
+    assert corp[0].src == 'Author 00. Title'
+    assert corp[0].doc_url == f"{rnc.BASE_RNC_URL}/search.xml?docid=00"
+    assert corp.found_wordforms == {'ты': P_COUNT * DOCS_PER_PAGE}
+    assert corp.amount_of_docs == 10 and corp.amount_of_contexts == 20
+
+
+def test_fields():
+    corp = rnc.MainCorpus('ты', 1, transport='json')
+    corp.request_examples(fields=['txt'])
+
+    assert corp[0].txt == 'ты готов идти'
+    assert not (corp[0].src or corp[0].found_wordforms or corp[0].doc_url)
+
+
+def test_kwic():
+    corp = rnc.MainCorpus('ты', 1, transport='json', out='kwic')
+    corp.request_examples()
+
+    assert corp[0].txt == 'ну ты готов'
+    assert corp[0].src == 'Author 00. Title'
+
+
+def test_parallel_corpus():
+    corp = rnc.ParallelCorpus('ты', 1, transport='json')
+    corp.request_examples()
+
+    assert corp[0].txt == {'en': 'you are ready', 'ru': 'ты готов'}
+
+
+def test_multimodal_corpus():
+    corp = rnc.MultimodalCorpus('ты', 1, transport='json')
+    corp.request_examples()
+
+    assert corp[0].filepath == rnc.MultimodalCorpus.MEDIA_FOLDER / '00.mp4'
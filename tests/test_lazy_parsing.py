@@ -0,0 +1,107 @@
+import functools
+import time
+
+import pytest
+
+import rnc.corpora as rnc
+
+
+WORDS = "мама мыла раму ты готов идти домой сегодня вечером".split()
+
+
+def example_li(num: int) -> str:
+    words = [WORDS[(num + shift) % len(WORDS)] for shift in range(8)]
+    found = words[num % len(words)]
+    body = ' '.join(
+        f'<span class="b-wrd-expl g-em">{word}</span>'
+        if word == found else word
+        for word in words
+    )
+    ambiguation = ('on', 'омонимия снята') if num % 2 else \
+        ('off', 'омонимия не снята')
+    return (f'<li>{body} <span class="doc">[<a class="b-kwic-expl" '
+            f'href="search.xml?docid={num % 7}">Автор {num % 7}. '
+            f'Книга ({1990 + num % 7})</a>]</span> <span '
+            f'class="{ambiguation[0]}">[{ambiguation[1]}]</span></li>')
+
+
+def normal_page(docs: int = 100, per_doc: int = 10) -> str:
+    docs = ''.join(
+        '<li><ul>' + ''.join(
+            example_li(doc * per_doc + num) for num in range(per_doc)
+        ) + '</ul></li>'
+        for doc in range(docs)
+    )
+    return f'<html><body><ol>{docs}</ol></body></html>'
+
+
+def corpus(lazy: bool, **kwargs) -> rnc.MainCorpus:
+    corp = rnc.MainCorpus('ты', 1, **kwargs)
+    # the mode is chosen by request_examples, set it without requesting
+    corp._lazy = lazy
+    return corp
+
+
+def parse(corp: rnc.MainCorpus, page: str) -> tuple:
+    start = time.perf_counter()
+    examples = corp._parse_page_normal(page)
+    return examples, time.perf_counter() - start
+
+
+def test_lazy_examples_equal_to_eager():
+    page = normal_page(docs=5, per_doc=4)
+    eager = corpus(False, marker=str.upper)
+    lazy = corpus(True, marker=str.upper)
+
+    eager_examples, _ = parse(eager, page)
+    lazy_examples, _ = parse(lazy, page)
+
+    assert len(lazy_examples) == len(eager_examples) == 20
+    assert [ex.record for ex in lazy_examples] == \
+           [ex.record for ex in eager_examples]
+    assert lazy_examples == eager_examples
+
+
+def test_lazy_doc_without_source_dropped():
+    page = normal_page(docs=3, per_doc=2)
+    # the first example of the second doc has no source
+    broken = example_li(2)
+    page = page.replace(broken, broken.replace('class="doc"', ''))
+    eager = corpus(False, marker=str.upper)
+    lazy = corpus(True, marker=str.upper)
+
+    eager_examples, _ = parse(eager, page)
+    lazy_examples, _ = parse(lazy, page)
+
+    assert len(eager_examples) == 4
+    assert lazy_examples == eager_examples
+
+
+def test_lazy_example_with_wrong_fragment():
+    corp = corpus(True)
+    unfold = functools.partial(
+        rnc.Corpus._unfold_fragment, fields=corp._fields,
+        intern=corp._interned.setdefault)
+    fragment = example_li(0).replace('class="doc"', '')
+    example = corp.ex_type.from_fragment(fragment, [], unfold)
+
+    # it fails on every access, not only on the first one
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            example.txt
+
+
+def test_lazy_fields_unfolded_on_access(monkeypatch):
+    unfolded = []
+    unfold = rnc.Corpus._unfold_fragment
+
+    def counted(*args, **kwargs):
+        unfolded.append(args)
+        return unfold(*args, **kwargs)
+
+    monkeypatch.setattr(rnc.Corpus, '_unfold_fragment', counted)
+    examples, _ = parse(corpus(True, marker=str.upper), normal_page())
+
+    assert len(examples) == 1000
+    assert examples[0].found_wordforms and not unfolded
+    assert examples[1].txt and len(unfolded) == 1
@@ -0,0 +1,266 @@
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+import ujson
+
+import rnc.corpora_storage as cstore
+import rnc.examples as expl
+from tests.helpers import examples
+
+
+def test_materialized_examples():
+    exs = examples()
+    table = cstore.ExampleTable(expl.MainExample, exs)
+
+    assert len(table) == len(exs)
+    assert table == exs
+    assert list(table) == exs
+
+
+def test_sources_encoded():
+    table = cstore.ExampleTable(expl.MainExample, examples())
+
+    # equal sources are stored once
+    assert table[0].src is table[2].src
+    assert table.column('src') == [ex.src for ex in examples()]
+    assert list(table) == examples()
+
+
+def test_example_is_not_shared():
+    table = cstore.ExampleTable(expl.MainExample, examples())
+    example = table[0]
+    example.found_wordforms.append('new')
+
+    assert table[0].found_wordforms == ['form0']
+
+
+def test_bulk_operations():
+    exs = examples()
+    table = cstore.ExampleTable(expl.MainExample, exs)
+    table.sort(key=lambda ex: ex.txt, reverse=True)
+
+    assert table == exs[::-1]
+    assert table[:2] == exs[::-1][:2]
+    assert table.take([0, 5]) == [exs[-1], exs[0]]
+    assert list(table.rows())[0] == tuple(exs[-1].record)
+    assert list(table.rows(4)) == [tuple(ex.record) for ex in exs[1::-1]]
+
+    table.sort()
+    assert table == exs
+
+
+def test_mutation():
+    exs = examples()
+    table = cstore.ExampleTable(expl.MainExample, exs)
+    del table[0]
+    table[0] = exs[0]
+    table.insert(0, exs[1])
+
+    assert table == [exs[1], exs[0]] + exs[2:]
+
+
+def test_wrong_type():
+    table = cstore.ExampleTable(expl.MainExample)
+    kwic = expl.KwicExample('left', 'center', 'right', 'src', [], 'url')
+
+    with pytest.raises(TypeError):
+        table.append(kwic)
+
+
+@pytest.mark.parametrize('item', (
+    slice(None), slice(1, 5, 2), slice(None, None, -1), slice(4, 0, -2)
+))
+def test_data_view(item):
+    exs = examples()
+    table = cstore.ExampleTable(expl.MainExample, exs)
+
+    for base in (exs, table):
+        view = cstore.DataView(base, item)
+        assert list(view) == exs[item]
+        assert view.copy() == exs[item]
+        assert list(view[1:]) == exs[item][1:]
+
+
+def test_spilled_list(tmp_path):
+    exs = examples(10)
+    spilled = cstore.SpilledList(expl.MainExample, 4, tmp_path, exs)
+
+    assert spilled.spilled > 0
+    # not more than 4 examples are kept, the first ones
+    # are read from the file on access
+    assert sum(kept is ex for kept, ex in zip(spilled, exs)) <= 4
+    assert spilled[0] is not spilled[0]
+    assert spilled[-1] is exs[-1]
+    assert spilled == exs
+    assert spilled[1:8:3] == exs[1:8:3]
+
+
+def test_spilled_list_mutation(tmp_path):
+    exs = examples(10)
+    spilled = cstore.SpilledList(expl.MainExample, 4, tmp_path, exs)
+    del spilled[0]
+    spilled[0] = exs[0]
+    spilled.insert(0, exs[1])
+    spilled.sort(key=lambda example: example.txt, reverse=True)
+
+    expected = [exs[1], exs[0]] + exs[2:]
+    expected.sort(key=lambda example: example.txt, reverse=True)
+    assert spilled == expected
+    assert spilled.take([9, 0, 5]) == [expected[9], expected[0], expected[5]]
+
+
+def test_spilled_list_wrong_limit(tmp_path):
+    with pytest.raises(ValueError):
+        cstore.SpilledList(expl.MainExample, 0, tmp_path)
+
+
+def test_sqlite_store(tmp_path):
+    exs = examples()
+    store = cstore.SqliteStore(tmp_path / 'corpus.db')
+    config = {'query': 'text', 'params': {'mode': 'main'}}
+
+    assert store.write(exs, config) == len(exs)
+    assert store.config() == config
+    assert [expl.MainExample(*record) for record in store.records()] == exs
+    assert store.count(src=exs[1].src) == 3
+    assert store.count(wordform='form2', doc_url=exs[2].doc_url) == 1
+
+
+def test_sqlite_store_wrong_filter(tmp_path):
+    store = cstore.SqliteStore(tmp_path / 'corpus.db')
+
+    with pytest.raises(ValueError):
+        store.count(txt='text')
+
+
+@pytest.mark.parametrize('compression', (None, 'gzip', 'xz', 'zstd'))
+def test_open_text(tmp_path, compression):
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+    path = tmp_path / 'file.csv'
+    with cstore.open_text(path, 'w', compression) as f:
+        f.write('текст\n')
+
+    with cstore.open_text(path, 'r', compression) as f:
+        assert f.read() == 'текст\n'
+
+
+def test_open_text_wrong_compression(tmp_path):
+    with pytest.raises(ValueError):
+        cstore.open_text(tmp_path / 'file.csv', 'w', 'bz2')
+
+
+def test_sqlite_store_append(tmp_path):
+    exs = examples()
+    store = cstore.SqliteStore(tmp_path / 'corpus.db')
+    store.write(exs[:4], {'p_count': 1})
+
+    assert store.append(exs[4:], {'p_count': 2}) == 2
+    assert store.config() == {'p_count': 2}
+    assert [expl.MainExample(*record) for record in store.records()] == exs
+    assert store.count(wordform='form5') == 1
+
+
+def test_mapped_csv(tmp_path):
+    exs = examples(10)
+    path = tmp_path / 'corpus.csv'
+    cstore.write_indexed_csv(path, (ex.items for ex in exs[:6]),
+                             exs[0].columns, delimiter='\t')
+    cstore.write_indexed_csv(path, (ex.items for ex in exs[6:]),
+                             delimiter='\t')
+    offsets = cstore.read_index(path)
+    mapped = cstore.MappedCsv(
+        path, offsets, lambda row: expl.MainExample(*row), delimiter='\t')
+
+    assert len(mapped) == len(exs)
+    assert mapped[7] == exs[7] and mapped[-1] == exs[-1]
+    assert mapped[2:9:3] == exs[2:9:3]
+    assert list(mapped) == exs
+
+
+def test_mapped_sqlite(tmp_path):
+    exs = examples(10)
+    store = cstore.SqliteStore(tmp_path / 'corpus.db')
+    store.write(exs, {})
+    mapped = cstore.MappedSqlite(store, expl.MainExample, src=exs[1].src)
+    odd = exs[1::2]
+
+    assert len(mapped) == len(odd)
+    assert mapped[1] == odd[1] and mapped[-1] == odd[-1]
+    assert mapped[::2] == odd[::2]
+    # the examples appended after mapping are skipped
+    store.append(examples(12)[10:], {})
+    assert list(mapped) == odd
+
+
+@pytest.mark.skipif(cstore.shared_memory is None,
+                    reason="shared memory is added in python 3.8")
+def test_shared_examples():
+    exs = examples(10)
+    memory = cstore.share_examples(exs, {'query': 'ты'})
+    try:
+        shared = cstore.SharedExamples(memory.name)
+        shared.ex_type = expl.MainExample
+
+        assert shared.config == {'query': 'ты'}
+        assert len(shared) == len(exs)
+        assert shared[7] == exs[7] and shared[-1] == exs[-1]
+        assert shared[2:9:3] == exs[2:9:3]
+        assert list(shared) == exs
+        shared.close()
+    finally:
+        cstore.unlink_shared(memory)
+
+
+def count_shared(name: str) -> int:
+    shared = cstore.SharedExamples(name)
+    count = len(shared)
+    shared.close()
+    return count
+
+
+@pytest.mark.skipif(cstore.shared_memory is None,
+                    reason="shared memory is added in python 3.8")
+def test_shared_examples_in_other_processes():
+    memory = cstore.share_examples(examples(10), {})
+    attach = (f"import rnc.corpora_storage as cstore; "
+              f"print(len(cstore.SharedExamples('{memory.name}')))")
+    try:
+        # the process has its own resource tracker
+        process = subprocess.run(
+            [sys.executable, '-c', attach], capture_output=True,
+            cwd=Path(__file__).parents[1], check=True, text=True)
+        assert process.stdout.strip() == '10'
+        assert 'leaked' not in process.stderr
+
+        # child processes share the resource tracker
+        with ProcessPoolExecutor(1) as executor:
+            assert executor.submit(count_shared, memory.name).result() == 10
+
+        assert count_shared(memory.name) == 10
+    finally:
+        cstore.unlink_shared(memory)
+
+    with pytest.raises(FileNotFoundError):
+        cstore.SharedExamples(memory.name)
+
+
+def test_stale_index(tmp_path):
+    path = tmp_path / 'corpus.csv'
+    cstore.write_indexed_csv(path, [['text']], ['column'])
+    with path.open('a') as f:
+        f.write('text\n')
+
+    assert cstore.read_index(path) is None
+
+
+def test_encode_record():
+    example = expl.MultimodalExample(
+        'text', 'src', 'amb', ['form'], 'url', 'media url', 'media/file.mp4')
+    record = ujson.loads(cstore.encode_record(example))
+
+    assert record[3] == ['form']
+    assert expl.MultimodalExample(*record) == example